@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Interactive script to add new resources to THE_RESOURCES_TABLE.csv"""
 
-import csv
 import os
 import sys
 from datetime import datetime
@@ -20,6 +19,12 @@ try:
 except ImportError:
     from .category_utils import category_manager
 
+# Import resource table store
+try:
+    from resource_store import open_resource_store  # type: ignore[import-not-found]
+except ImportError:
+    from .resource_store import open_resource_store
+
 
 def clear_screen():
     """Clear terminal screen"""
@@ -233,9 +238,9 @@ def append_to_csv(data):
     ]
 
     try:
-        with open(csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
+        store = open_resource_store(csv_path)
+        store.append(dict(zip(store.fieldnames, row, strict=True)))
+        store.commit()
         return True
     except Exception as e:
         print(f"Error writing to CSV: {e}")
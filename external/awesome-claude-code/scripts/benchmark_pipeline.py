@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the resource pipeline.
+
+Builds a synthetic THE_RESOURCES_TABLE.csv, starts mock_github_server.py with
+the requested latency, rate limit and failure rate, and runs the pipeline
+scripts against it in a scratch copy of the repository:
+
+    validate_links.py -> sort_resources.py -> generate_readme.py -> download_resources.py
+
+Each script runs as its own process with GITHUB_API_URL/GITHUB_RAW_URL pointing
+at the mock and AWESOME_CC_METRICS set, so the report combines what the script
+measured (phase timings, requests by endpoint, rate-limit units, peak memory;
+see run_metrics.py) with what the server saw. Nothing touches the network or
+the real resource table.
+
+The synthetic table mixes repository, blob and tree links on github.com with
+plain website links (some redirecting); --broken-rate of them point at missing
+repositories or pages. Gist links are left out because validate_links.py checks
+them on gist.github.com itself rather than through the API.
+
+Usage:
+    python scripts/benchmark_pipeline.py --rows 500 --latency 50 --concurrency 8
+    python scripts/benchmark_pipeline.py --output bench.json
+    python scripts/benchmark_pipeline.py --baseline bench.json   # exit 1 on regression
+
+A run regresses against the baseline when a script sends more requests (in
+total or to any endpoint), consumes more rate-limit units, or exceeds the
+baseline's time or peak memory by more than the tolerance. Client and server
+request counts that disagree are always reported as errors.
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+try:
+    from category_utils import category_manager  # type: ignore[import-not-found]
+    from mock_github_server import MockGitHubServer  # type: ignore[import-not-found]
+    from resource_id import generate_resource_id  # type: ignore[import-not-found]
+    from run_metrics import METRICS_ENV  # type: ignore[import-not-found]
+except ImportError:
+    # Fallback for when running as a module
+    from .category_utils import category_manager
+    from .mock_github_server import MockGitHubServer
+    from .resource_id import generate_resource_id
+    from .run_metrics import METRICS_ENV
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_WORKDIR = ".myob/benchmark"
+CSV_FIELDS = [
+    "ID",
+    "Display Name",
+    "Category",
+    "Sub-Category",
+    "Primary Link",
+    "Secondary Link",
+    "Author Name",
+    "Author Link",
+    "Active",
+    "Date Added",
+    "Last Modified",
+    "Last Checked",
+    "License",
+    "Description",
+    "Removed From Origin",
+]
+LINK_KINDS = ["repo", "blob", "tree", "site", "moved"]
+LICENSES = ["MIT", "Apache-2.0", "GPL-3.0", "NOT_FOUND"]
+SCRIPTS = ["validate", "sort", "generate", "download"]
+
+
+def make_link(kind: str, index: int, owner: str, site_url: str, broken: bool) -> str:
+    """Build one synthetic resource link of the given kind."""
+    repo = f"missing-repo-{index}" if broken else f"repo-{index}"
+    if kind == "repo":
+        return f"https://github.com/{owner}/{repo}"
+    if kind == "blob":
+        return f"https://github.com/{owner}/{repo}/blob/main/README.md"
+    if kind == "tree":
+        return f"https://github.com/{owner}/{repo}/tree/main/.claude/commands"
+    page = f"missing-page-{index}" if broken else f"page-{index}"
+    if kind == "moved":
+        return f"{site_url}/moved/{page}"
+    return f"{site_url}/{page}"
+
+
+def make_resource_table(
+    rows: int, site_url: str, seed: int = 0, broken_rate: float = 0.05
+) -> list[dict[str, str]]:
+    """
+    Generate `rows` resources spread over the real categories, with links into
+    the mock server. The same arguments always produce the same table.
+    """
+    rng = random.Random(seed)
+    placements = [
+        (sub["parent"], sub["name"]) for sub in category_manager.get_all_subcategories() or []
+    ]
+    added = datetime(2025, 1, 1)
+    table = []
+    for index in range(rows):
+        category, sub_category = placements[index % len(placements)]
+        owner = f"author-{rng.randrange(max(rows // 4, 1))}"
+        kind = rng.choice(LINK_KINDS)
+        link = make_link(kind, index, owner, site_url, rng.random() < broken_rate)
+        name = f"Resource {index:05d}"
+        table.append(
+            {
+                "ID": generate_resource_id(name, link, category),
+                "Display Name": name,
+                "Category": category,
+                "Sub-Category": "" if sub_category == "General" else sub_category,
+                "Primary Link": link,
+                "Secondary Link": "",
+                "Author Name": owner,
+                "Author Link": f"https://github.com/{owner}",
+                "Active": "TRUE",
+                "Date Added": (added - timedelta(days=index % 365)).strftime("%Y-%m-%d"),
+                "Last Modified": "",
+                "Last Checked": "",
+                "License": rng.choice(LICENSES),
+                "Description": f"Synthetic {kind} resource number {index}.",
+                "Removed From Origin": "FALSE",
+            }
+        )
+    return table
+
+
+def prepare_workspace(workdir: Path, table: list[dict[str, str]]) -> Path:
+    """Copy scripts/ and templates/ into workdir/repo and write the table there."""
+    repo = workdir / "repo"
+    if repo.exists():
+        shutil.rmtree(repo)
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+    for name in ("scripts", "templates"):
+        shutil.copytree(REPO_ROOT / name, repo / name, ignore=ignore)
+    with open(repo / "THE_RESOURCES_TABLE.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(table)
+    return repo
+
+
+def script_commands(concurrency: int, backend: str) -> dict[str, list[str]]:
+    return {
+        "validate": [
+            "scripts/validate_links.py",
+            "--ignore-overrides",
+            "--concurrency",
+            str(concurrency),
+            "--backend",
+            backend,
+        ],
+        "sort": ["scripts/sort_resources.py"],
+        "generate": ["scripts/generate_readme.py"],
+        "download": ["scripts/download_resources.py", "--concurrency", str(concurrency)],
+    }
+
+
+def run_script(
+    name: str,
+    command: list[str],
+    repo: Path,
+    workdir: Path,
+    server: MockGitHubServer,
+    trace_memory: bool = False,
+) -> dict[str, Any]:
+    """Run one pipeline script against the mock server and collect both sides' numbers."""
+    metrics_path = workdir / "metrics" / f"{name}.json"
+    log_path = workdir / "logs" / f"{name}.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    if metrics_path.exists():
+        metrics_path.unlink()
+
+    env = {
+        **os.environ,
+        METRICS_ENV: str(metrics_path),
+        "GITHUB_API_URL": server.api_url,
+        "GITHUB_RAW_URL": server.raw_url,
+        "GITHUB_TOKEN": "benchmark-token",
+        "PYTHONUNBUFFERED": "1",
+    }
+    if trace_memory:
+        env["PYTHONTRACEMALLOC"] = "1"
+
+    server.reset_stats()
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        process = subprocess.run(
+            [sys.executable, *command], cwd=repo, env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+    elapsed = time.perf_counter() - start
+
+    client = None
+    if metrics_path.exists():
+        with open(metrics_path, encoding="utf-8") as f:
+            client = json.load(f)
+    return {
+        "exit_code": process.returncode,
+        "process_seconds": round(elapsed, 6),
+        "client": client,
+        "server": json.loads(json.dumps(server.stats)),
+        "log": str(log_path),
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    workdir = Path(args.workdir).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+    scripts = [name.strip() for name in args.scripts.split(",") if name.strip()]
+
+    server = MockGitHubServer(
+        latency=args.latency / 1000,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    with server:
+        table = make_resource_table(args.rows, server.site_url, args.seed, args.broken_rate)
+        repo = prepare_workspace(workdir, table)
+        commands = script_commands(args.concurrency, args.backend)
+        runs = {}
+        for name in scripts:
+            print(f"Running {name}...")
+            runs[name] = run_script(
+                name, commands[name], repo, workdir, server, trace_memory=args.trace_memory
+            )
+
+    return {
+        "config": {
+            "rows": args.rows,
+            "seed": args.seed,
+            "latency_ms": args.latency,
+            "rate_limit": args.rate_limit,
+            "failure_rate": args.failure_rate,
+            "broken_rate": args.broken_rate,
+            "concurrency": args.concurrency,
+            "backend": args.backend,
+        },
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "runs": runs,
+    }
+
+
+def _requests(run: dict[str, Any]) -> int:
+    return (run.get("client") or {}).get("http", {}).get("requests", 0)
+
+
+def _endpoint_requests(run: dict[str, Any]) -> dict[str, int]:
+    by_endpoint = (run.get("client") or {}).get("http", {}).get("by_endpoint", {})
+    return {name: entry["requests"] for name, entry in by_endpoint.items()}
+
+
+def _rate_limit_units(run: dict[str, Any]) -> int:
+    return sum((run.get("client") or {}).get("rate_limit_units", {}).values())
+
+
+def _peak_memory(run: dict[str, Any]) -> int | None:
+    """tracemalloc peak if the run was traced, else peak RSS."""
+    memory = (run.get("client") or {}).get("memory", {})
+    return memory.get("peak_traced_bytes") or memory.get("peak_rss_bytes")
+
+
+def check_consistency(report: dict[str, Any]) -> list[str]:
+    """Report scripts whose own request counts disagree with the mock server's."""
+    errors = []
+    for name, run in report["runs"].items():
+        if run["client"] is None:
+            errors.append(f"{name}: no metrics written (exit code {run['exit_code']})")
+            continue
+        server = run["server"]
+        if _requests(run) != server["requests"]:
+            errors.append(
+                f"{name}: client counted {_requests(run)} requests, server saw {server['requests']}"
+            )
+        client_endpoints = _endpoint_requests(run)
+        for endpoint in sorted(set(client_endpoints) | set(server["by_endpoint"])):
+            client_count = client_endpoints.get(endpoint, 0)
+            server_count = server["by_endpoint"].get(endpoint, 0)
+            if client_count != server_count:
+                errors.append(f"{name}: {endpoint} client {client_count} != server {server_count}")
+        server_units = server["rate_limit_units"]
+        client_units = run["client"]["rate_limit_units"]
+        for resource_name in sorted(set(client_units) | set(server_units)):
+            if client_units.get(resource_name, 0) != server_units.get(resource_name, 0):
+                errors.append(
+                    f"{name}: {resource_name} units client {client_units.get(resource_name, 0)}"
+                    f" != server {server_units.get(resource_name, 0)}"
+                )
+    return errors
+
+
+def compare_reports(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    time_tolerance: float = 0.25,
+    memory_tolerance: float = 0.25,
+) -> list[str]:
+    """Return a description of every regression of report against baseline."""
+    regressions = []
+    for name, base_run in baseline["runs"].items():
+        run = report["runs"].get(name)
+        if run is None:
+            continue
+
+        if _requests(run) > _requests(base_run):
+            regressions.append(
+                f"{name}: {_requests(run)} requests (baseline {_requests(base_run)})"
+            )
+        base_endpoints = _endpoint_requests(base_run)
+        for endpoint, count in sorted(_endpoint_requests(run).items()):
+            if count > base_endpoints.get(endpoint, 0):
+                regressions.append(
+                    f"{name}: {endpoint} {count} requests "
+                    f"(baseline {base_endpoints.get(endpoint, 0)})"
+                )
+        if _rate_limit_units(run) > _rate_limit_units(base_run):
+            regressions.append(
+                f"{name}: {_rate_limit_units(run)} rate-limit units "
+                f"(baseline {_rate_limit_units(base_run)})"
+            )
+
+        base_seconds = base_run["process_seconds"]
+        if run["process_seconds"] > base_seconds * (1 + time_tolerance):
+            regressions.append(
+                f"{name}: {run['process_seconds']:.2f}s (baseline {base_seconds:.2f}s)"
+            )
+        memory, base_memory = _peak_memory(run), _peak_memory(base_run)
+        if memory and base_memory and memory > base_memory * (1 + memory_tolerance):
+            regressions.append(
+                f"{name}: peak memory {memory / 2**20:.1f} MiB "
+                f"(baseline {base_memory / 2**20:.1f} MiB)"
+            )
+    return regressions
+
+
+def print_summary(report: dict[str, Any]) -> None:
+    print(
+        f"\n{'Script':<10} {'Exit':>4} {'Seconds':>9} {'Requests':>9} "
+        f"{'API':>6} {'Units':>6} {'Peak MiB':>9}"
+    )
+    for name, run in report["runs"].items():
+        client = run["client"] or {}
+        memory = _peak_memory(run)
+        print(
+            f"{name:<10} {run['exit_code']:>4} {run['process_seconds']:>9.2f} "
+            f"{_requests(run):>9} {client.get('http', {}).get('github_api_requests', 0):>6} "
+            f"{_rate_limit_units(run):>6} "
+            f"{(memory / 2**20 if memory else 0):>9.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline against a mock GitHub")
+    parser.add_argument("--rows", type=int, default=200, help="Synthetic resources (default: 200)")
+    parser.add_argument("--seed", type=int, default=0, help="Table and failure seed (default: 0)")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Mock latency per request in ms (default: 0)"
+    )
+    parser.add_argument(
+        "--rate-limit", type=int, default=5000, help="Mock rate limit per window (default: 5000)"
+    )
+    parser.add_argument(
+        "--rate-limit-window",
+        type=float,
+        default=3600,
+        help="Mock rate-limit window in seconds (default: 3600)",
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="Fraction of 5xx responses (default: 0)"
+    )
+    parser.add_argument(
+        "--broken-rate", type=float, default=0.05, help="Fraction of broken links (default: 0.05)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="--concurrency for the scripts (default: 1)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["rest", "graphql"],
+        default="rest",
+        help="validate_links.py backend (default: rest)",
+    )
+    parser.add_argument(
+        "--scripts",
+        default=",".join(SCRIPTS),
+        help=f"Comma-separated scripts to run (default: {','.join(SCRIPTS)})",
+    )
+    parser.add_argument(
+        "--workdir", default=DEFAULT_WORKDIR, help=f"Scratch directory (default: {DEFAULT_WORKDIR})"
+    )
+    parser.add_argument("--output", help="Report path (default: <workdir>/report.json)")
+    parser.add_argument("--baseline", help="Earlier report to check for regressions")
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against the baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed peak memory growth against the baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Run scripts with PYTHONTRACEMALLOC=1 to report Python heap peaks",
+    )
+    args = parser.parse_args()
+
+    unknown = sorted(set(args.scripts.split(",")) - set(SCRIPTS))
+    if unknown:
+        parser.error(f"unknown scripts: {', '.join(unknown)}")
+
+    report = run_benchmark(args)
+    output = Path(args.output or Path(args.workdir) / "report.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print_summary(report)
+    print(f"\nReport written to {output}")
+
+    problems = check_consistency(report)
+    for problem in problems:
+        print(f"❌ {problem}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("config") != report["config"]:
+            print("⚠️  Baseline was recorded with a different configuration")
+        regressions = compare_reports(report, baseline, args.time_tolerance, args.memory_tolerance)
+        for regression in regressions:
+            print(f"❌ Regression: {regression}")
+        if not regressions:
+            print("✅ No regressions against baseline")
+        problems += regressions
+
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,18 @@ This script downloads all active resources (or filtered subset) from GitHub
 repositories listed in the resource-metadata.csv file. It respects rate
 limiting and organizes downloads by category.
 
+Files and directories are resolved with one recursive git-trees call and their
+blobs are fetched in parallel, streamed to disk and recorded in a manifest
+(.download-manifest.json in the archive directory). Unchanged files are skipped
+on later runs, and an interrupted run resumes where it stopped.
+
 Resources are saved to two locations:
 - Archive directory: All resources regardless of license (.myob/downloads/)
 - Hosted directory: Only open-source licensed resources (resources/)
 
+Set AWESOME_CC_METRICS to write phase timings, HTTP request counts by endpoint,
+rate-limit units and peak memory as JSON (see run_metrics.py).
+
 Note: Authentication is optional but recommended to avoid rate limiting:
     - Unauthenticated: 60 requests/hour
     - Authenticated: 5,000 requests/hour
@@ -23,6 +31,9 @@ Options:
     --max-downloads N       Limit number of downloads (for testing)
     --output-dir DIR        Custom archive directory (default: .myob/downloads)
     --hosted-dir DIR        Custom hosted directory (default: resources)
+    --concurrency N         Parallel file downloads per resource (default: 8)
+    --no-cache              Disable the GitHub API response cache
+    --cache-dir DIR         GitHub API response cache directory (default: .myob/http-cache)
 """
 
 import argparse
@@ -30,6 +41,7 @@ import csv
 import os
 import random
 import re
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
@@ -39,6 +51,28 @@ import requests
 import yaml  # type: ignore[import-untyped]
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from github_cache import DEFAULT_CACHE_DIR, GitHubResponseCache  # type: ignore[import-not-found]
+    from github_endpoints import GITHUB_API_URL  # type: ignore[import-not-found]
+    from github_tree_downloader import (  # type: ignore[import-not-found]
+        DEFAULT_CONCURRENCY,
+        DownloadManifest,
+        GitHubTreeDownloader,
+    )
+    from run_metrics import METRICS, instrument_session  # type: ignore[import-not-found]
+except ImportError:
+    # Fallback for when running as a module
+    from .github_cache import DEFAULT_CACHE_DIR, GitHubResponseCache
+    from .github_endpoints import GITHUB_API_URL
+    from .github_tree_downloader import (
+        DEFAULT_CONCURRENCY,
+        DownloadManifest,
+        GitHubTreeDownloader,
+    )
+    from .run_metrics import METRICS, instrument_session
+
 # Load environment variables from .myob/.env
 load_dotenv()
 
@@ -89,6 +123,23 @@ OPEN_SOURCE_LICENSES = {
 # Keeping the mapping dict empty for now in case we need it later
 _CATEGORY_MAPPING: dict[str, str] = {}
 
+# Conditional-request cache for GitHub API GETs; enabled by main() unless --no-cache
+RESPONSE_CACHE: GitHubResponseCache | None = None
+
+# Shared keep-alive session; every response is counted by run_metrics
+SESSION = instrument_session(requests.Session())
+
+
+def github_api_get(api_url: str, headers: dict[str, str], timeout: int = 30) -> requests.Response:
+    """GET a GitHub API URL, revalidating through the response cache when enabled."""
+    if RESPONSE_CACHE is None:
+        return SESSION.get(api_url, headers=headers, timeout=timeout)
+    return RESPONSE_CACHE.get(
+        api_url,
+        lambda request_headers: SESSION.get(api_url, headers=request_headers, timeout=timeout),
+        headers=headers,
+    )
+
 
 def sanitize_filename(name: str) -> str:
     """Sanitize a string to be safe for use as a filename."""
@@ -155,10 +206,10 @@ def download_github_file(
         if url_info["type"] == "file":
             # Download single file
             api_url = (
-                f"https://api.github.com/repos/{url_info['owner']}/"
+                f"{GITHUB_API_URL}/repos/{url_info['owner']}/"
                 f"{url_info['repo']}/contents/{url_info['path']}?ref={url_info['branch']}"
             )
-            response = requests.get(api_url, headers=HEADERS, timeout=30)
+            response = github_api_get(api_url, HEADERS)
 
             # Log response details
             if response.status_code != 200:
@@ -183,13 +234,13 @@ def download_github_file(
         elif url_info["type"] == "dir":
             # List directory contents
             api_url = (
-                f"https://api.github.com/repos/{url_info['owner']}/{url_info['repo']}/contents/"
+                f"{GITHUB_API_URL}/repos/{url_info['owner']}/{url_info['repo']}/contents/"
                 f"{url_info['path']}?ref={url_info['branch']}"
             )
             # Update headers to use proper Accept header for directory listing
             dir_headers = HEADERS.copy()
             dir_headers["Accept"] = "application/vnd.github+json"
-            response = requests.get(api_url, headers=dir_headers, timeout=30)
+            response = github_api_get(api_url, dir_headers)
 
             # Log response details
             if response.status_code != 200:
@@ -210,7 +261,7 @@ def download_github_file(
                     if item["type"] == "file":
                         file_path = os.path.join(output_path, item["name"])
                         # Download the file content
-                        file_response = requests.get(
+                        file_response = SESSION.get(
                             item["download_url"], headers=HEADERS, timeout=30
                         )
                         if file_response.status_code != 200:
@@ -225,11 +276,11 @@ def download_github_file(
 
         elif url_info["type"] == "gist":
             # Download gist
-            api_url = f"https://api.github.com/gists/{url_info['gist_id']}"
+            api_url = f"{GITHUB_API_URL}/gists/{url_info['gist_id']}"
             # Update headers to use proper Accept header for gist API
             gist_headers = HEADERS.copy()
             gist_headers["Accept"] = "application/vnd.github+json"
-            response = requests.get(api_url, headers=gist_headers, timeout=30)
+            response = github_api_get(api_url, gist_headers)
 
             # Log response details
             if response.status_code != 200:
@@ -326,6 +377,7 @@ def process_resources(
     max_downloads: int | None = None,
     output_dir: str = DEFAULT_OUTPUT_DIR,
     hosted_dir: str = HOSTED_OUTPUT_DIR,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> None:
     """
     Process and download resources from the CSV file.
@@ -337,7 +389,8 @@ def process_resources(
 
     # Check rate limit status
     try:
-        rate_check = requests.get("https://api.github.com/rate_limit", headers=HEADERS, timeout=10)
+        with METRICS.phase("rate_limit_check"):
+            rate_check = SESSION.get(f"{GITHUB_API_URL}/rate_limit", headers=HEADERS, timeout=10)
         if rate_check.status_code == 200:
             rate_data = rate_check.json()
             core_limit = rate_data.get("rate", {})
@@ -357,6 +410,10 @@ def process_resources(
     if overrides:
         print(f"\nLoaded {len(overrides)} resource overrides")
 
+    # Tree-based downloader; the manifest lives in the archive directory
+    manifest = DownloadManifest(output_dir)
+    downloader = GitHubTreeDownloader(github_api_get, HEADERS, manifest, concurrency)
+
     # Track statistics
     total_resources = 0
     downloaded = 0
@@ -451,7 +508,16 @@ def process_resources(
             if hosted_path:
                 print(f"  Will copy to hosted: {hosted_path}")
 
-            download_success = download_github_file(url_info, resource_path)
+            with METRICS.phase("download"):
+                if url_info["type"] == "gist":
+                    download_success = download_github_file(url_info, resource_path)
+                else:
+                    tree_result = downloader.download(url_info, resource_path)
+                    if tree_result is None:
+                        print("  Tree unavailable, falling back to contents API")
+                        download_success = download_github_file(url_info, resource_path)
+                    else:
+                        download_success = tree_result
 
             if download_success:
                 print("  ✅ Downloaded successfully")
@@ -465,15 +531,16 @@ def process_resources(
 
                         os.makedirs(os.path.dirname(hosted_path), exist_ok=True)
 
-                        if os.path.isdir(resource_path):
-                            print(
-                                f"     Source is directory with "
-                                f"{len(os.listdir(resource_path))} items"
-                            )
-                            shutil.copytree(resource_path, hosted_path, dirs_exist_ok=True)
-                        else:
-                            print("     Source is file")
-                            shutil.copy2(resource_path, hosted_path)
+                        with METRICS.phase("copy_hosted"):
+                            if os.path.isdir(resource_path):
+                                print(
+                                    f"     Source is directory with "
+                                    f"{len(os.listdir(resource_path))} items"
+                                )
+                                shutil.copytree(resource_path, hosted_path, dirs_exist_ok=True)
+                            else:
+                                print("     Source is file")
+                                shutil.copy2(resource_path, hosted_path)
                         print("  ✅ Copied to hosted directory")
                     except Exception as e:
                         print(f"  ⚠️  Failed to copy to hosted directory: {e}")
@@ -485,9 +552,6 @@ def process_resources(
                 print("  ❌ Download failed")
                 failed += 1
 
-            # Rate limiting delay
-            time.sleep(random.uniform(1, 2))
-
     # Summary
     end_time = datetime.now()
     duration = end_time - start_time
@@ -500,8 +564,17 @@ def process_resources(
     print(f"  Downloaded: {downloaded}")
     print(f"  Skipped: {skipped}")
     print(f"  Failed: {failed}")
+    print(f"  {manifest.report()}")
+    if RESPONSE_CACHE is not None:
+        print(f"  {RESPONSE_CACHE.report()}")
     print(f"{'=' * 60}")
 
+    METRICS.count("resources_downloaded", downloaded)
+    METRICS.count("resources_skipped", skipped)
+    METRICS.count("resources_failed", failed)
+    for name, value in manifest.stats.items():
+        METRICS.count(name, value)
+
 
 def main() -> None:
     """Main entry point."""
@@ -516,8 +589,25 @@ def main() -> None:
         help="Hosted output directory for open-source resources",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Parallel file downloads per resource (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the GitHub API response cache"
+    )
+    parser.add_argument(
+        "--cache-dir", default=DEFAULT_CACHE_DIR, help="GitHub API response cache directory"
+    )
+
     args = parser.parse_args()
 
+    global RESPONSE_CACHE
+    if not args.no_cache:
+        RESPONSE_CACHE = GitHubResponseCache(args.cache_dir)
+
     # Create output directories if needed
     Path(args.output_dir).mkdir(parents=True, exist_ok=True)
     Path(args.hosted_dir).mkdir(parents=True, exist_ok=True)
@@ -529,8 +619,12 @@ def main() -> None:
         max_downloads=args.max_downloads,
         output_dir=args.output_dir,
         hosted_dir=args.hosted_dir,
+        concurrency=args.concurrency,
     )
 
+    if RESPONSE_CACHE is not None:
+        RESPONSE_CACHE.prune()
+
 
 if __name__ == "__main__":
     main()
@@ -4,13 +4,18 @@ Template-based README generator for the Awesome Claude Code repository.
 Reads resource metadata from CSV and generates README using templates.
 """
 
+import argparse
 import csv
+import hashlib
+import inspect
+import json
 import os
 import shutil
 import sys
 from datetime import datetime, timedelta
 
 import yaml  # type: ignore[import-untyped]
+from run_metrics import METRICS  # type: ignore[import-not-found]
 from validate_links import parse_github_url  # type: ignore[import-not-found]
 
 
@@ -156,15 +161,19 @@ def get_anchor_suffix_for_icon(icon):
     return "-"
 
 
-def generate_toc_from_categories(csv_data=None):
+def generate_toc_from_categories(csv_data=None, index=None):
     """Generate table of contents based on category definitions.
 
     Args:
         csv_data: List of resource dictionaries from CSV.
                  If None, TOC will include all subcategories.
+        index: Optional resource index from build_resource_index(csv_data).
     """
     from category_utils import category_manager  # type: ignore[import-not-found]
 
+    if index is None and csv_data is not None:
+        index = build_resource_index(csv_data)
+
     categories = category_manager.get_categories_for_readme()
 
     toc_lines = []
@@ -212,14 +221,8 @@ def generate_toc_from_categories(csv_data=None):
                 # This keeps the ToC clean and avoids empty sections.
                 # New categories will appear empty in ToC until resources are added.
                 include_subcategory = True
-                if csv_data is not None:
-                    category_name = category.get("name", "")
-                    resources = [
-                        r
-                        for r in csv_data
-                        if r["Category"] == category_name
-                        and r.get("Sub-Category", "").strip() == sub_title
-                    ]
+                if index is not None:
+                    resources = get_indexed_resources(index, category.get("name", ""), sub_title)
                     include_subcategory = bool(resources)
 
                 # Only include subcategory if it has resources (or if csv_data not provided)
@@ -257,6 +260,45 @@ def generate_toc_from_categories(csv_data=None):
     return "\n".join(toc_lines).strip()
 
 
+def build_resource_index(csv_data):
+    """Group resources in a single pass for rendering.
+
+    Returns a dict with:
+        categories: {category name: {sub-category (or ""): [rows in CSV order]}}
+        by_date: [(date added, row)] for rows with a parseable Date Added, newest first
+    """
+    categories = {}
+    by_date = []
+    for row in csv_data:
+        subcategory = row.get("Sub-Category", "").strip()
+        categories.setdefault(row["Category"], {}).setdefault(subcategory, []).append(row)
+        date_added = parse_resource_date(row.get("Date Added", ""))
+        if date_added:
+            by_date.append((date_added, row))
+
+    # Stable sort, so rows added at the same time keep their CSV order
+    by_date.sort(key=lambda item: item[0], reverse=True)
+    return {"categories": categories, "by_date": by_date}
+
+
+def get_indexed_resources(index, category_name, subcategory=""):
+    """Return the rows filed under a category and sub-category ("" for main resources)."""
+    return index["categories"].get(category_name, {}).get(subcategory, [])
+
+
+# Row fields format_resource_entry renders; other columns (Last Checked, ...) never
+# reach a category section, so they are left out of the incremental section digest
+RENDERED_FIELDS = (
+    "Display Name",
+    "Primary Link",
+    "Author Name",
+    "Author Link",
+    "Description",
+    "License",
+    "Removed From Origin",
+)
+
+
 def format_resource_entry(row):
     """Format a single resource entry."""
     display_name = row["Display Name"]
@@ -338,32 +380,28 @@ def parse_resource_date(date_string):
     return None
 
 
-def generate_weekly_section(csv_data):
+def generate_weekly_section(csv_data, index=None):
     """Generate the weekly resources section that appears above Contents."""
+    if index is None:
+        index = build_resource_index(csv_data)
+
     lines = []
 
     lines.append("## This Week's Additions ✨ [🔝](#awesome-claude-code)")
     lines.append("")
     lines.append("> Resources added in the past 7 days")
 
-    # Get resources added in the past week
+    # Get resources added in the past week (the index is already sorted newest first)
     one_week_ago = datetime.now() - timedelta(days=7)
     weekly_resources = []
 
-    for resource in csv_data:
-        date_added = resource.get("Date Added", "")
-        resource_date = parse_resource_date(date_added)
-
-        if resource_date and resource_date >= one_week_ago:
-            weekly_resources.append(resource)
+    for resource_date, resource in index["by_date"]:
+        if resource_date < one_week_ago:
+            break
+        weekly_resources.append(resource)
 
     if weekly_resources:
         lines.append("")
-        # Sort by date added (newest first) using parsed dates
-        weekly_resources.sort(
-            key=lambda x: parse_resource_date(x.get("Date Added", "")) or datetime.min, reverse=True
-        )
-
         for resource in weekly_resources:
             lines.append(format_resource_entry(resource))
             lines.append("")
@@ -375,8 +413,11 @@ def generate_weekly_section(csv_data):
     return "\n".join(lines).rstrip() + "\n"
 
 
-def generate_section_content(category, csv_data):
+def generate_section_content(category, csv_data, index=None):
     """Generate content for a category based on CSV data."""
+    if index is None:
+        index = build_resource_index(csv_data)
+
     lines = []
 
     # Get category details
@@ -408,11 +449,7 @@ def generate_section_content(category, csv_data):
             lines.append(description)
 
         # Render all resources for this category
-        resources = [
-            r
-            for r in csv_data
-            if r["Category"] == category_name and not r.get("Sub-Category", "").strip()
-        ]
+        resources = get_indexed_resources(index, category_name)
         if resources:
             lines.append("")
             for resource in resources:
@@ -434,11 +471,7 @@ def generate_section_content(category, csv_data):
             lines.append(description)
 
         # First render main category resources without subcategory
-        main_resources = [
-            r
-            for r in csv_data
-            if r["Category"] == category_name and not r.get("Sub-Category", "").strip()
-        ]
+        main_resources = get_indexed_resources(index, category_name)
         if main_resources:
             lines.append("")
             for resource in main_resources:
@@ -449,11 +482,7 @@ def generate_section_content(category, csv_data):
         for subcat in subcategories:
             sub_title = subcat["name"]
 
-            resources = [
-                r
-                for r in csv_data
-                if r["Category"] == category_name and r.get("Sub-Category", "").strip() == sub_title
-            ]
+            resources = get_indexed_resources(index, category_name, sub_title)
 
             if resources:
                 lines.append("")
@@ -537,41 +566,161 @@ def create_backup(file_path):
     return backup_path
 
 
-def generate_readme_from_templates(csv_path, template_dir, output_path):
-    """Generate README using template system."""
+def get_default_section_cache_path():
+    """Return the default location of the incremental section cache."""
+    # Stored next to the README backups (two levels up from scripts)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(os.path.dirname(script_dir))
+    return os.path.join(repo_root, ".myob", "readme-sections.json")
+
+
+def get_renderer_digest():
+    """Digest of the rendering code, so cached sections are dropped when it changes."""
+    sha = hashlib.sha256()
+    with open(os.path.abspath(__file__), "rb") as f:
+        sha.update(f.read())
+    sha.update(inspect.getsource(parse_github_url).encode("utf-8"))
+    return sha.hexdigest()
+
+
+def get_section_digest(category, index):
+    """Digest of everything a category section is rendered from.
+
+    Only RENDERED_FIELDS of each row count, so validation bookkeeping such as
+    Last Checked does not invalidate cached sections.
+    """
+    resources = index["categories"].get(category.get("name", ""), {})
+    payload = {
+        "category": category,
+        "resources": {
+            subcategory: [[row.get(field) for field in RENDERED_FIELDS] for row in rows]
+            for subcategory, rows in resources.items()
+        },
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_section_cache(cache_path, renderer_digest):
+    """Load cached sections, ignoring caches written by a different renderer."""
+    if not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        print(f"Warning: could not read section cache {cache_path}; rendering all sections")
+        return {}
+    if data.get("renderer") != renderer_digest:
+        return {}
+    return data.get("sections", {})
+
+
+def save_section_cache(cache_path, renderer_digest, sections):
+    """Atomically write the section cache."""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"renderer": renderer_digest, "sections": sections}, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+
+def render_body_sections(categories, csv_data, index, cache=None):
+    """Render every category section, reusing cached sections whose digest is unchanged.
+
+    Args:
+        categories: Category definitions in README order.
+        csv_data: Active resource rows.
+        index: Resource index from build_resource_index(csv_data).
+        cache: Optional {section key: {"digest", "content"}} from a previous build.
+               Updated in place with the sections rendered now.
+
+    Returns:
+        (list of section contents, number of sections re-rendered)
+    """
+    body_sections = []
+    rendered = 0
+    for category in categories:
+        if cache is None:
+            body_sections.append(generate_section_content(category, csv_data, index))
+            rendered += 1
+            continue
+
+        key = category.get("id") or category.get("name", "")
+        digest = get_section_digest(category, index)
+        cached = cache.get(key)
+        if cached and cached.get("digest") == digest:
+            body_sections.append(cached["content"])
+            continue
+
+        content = generate_section_content(category, csv_data, index)
+        cache[key] = {"digest": digest, "content": content}
+        body_sections.append(content)
+        rendered += 1
+
+    if cache is not None:
+        keys = {category.get("id") or category.get("name", "") for category in categories}
+        for key in list(cache):
+            if key not in keys:
+                del cache[key]
+
+    return body_sections, rendered
+
+
+def generate_readme_from_templates(
+    csv_path, template_dir, output_path, incremental=False, cache_path=None
+):
+    """Generate README using template system.
+
+    With incremental=True, category sections whose resources and definition are
+    unchanged since the last build are reused from the section cache instead of
+    being re-rendered. The weekly section and table of contents are always rebuilt.
+    """
     from category_utils import category_manager  # type: ignore[import-not-found]
 
     # Create backup of existing README
     backup_path = create_backup(output_path)
 
-    # Load template
-    template_path = os.path.join(template_dir, "README.template.md")
-    template = load_template(template_path)
-    overrides = load_overrides(template_dir)
-    announcements = load_announcements(template_dir)
-
-    # Load CSV data
-    csv_data = []
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Apply overrides
-            row = apply_overrides(row, overrides)
-            if row["Active"].upper() == "TRUE":
-                csv_data.append(row)
-
-    # Generate table of contents
-    toc_content = generate_toc_from_categories(csv_data)
-
-    # Generate weekly section
-    weekly_section = generate_weekly_section(csv_data)
-
-    # Generate body sections
-    body_sections = []
-    categories = category_manager.get_categories_for_readme()
-    for category in categories:
-        section_content = generate_section_content(category, csv_data)
-        body_sections.append(section_content)
+    with METRICS.phase("load"):
+        # Load template
+        template_path = os.path.join(template_dir, "README.template.md")
+        template = load_template(template_path)
+        overrides = load_overrides(template_dir)
+        announcements = load_announcements(template_dir)
+
+        # Load CSV data
+        csv_data = []
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                # Apply overrides
+                row = apply_overrides(row, overrides)
+                if row["Active"].upper() == "TRUE":
+                    csv_data.append(row)
+
+    with METRICS.phase("index"):
+        # Group resources once; every section is rendered from this index
+        index = build_resource_index(csv_data)
+
+    with METRICS.phase("render"):
+        # Generate table of contents
+        toc_content = generate_toc_from_categories(csv_data, index)
+
+        # Generate weekly section
+        weekly_section = generate_weekly_section(csv_data, index)
+
+        # Generate body sections
+        categories = category_manager.get_categories_for_readme()
+        cache = None
+        if incremental:
+            cache_path = cache_path or get_default_section_cache_path()
+            renderer_digest = get_renderer_digest()
+            cache = load_section_cache(cache_path, renderer_digest)
+        body_sections, rendered = render_body_sections(categories, csv_data, index, cache)
+    METRICS.count("sections_rendered", rendered)
+    if cache is not None:
+        save_section_cache(cache_path, renderer_digest, cache)
+        print(f"♻️  Re-rendered {rendered} of {len(categories)} sections")
 
     # Replace placeholders in template
     readme_content = template
@@ -582,7 +731,7 @@ def generate_readme_from_templates(csv_path, template_dir, output_path):
 
     # Write output
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
+        with METRICS.phase("write"), open(output_path, "w", encoding="utf-8") as f:
             f.write(readme_content)
     except Exception as e:
         if backup_path:
@@ -595,6 +744,18 @@ def generate_readme_from_templates(csv_path, template_dir, output_path):
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate README.md from templates and CSV")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse unchanged category sections from the previous build",
+    )
+    parser.add_argument(
+        "--cache-file",
+        help="Section cache used by --incremental (default: .myob/readme-sections.json)",
+    )
+    args = parser.parse_args()
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     csv_path = os.path.join(script_dir, "..", "THE_RESOURCES_TABLE.csv")
     template_dir = os.path.join(script_dir, "..", "templates")
@@ -605,7 +766,11 @@ def main():
 
     try:
         resource_count, backup_path = generate_readme_from_templates(
-            csv_path, template_dir, output_path
+            csv_path,
+            template_dir,
+            output_path,
+            incremental=args.incremental,
+            cache_path=args.cache_file,
         )
         print(f"✅ README.md generated successfully at {os.path.abspath(output_path)}")
         print(f"📊 Generated README with {resource_count} active resources")
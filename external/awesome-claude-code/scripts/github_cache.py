@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Persistent conditional-request cache for GitHub API responses.
+
+Responses are stored on disk keyed by URL, query parameters, Accept header and
+auth identity. Cached entries are revalidated with If-None-Match /
+If-Modified-Since; GitHub answers unchanged resources with 304 Not Modified,
+which does not count against the rate limit. Lookups repeated within one run
+(e.g. the same repository's license for every file URL) are served from memory
+without touching the network.
+
+Usage:
+    from github_cache import GitHubResponseCache
+
+    cache = GitHubResponseCache(".myob/http-cache")
+    response = cache.get(url, send, headers=HEADERS)
+    print(cache.report())
+    cache.prune()
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_DIR = ".myob/http-cache"
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+# Larger bodies (e.g. downloaded files) are cached on disk but not kept in memory
+MAX_MEMORY_ENTRY_BYTES = 256 * 1024
+
+# Response headers worth keeping alongside a cached body
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+def _auth_identity(headers: dict[str, str]) -> str:
+    """Return a stable, non-reversible identity for the request's credentials."""
+    authorization = headers.get("Authorization", "")
+    if not authorization:
+        return "anonymous"
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16]
+
+
+def _build_response(
+    url: str, status_code: int, headers: dict[str, str], body: bytes
+) -> requests.Response:
+    """Rebuild a requests.Response from cached parts."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body
+    response.encoding = "utf-8"
+    return response
+
+
+class GitHubResponseCache:
+    """On-disk ETag / Last-Modified cache with in-process request deduplication."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.max_bytes = max_bytes
+        self.stats = {"memory_hits": 0, "revalidated": 0, "misses": 0, "uncacheable": 0}
+        self._memory: dict[str, requests.Response] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+
+    def cache_key(
+        self, url: str, headers: dict[str, str], params: dict[str, Any] | None = None
+    ) -> str:
+        """Key a request by URL, sorted params, Accept header and auth identity."""
+        parts = [
+            url,
+            json.dumps(sorted((params or {}).items()), default=str),
+            headers.get("Accept", ""),
+            _auth_identity(headers),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _load(self, key: str) -> dict[str, Any] | None:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["body"] = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def _store(self, key: str, response: requests.Response) -> None:
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "url": response.url,
+            "headers": {h: response.headers[h] for h in STORED_HEADERS if h in response.headers},
+            "stored_at": time.time(),
+        }
+        # Write the body first so a metadata file never points at a partial body
+        tmp_body = body_path.with_suffix(".body.tmp")
+        tmp_body.write_bytes(response.content)
+        os.replace(tmp_body, body_path)
+        tmp_meta = meta_path.with_suffix(".json.tmp")
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, meta_path)
+
+    def _touch(self, key: str) -> None:
+        meta_path, _ = self._paths(key)
+        with contextlib.suppress(OSError):
+            os.utime(meta_path)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+            return self._key_locks[key]
+
+    def get(
+        self,
+        url: str,
+        send: Callable[[dict[str, str]], requests.Response],
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+    ) -> requests.Response:
+        """
+        Return the response for a GET request, revalidating any cached copy.
+
+        ``send`` performs the actual request with the headers it is given, so the
+        caller keeps control of sessions, timeouts and rate limiting.
+        """
+        key = self.cache_key(url, headers, params)
+
+        # Concurrent lookups of the same resource wait for the first one
+        with self._key_lock(key):
+            with self._lock:
+                cached_response = self._memory.get(key)
+            if cached_response is not None:
+                self._count("memory_hits")
+                return cached_response
+
+            entry = self._load(key)
+            request_headers = dict(headers)
+            if entry:
+                if "ETag" in entry["headers"]:
+                    request_headers["If-None-Match"] = entry["headers"]["ETag"]
+                if "Last-Modified" in entry["headers"]:
+                    request_headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+
+            response = send(request_headers)
+
+            if response.status_code == 304 and entry:
+                self._count("revalidated")
+                self._touch(key)
+                response = _build_response(entry["url"], 200, entry["headers"], entry["body"])
+            elif response.status_code == 200:
+                self._count("misses")
+                if "ETag" in response.headers or "Last-Modified" in response.headers:
+                    self._store(key, response)
+            else:
+                # Errors are never cached or deduplicated; callers handle them as before
+                self._count("uncacheable")
+                return response
+
+            if len(response.content) <= MAX_MEMORY_ENTRY_BYTES:
+                with self._lock:
+                    self._memory[key] = response
+            return response
+
+    def prune(self) -> dict[str, int]:
+        """Evict entries older than max_age, then least recently used beyond max_bytes."""
+        now = time.time()
+        entries = []
+        removed = 0
+        for meta_path in self.cache_dir.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                last_used = meta_path.stat().st_mtime
+                size = meta_path.stat().st_size + body_path.stat().st_size
+            except OSError:
+                meta_path.unlink(missing_ok=True)
+                body_path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            if now - last_used > self.max_age_seconds:
+                meta_path.unlink(missing_ok=True)
+                body_path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            entries.append((last_used, size, meta_path, body_path))
+
+        total_bytes = sum(size for _, size, _, _ in entries)
+        for _, size, meta_path, body_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            total_bytes -= size
+            removed += 1
+
+        return {"removed": removed, "bytes": total_bytes}
+
+    def report(self) -> str:
+        """Summarize cache effectiveness for the end-of-run log."""
+        stats = self.stats
+        return (
+            "HTTP cache: "
+            f"{stats['memory_hits']} in-process hits, "
+            f"{stats['revalidated']} revalidated (304), "
+            f"{stats['misses']} misses, "
+            f"{stats['uncacheable']} uncacheable"
+        )
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Base URLs of the GitHub services the scripts talk to.
+
+Both can be overridden through the environment - GITHUB_API_URL is the
+variable GitHub Actions and GitHub Enterprise already use - so the scripts can
+be pointed at another host, such as the local mock server used by
+benchmark_pipeline.py:
+
+    GITHUB_API_URL=http://127.0.0.1:8000/api \\
+    GITHUB_RAW_URL=http://127.0.0.1:8000/raw python scripts/validate_links.py
+"""
+
+import os
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+GITHUB_RAW_URL = os.getenv("GITHUB_RAW_URL", "https://raw.githubusercontent.com").rstrip("/")
+
+
+def is_github_api_url(url: str) -> bool:
+    """Return True if url is served by the GitHub API (and draws from its rate limit)."""
+    return url.startswith(GITHUB_API_URL + "/")
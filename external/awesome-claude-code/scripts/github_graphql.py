@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Batched GitHub GraphQL metadata fetcher.
+
+Replaces the per-row REST round trips made by validate_links.py (existence,
+license, last commit) with one aliased GraphQL query per chunk of
+repositories. Each target describes one repository lookup:
+
+    {
+        "owner": "octocat",
+        "repo": "hello-world",
+        "expression": "main:docs/README.md",  # object to check, or None for the repo itself
+        "history_path": "docs/README.md",  # path for the last-commit lookup, or None
+    }
+
+Targets the query cannot resolve (transport failures, unexpected errors) are
+left out of the result so the caller can fall back to the REST path.
+
+Note: the GraphQL API always requires authentication (GITHUB_TOKEN).
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+import requests
+
+try:
+    from github_endpoints import GITHUB_API_URL  # type: ignore[import-not-found]
+    from run_metrics import METRICS, instrument_session  # type: ignore[import-not-found]
+except ImportError:
+    # Fallback for when running as a module
+    from .github_endpoints import GITHUB_API_URL
+    from .run_metrics import METRICS, instrument_session
+
+GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+USER_AGENT = "awesome-claude-code Link Validator/2.0"
+
+# GitHub caps a query at 500,000 nodes and charges ~1 point per 100 connection
+# requests; these limits keep every chunk at the minimum cost of one point and
+# well away from the per-query timeout.
+MAX_ALIASES_PER_QUERY = 50
+MAX_NODES_PER_QUERY = 100
+
+REPOSITORY_FIELDS = """
+    licenseInfo { spdxId }
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 1, path: $path%(i)d) { nodes { committedDate } }
+        }
+      }
+    }"""
+
+
+def target_key(target: dict[str, Any]) -> tuple:
+    """Identity of a lookup; rows sharing a key share one alias in the query."""
+    return (
+        target["owner"].lower(),
+        target["repo"].lower(),
+        target.get("expression"),
+        target.get("history_path"),
+    )
+
+
+def estimate_nodes(target: dict[str, Any]) -> int:
+    """Estimate the GraphQL node count of one target (repository + history(first: 1))."""
+    nodes = 2
+    if target.get("expression"):
+        nodes += 1
+    return nodes
+
+
+def chunk_targets(
+    targets: list[dict[str, Any]],
+    max_aliases: int = MAX_ALIASES_PER_QUERY,
+    max_nodes: int = MAX_NODES_PER_QUERY,
+) -> Iterator[list[dict[str, Any]]]:
+    """Split targets into chunks that respect the alias and node limits."""
+    chunk: list[dict[str, Any]] = []
+    nodes = 0
+    for target in targets:
+        target_nodes = estimate_nodes(target)
+        if chunk and (len(chunk) >= max_aliases or nodes + target_nodes > max_nodes):
+            yield chunk
+            chunk, nodes = [], 0
+        chunk.append(target)
+        nodes += target_nodes
+    if chunk:
+        yield chunk
+
+
+def build_query(chunk: list[dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+    """Build one aliased query (r0, r1, ...) and its variables for a chunk of targets."""
+    declarations = []
+    fields = []
+    variables: dict[str, Any] = {}
+    for i, target in enumerate(chunk):
+        declarations += [f"$owner{i}: String!", f"$name{i}: String!", f"$path{i}: String"]
+        variables[f"owner{i}"] = target["owner"]
+        variables[f"name{i}"] = target["repo"]
+        variables[f"path{i}"] = target.get("history_path")
+
+        object_field = ""
+        if target.get("expression"):
+            declarations.append(f"$expr{i}: String!")
+            variables[f"expr{i}"] = target["expression"]
+            object_field = f"\n    object(expression: $expr{i}) {{ __typename }}"
+
+        fields.append(
+            f"  r{i}: repository(owner: $owner{i}, name: $name{i}) {{"
+            + REPOSITORY_FIELDS % {"i": i}
+            + object_field
+            + "\n  }"
+        )
+
+    query = (
+        f"query({', '.join(declarations)}) {{\n"
+        + "\n".join(fields)
+        + "\n  rateLimit { cost remaining }\n}"
+    )
+    return query, variables
+
+
+def parse_repository(target: dict[str, Any], repository: dict[str, Any]) -> dict[str, Any]:
+    """Convert one aliased repository result into a metadata dict."""
+    if target.get("expression") and repository.get("object") is None:
+        return {"exists": False, "license": None, "committed_date": None}
+
+    license_info = repository.get("licenseInfo") or {}
+    committed_date = None
+    branch = repository.get("defaultBranchRef") or {}
+    history = (branch.get("target") or {}).get("history") or {}
+    nodes = history.get("nodes") or []
+    if nodes:
+        committed_date = nodes[0].get("committedDate")
+
+    return {
+        "exists": True,
+        "license": license_info.get("spdxId") or "NOT_FOUND",
+        "committed_date": committed_date,
+    }
+
+
+class GitHubGraphQLFetcher:
+    """Fetch existence, license and last-commit metadata for many repositories at once."""
+
+    def __init__(
+        self,
+        token: str,
+        endpoint: str = GRAPHQL_URL,
+        max_aliases: int = MAX_ALIASES_PER_QUERY,
+        max_nodes: int = MAX_NODES_PER_QUERY,
+        timeout: int = 30,
+    ):
+        self.endpoint = endpoint
+        self.max_aliases = max_aliases
+        self.max_nodes = max_nodes
+        self.timeout = timeout
+        self.session = instrument_session(requests.Session())
+        self.session.headers.update({"User-Agent": USER_AGENT, "Authorization": f"Bearer {token}"})
+        self.stats = {"queries": 0, "cost": 0, "resolved": 0, "unresolved": 0}
+
+    def _query(self, chunk: list[dict[str, Any]]) -> dict[str, Any] | None:
+        query, variables = build_query(chunk)
+        self.stats["queries"] += 1
+        try:
+            response = self.session.post(
+                self.endpoint,
+                json={"query": query, "variables": variables},
+                timeout=self.timeout,
+            )
+            if response.status_code != 200:
+                print(f"GraphQL query failed with status {response.status_code}")
+                return None
+            payload = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"GraphQL query failed: {e}")
+            return None
+
+        if not isinstance(payload.get("data"), dict):
+            return None
+        rate_limit = payload["data"].get("rateLimit") or {}
+        cost = rate_limit.get("cost", 0) or 0
+        self.stats["cost"] += cost
+        METRICS.add_rate_limit_units("graphql", cost)
+        return payload
+
+    def fetch(self, targets: list[dict[str, Any]]) -> dict[tuple, dict[str, Any]]:
+        """
+        Resolve targets, returning {target_key: metadata} for every resolved target.
+        Metadata is {"exists": bool, "license": str | None, "committed_date": str | None}.
+        """
+        unique = {target_key(target): target for target in targets}
+        results: dict[tuple, dict[str, Any]] = {}
+
+        for chunk in chunk_targets(list(unique.values()), self.max_aliases, self.max_nodes):
+            payload = self._query(chunk)
+            if payload is None:
+                self.stats["unresolved"] += len(chunk)
+                continue
+
+            errors_by_alias: dict[str, list[dict[str, Any]]] = {}
+            for error in payload.get("errors") or []:
+                path = error.get("path") or []
+                if path:
+                    errors_by_alias.setdefault(path[0], []).append(error)
+
+            for i, target in enumerate(chunk):
+                alias = f"r{i}"
+                repository = payload["data"].get(alias)
+                alias_errors = errors_by_alias.get(alias, [])
+                if repository is not None and not alias_errors:
+                    results[target_key(target)] = parse_repository(target, repository)
+                elif (
+                    repository is None
+                    and alias_errors
+                    and all(e.get("type") == "NOT_FOUND" for e in alias_errors)
+                ):
+                    results[target_key(target)] = {
+                        "exists": False,
+                        "license": None,
+                        "committed_date": None,
+                    }
+                else:
+                    # Anything else (partial data, rate limits, timeouts) goes to REST
+                    self.stats["unresolved"] += 1
+                    continue
+                self.stats["resolved"] += 1
+
+        return results
+
+    def report(self) -> str:
+        """Summarize the run for the end-of-run log."""
+        stats = self.stats
+        return (
+            f"GraphQL: {stats['queries']} queries, {stats['cost']} rate-limit points, "
+            f"{stats['resolved']} resolved, {stats['unresolved']} sent to REST"
+        )
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Parallel, resumable GitHub download engine used by download_resources.py.
+
+A repository subtree (or single file) is resolved with one recursive
+git-trees API call. Blobs are then fetched from raw.githubusercontent.com
+(which does not count against the API rate limit) in parallel, streamed to
+disk in chunks and verified against their git blob SHA.
+
+A manifest in the archive root records the SHA and size of every file
+written. Files whose SHA already matches - either through the manifest or by
+hashing the file left on disk by an interrupted run - are skipped, so re-runs
+only transfer what changed.
+
+Usage:
+    manifest = DownloadManifest(".myob/downloads")
+    downloader = GitHubTreeDownloader(api_get, HEADERS, manifest, concurrency=8)
+    ok = downloader.download(url_info, ".myob/downloads/category/name")
+    manifest.save()
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from github_endpoints import GITHUB_API_URL, GITHUB_RAW_URL  # type: ignore[import-not-found]
+    from run_metrics import instrument_session  # type: ignore[import-not-found]
+except ImportError:
+    # Fallback for when running as a module
+    from .github_endpoints import GITHUB_API_URL, GITHUB_RAW_URL
+    from .run_metrics import instrument_session
+
+MANIFEST_NAME = ".download-manifest.json"
+CHUNK_SIZE = 64 * 1024
+DEFAULT_CONCURRENCY = 8
+MAX_BLOB_RETRIES = 3
+# Flush the manifest this often so an interrupted run loses little progress
+MANIFEST_SAVE_INTERVAL = 50
+
+
+def git_blob_sha(path: str) -> str:
+    """Compute the git blob SHA-1 of a file on disk."""
+    sha = hashlib.sha1()
+    sha.update(f"blob {os.path.getsize(path)}\0".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class DownloadManifest:
+    """SHA/size record of downloaded files, keyed by path relative to the archive root."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.path = os.path.join(root, MANIFEST_NAME)
+        self.files: dict[str, dict[str, Any]] = {}
+        self.stats = {
+            "files_downloaded": 0,
+            "bytes_downloaded": 0,
+            "files_skipped": 0,
+            "bytes_skipped": 0,
+            "files_failed": 0,
+        }
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self.files = json.load(f).get("files", {})
+            except (OSError, ValueError):
+                print(f"Warning: could not read download manifest {self.path}; starting fresh")
+
+    def _key(self, local_path: str) -> str:
+        return os.path.relpath(local_path, self.root).replace(os.sep, "/")
+
+    def is_current(self, local_path: str, sha: str, size: int) -> bool:
+        """Return True (and count the skip) if local_path already holds blob `sha`."""
+        key = self._key(local_path)
+        with self._lock:
+            entry = self.files.get(key)
+        if not os.path.isfile(local_path):
+            return False
+        if entry and entry.get("sha") == sha and os.path.getsize(local_path) == entry.get("size"):
+            current = True
+        else:
+            # Not recorded (e.g. the run was interrupted before the manifest was saved)
+            current = git_blob_sha(local_path) == sha
+            if current:
+                self.record(local_path, sha, size, downloaded=False)
+        if current:
+            with self._lock:
+                self.stats["files_skipped"] += 1
+                self.stats["bytes_skipped"] += size
+        return current
+
+    def record(self, local_path: str, sha: str, size: int, downloaded: bool = True) -> None:
+        """Record a file written (or verified) on disk."""
+        with self._lock:
+            self.files[self._key(local_path)] = {"sha": sha, "size": size}
+            if downloaded:
+                self.stats["files_downloaded"] += 1
+                self.stats["bytes_downloaded"] += size
+            self._unsaved += 1
+            flush = self._unsaved >= MANIFEST_SAVE_INTERVAL
+        if flush:
+            self.save()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.stats["files_failed"] += 1
+
+    def save(self) -> None:
+        """Atomically write the manifest, including this run's transfer totals."""
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"files": self.files, "last_run": self.stats}, f, indent=2, sort_keys=True
+                )
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+
+    def report(self) -> str:
+        stats = self.stats
+        return (
+            f"Files: {stats['files_downloaded']} downloaded "
+            f"({stats['bytes_downloaded']:,} bytes), "
+            f"{stats['files_skipped']} unchanged ({stats['bytes_skipped']:,} bytes skipped), "
+            f"{stats['files_failed']} failed"
+        )
+
+
+class GitHubTreeDownloader:
+    """Resolve a GitHub file/directory/repository via git trees and fetch its blobs in parallel."""
+
+    def __init__(
+        self,
+        api_get: Callable[[str, dict[str, str]], requests.Response],
+        headers: dict[str, str],
+        manifest: DownloadManifest,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: int = 30,
+    ):
+        self.api_get = api_get
+        self.headers = headers
+        self.manifest = manifest
+        self.concurrency = max(concurrency, 1)
+        self.timeout = timeout
+        self.session = instrument_session(requests.Session())
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def resolve(self, url_info: dict[str, str]) -> list[dict[str, Any]] | None:
+        """
+        List the blobs behind a parsed GitHub URL with one recursive trees call.
+        Returns [{"path", "relative_path", "sha", "size"}], or None if the tree
+        cannot be used (API error, truncated listing, path not found).
+        """
+        ref = url_info.get("branch", "HEAD")
+        api_url = (
+            f"{GITHUB_API_URL}/repos/{url_info['owner']}/{url_info['repo']}"
+            f"/git/trees/{quote(ref, safe='')}?recursive=1"
+        )
+        tree_headers = {**self.headers, "Accept": "application/vnd.github+json"}
+        response = self.api_get(api_url, tree_headers)
+        if (
+            response.status_code in (403, 429)
+            and response.headers.get("X-RateLimit-Remaining") == "0"
+        ):
+            reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+            sleep_time = max(reset_time - int(time.time()), 0) + 1
+            print(f"    GitHub rate limit hit. Sleeping for {sleep_time} seconds...")
+            time.sleep(sleep_time)
+            response = self.api_get(api_url, tree_headers)
+        if response.status_code != 200:
+            print(f"    Tree API Response: {response.status_code}")
+            return None
+
+        data = response.json()
+        if data.get("truncated"):
+            print("    Tree listing truncated by GitHub")
+            return None
+
+        blobs = [entry for entry in data.get("tree", []) if entry.get("type") == "blob"]
+        path = url_info.get("path", "").strip("/")
+        entries = []
+        for entry in blobs:
+            if url_info["type"] == "file":
+                if entry["path"] != path:
+                    continue
+                relative_path = os.path.basename(path)
+            elif path:
+                if not entry["path"].startswith(path + "/"):
+                    continue
+                relative_path = entry["path"][len(path) + 1 :]
+            else:
+                relative_path = entry["path"]
+            entries.append(
+                {
+                    "path": entry["path"],
+                    "relative_path": relative_path,
+                    "sha": entry["sha"],
+                    "size": entry.get("size", 0),
+                }
+            )
+
+        if not entries:
+            print(f"    Path not found in tree: {path or '/'}")
+            return None
+        return entries
+
+    def _fetch_blob(self, url_info: dict[str, str], entry: dict[str, Any], target: str) -> bool:
+        ref = url_info.get("branch", "HEAD")
+        raw_url = (
+            f"{GITHUB_RAW_URL}/{url_info['owner']}/{url_info['repo']}/"
+            f"{quote(ref, safe='')}/{quote(entry['path'])}"
+        )
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp_path = f"{target}.part"
+
+        for attempt in range(MAX_BLOB_RETRIES):
+            try:
+                with self.session.get(
+                    raw_url, headers=self.headers, timeout=self.timeout, stream=True
+                ) as response:
+                    if response.status_code != 200:
+                        raise requests.exceptions.HTTPError(f"Status {response.status_code}")
+                    sha = hashlib.sha1(f"blob {entry['size']}\0".encode())
+                    size = 0
+                    with open(tmp_path, "wb") as f:
+                        for chunk in response.iter_content(CHUNK_SIZE):
+                            f.write(chunk)
+                            sha.update(chunk)
+                            size += len(chunk)
+                if size != entry["size"] or sha.hexdigest() != entry["sha"]:
+                    raise ValueError("content does not match tree SHA")
+                os.replace(tmp_path, target)
+                self.manifest.record(target, entry["sha"], size)
+                return True
+            except (requests.exceptions.RequestException, ValueError, OSError) as e:
+                if attempt < MAX_BLOB_RETRIES - 1:
+                    time.sleep((2**attempt) + random.uniform(0, 1))
+                    continue
+                print(f"      File download failed: {entry['path']} - {e}")
+
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        self.manifest.record_failure()
+        return False
+
+    def download(self, url_info: dict[str, str], output_path: str) -> bool | None:
+        """
+        Download a file (to output_path) or a directory/repository (under output_path).
+        Returns True on success, False if any blob failed, or None if the tree could
+        not be resolved and the caller should fall back to another method.
+        """
+        entries = self.resolve(url_info)
+        if entries is None:
+            return None
+
+        jobs = []
+        for entry in entries:
+            if url_info["type"] == "file":
+                target = output_path
+            else:
+                target = os.path.normpath(os.path.join(output_path, entry["relative_path"]))
+                if not target.startswith(os.path.normpath(output_path) + os.sep):
+                    print(f"      Skipping unsafe path: {entry['path']}")
+                    continue
+            if not self.manifest.is_current(target, entry["sha"], entry["size"]):
+                jobs.append((entry, target))
+
+        print(f"    {len(entries)} files in tree, {len(jobs)} to download")
+        if url_info["type"] != "file":
+            os.makedirs(output_path, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            results = list(executor.map(lambda job: self._fetch_blob(url_info, *job), jobs))
+
+        self.manifest.save()
+        return all(results)
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Local mock of the GitHub services used by the pipeline scripts, for offline
+benchmarks (see benchmark_pipeline.py).
+
+One threaded HTTP server plays every role under a path prefix:
+- /api   REST API (repos, contents, commits, git trees, gists, rate_limit) and /api/graphql
+- /raw   raw.githubusercontent.com file downloads
+- /site  any other website (HEAD/GET link checks)
+
+Repositories are procedural: every owner/repo exists, with a README.md and
+`files_per_repo` command files under .claude/commands/, except repositories
+(and gists, and site paths) whose name starts with "missing", which 404.
+Site paths under /site/moved/ redirect once. Licenses, commit dates and file
+contents are derived from the names, so runs are reproducible.
+
+The server mimics the costs the scripts care about: REST calls draw one unit
+from the "core" rate limit, GraphQL queries one from "graphql", 304
+revalidations (ETag / If-None-Match) and /rate_limit are free, and an
+exhausted limit answers 403 with X-RateLimit-Remaining: 0. Latency and random
+failures can be injected. Request counts by endpoint and units charged are
+kept in `stats`, named exactly like run_metrics.py names them.
+
+Usage:
+    with MockGitHubServer(latency=0.05, rate_limit=500) as server:
+        os.environ["GITHUB_API_URL"] = server.api_url
+        os.environ["GITHUB_RAW_URL"] = server.raw_url
+        ...
+        print(server.stats)
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+try:
+    from run_metrics import classify_endpoint  # type: ignore[import-not-found]
+except ImportError:
+    # Fallback for when running as a module
+    from .run_metrics import classify_endpoint
+
+MISSING_PREFIX = "missing"
+LICENSES = ["MIT", "Apache-2.0", "GPL-3.0", None]
+COMMIT_EPOCH = datetime(2025, 1, 1)
+RATE_LIMITED_BODY = {"message": "API rate limit exceeded"}
+
+
+def _digest(key: str) -> int:
+    return int(hashlib.sha1(key.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def file_content(owner: str, repo: str, path: str, size: int) -> bytes:
+    """Deterministic content of a file in a mock repository."""
+    line = f"{owner}/{repo}/{path}\n".encode()
+    return (line * (size // len(line) + 1))[:size]
+
+
+def blob_sha(content: bytes) -> str:
+    return hashlib.sha1(f"blob {len(content)}\0".encode() + content).hexdigest()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, so pooled sessions behave as they do against GitHub
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.server.mock.handle(self, "GET", b"")  # type: ignore[attr-defined]
+
+    def do_HEAD(self) -> None:
+        self.server.mock.handle(self, "HEAD", b"")  # type: ignore[attr-defined]
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.mock.handle(self, "POST", body)  # type: ignore[attr-defined]
+
+
+class MockGitHubServer:
+    """Threaded mock GitHub API, raw host and website with cost accounting."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit: int = 5000,
+        rate_limit_window: float = 3600,
+        failure_rate: float = 0.0,
+        failure_status: int = 502,
+        files_per_repo: int = 5,
+        file_bytes: int = 1024,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.files_per_repo = files_per_repo
+        self.file_bytes = file_bytes
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._buckets: dict[str, dict[str, float]] = {}
+        self.reset_stats()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self  # type: ignore[attr-defined]
+        self._thread: threading.Thread | None = None
+
+    # Lifecycle
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/api"
+
+    @property
+    def raw_url(self) -> str:
+        return f"{self.base_url}/raw"
+
+    @property
+    def site_url(self) -> str:
+        return f"{self.base_url}/site"
+
+    def start(self) -> "MockGitHubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockGitHubServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        """Clear request counts and rate-limit usage (e.g. between benchmarked scripts)."""
+        with self._lock:
+            self.stats: dict[str, Any] = {
+                "requests": 0,
+                "by_endpoint": {},
+                "rate_limit_units": {},
+                "not_modified": 0,
+                "rate_limited": 0,
+                "failures_injected": 0,
+            }
+            self._buckets = {}
+
+    # Accounting
+
+    def _bucket(self, resource: str) -> dict[str, float]:
+        bucket = self._buckets.get(resource)
+        now = time.time()
+        if bucket is None or now >= bucket["reset"]:
+            bucket = {"used": 0, "reset": now + self.rate_limit_window}
+            self._buckets[resource] = bucket
+        return bucket
+
+    def _rate_headers(self, resource: str) -> dict[str, str]:
+        bucket = self._bucket(resource)
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(self.rate_limit - int(bucket["used"]), 0)),
+            "X-RateLimit-Reset": str(int(bucket["reset"]) + 1),
+            "X-RateLimit-Used": str(int(bucket["used"])),
+            "X-RateLimit-Resource": resource,
+        }
+
+    def _charge(self, resource: str, cost: int = 1) -> dict[str, str] | None:
+        """Draw cost units; returns rate-limit headers, or None if the limit is exhausted."""
+        with self._lock:
+            bucket = self._bucket(resource)
+            if bucket["used"] + cost > self.rate_limit:
+                self.stats["rate_limited"] += 1
+                return None
+            bucket["used"] += cost
+            units = self.stats["rate_limit_units"]
+            units[resource] = units.get(resource, 0) + cost
+            return self._rate_headers(resource)
+
+    def _inject_failure(self) -> bool:
+        if not self.failure_rate:
+            return False
+        with self._lock:
+            failed = self._random.random() < self.failure_rate
+            if failed:
+                self.stats["failures_injected"] += 1
+        return failed
+
+    # Procedural content
+
+    def repo_exists(self, owner: str, repo: str) -> bool:
+        return not repo.startswith(MISSING_PREFIX)
+
+    def repo_files(self, owner: str, repo: str) -> dict[str, bytes]:
+        paths = ["README.md"] + [
+            f".claude/commands/command-{i}.md" for i in range(self.files_per_repo)
+        ]
+        return {path: file_content(owner, repo, path, self.file_bytes) for path in paths}
+
+    def repo_license(self, owner: str, repo: str) -> str | None:
+        return LICENSES[_digest(f"{owner}/{repo}") % len(LICENSES)]
+
+    def commit_date(self, owner: str, repo: str, path: str | None = None) -> str:
+        days = _digest(f"{owner}/{repo}:{path or ''}") % 720
+        return (COMMIT_EPOCH - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def _path_kind(self, owner: str, repo: str, path: str) -> str | None:
+        files = self.repo_files(owner, repo)
+        if path in files:
+            return "file"
+        if not path or any(name.startswith(path.rstrip("/") + "/") for name in files):
+            return "dir"
+        return None
+
+    # Request handling
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str, body: bytes) -> None:
+        url = urlsplit(handler.path)
+        endpoint, _ = classify_endpoint(
+            method, self.base_url + handler.path, self.api_url, self.raw_url
+        )
+        with self._lock:
+            self.stats["requests"] += 1
+            by_endpoint = self.stats["by_endpoint"]
+            by_endpoint[endpoint] = by_endpoint.get(endpoint, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        path = unquote(url.path)
+        if path == "/api/graphql" and method == "POST":
+            self._graphql(handler, body)
+        elif path.startswith("/api/"):
+            self._rest(handler, method, path[len("/api") :], query)
+        elif path.startswith("/raw/"):
+            self._raw(handler, method, path[len("/raw/") :])
+        elif path.startswith("/site/"):
+            self._site(handler, method, path[len("/site") :])
+        else:
+            self._send(handler, method, 404, b"Not Found", "text/plain")
+
+    def _send(
+        self,
+        handler: BaseHTTPRequestHandler,
+        method: str,
+        status: int,
+        body: bytes,
+        content_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        if method != "HEAD":
+            handler.wfile.write(body)
+
+    def _rest(
+        self, handler: BaseHTTPRequestHandler, method: str, path: str, query: dict[str, str]
+    ) -> None:
+        if path.rstrip("/") == "/rate_limit":
+            with self._lock:
+                core = self._rate_headers("core")
+            rate = {
+                "limit": self.rate_limit,
+                "remaining": int(core["X-RateLimit-Remaining"]),
+                "reset": int(core["X-RateLimit-Reset"]),
+                "used": int(core["X-RateLimit-Used"]),
+            }
+            payload = json.dumps({"rate": rate, "resources": {"core": rate}}).encode()
+            self._send(handler, method, 200, payload)
+            return
+
+        status, payload, content_type = self._rest_payload(handler, path, query)
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+        if status == 200 and handler.headers.get("If-None-Match") == etag:
+            with self._lock:
+                self.stats["not_modified"] += 1
+                headers = self._rate_headers("core")
+            self._send(handler, method, 304, b"", content_type, {**headers, "ETag": etag})
+            return
+
+        headers = self._charge("core")
+        if headers is None:
+            with self._lock:
+                headers = self._rate_headers("core")
+            self._send(
+                handler, method, 403, json.dumps(RATE_LIMITED_BODY).encode(), headers=headers
+            )
+            return
+        if self._inject_failure():
+            self._send(handler, method, self.failure_status, b'{"message": "Server Error"}')
+            return
+        if status == 200:
+            headers["ETag"] = etag
+        self._send(handler, method, status, payload, content_type, headers)
+
+    def _rest_payload(
+        self, handler: BaseHTTPRequestHandler, path: str, query: dict[str, str]
+    ) -> tuple[int, bytes, str]:
+        """Build the (status, body, content type) of a REST API GET."""
+        not_found = (404, json.dumps({"message": "Not Found"}).encode(), "application/json")
+        parts = path.strip("/").split("/")
+
+        if len(parts) == 2 and parts[0] == "gists":
+            gist_id = parts[1]
+            if gist_id.startswith(MISSING_PREFIX):
+                return not_found
+            content = file_content("gist", gist_id, "gist.md", self.file_bytes).decode()
+            files = {f"{gist_id}.md": {"filename": f"{gist_id}.md", "content": content}}
+            return 200, json.dumps({"id": gist_id, "files": files}).encode(), "application/json"
+
+        if len(parts) < 3 or parts[0] != "repos":
+            return not_found
+        owner, repo, rest = parts[1], parts[2], parts[3:]
+        if not self.repo_exists(owner, repo):
+            return not_found
+
+        if not rest:
+            license_id = self.repo_license(owner, repo)
+            data: Any = {
+                "full_name": f"{owner}/{repo}",
+                "default_branch": "main",
+                "license": {"spdx_id": license_id} if license_id else None,
+            }
+        elif rest[0] == "commits":
+            history_path = query.get("path")
+            if history_path and self._path_kind(owner, repo, history_path) is None:
+                data = []
+            else:
+                date = self.commit_date(owner, repo, history_path)
+                data = [{"sha": "0" * 40, "commit": {"committer": {"date": date}}}]
+        elif rest[:2] == ["git", "trees"]:
+            tree = []
+            directories = set()
+            for file_path, content in self.repo_files(owner, repo).items():
+                tree.append(
+                    {
+                        "path": file_path,
+                        "type": "blob",
+                        "sha": blob_sha(content),
+                        "size": len(content),
+                    }
+                )
+                parent = file_path.rpartition("/")[0]
+                while parent:
+                    directories.add(parent)
+                    parent = parent.rpartition("/")[0]
+            tree += [{"path": d, "type": "tree", "sha": "0" * 40} for d in sorted(directories)]
+            data = {"sha": "0" * 40, "tree": tree, "truncated": False}
+        elif rest[0] == "contents":
+            content_path = "/".join(rest[1:])
+            ref = query.get("ref", "main")
+            kind = self._path_kind(owner, repo, content_path)
+            files = self.repo_files(owner, repo)
+            if kind == "file":
+                content = files[content_path]
+                if "raw" in (handler.headers.get("Accept") or ""):
+                    return 200, content, "application/octet-stream"
+                data = self._content_entry(owner, repo, ref, content_path, content)
+            elif kind == "dir":
+                prefix = f"{content_path.rstrip('/')}/" if content_path else ""
+                children: dict[str, dict[str, Any]] = {}
+                for file_path, content in files.items():
+                    if not file_path.startswith(prefix):
+                        continue
+                    name, _, remainder = file_path[len(prefix) :].partition("/")
+                    if remainder:
+                        children.setdefault(
+                            name, {"type": "dir", "name": name, "path": prefix + name}
+                        )
+                    else:
+                        children[name] = self._content_entry(owner, repo, ref, file_path, content)
+                data = list(children.values())
+            else:
+                return not_found
+        else:
+            return not_found
+        return 200, json.dumps(data).encode(), "application/json"
+
+    def _content_entry(
+        self, owner: str, repo: str, ref: str, path: str, content: bytes
+    ) -> dict[str, Any]:
+        return {
+            "type": "file",
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "sha": blob_sha(content),
+            "size": len(content),
+            "download_url": f"{self.raw_url}/{owner}/{repo}/{ref}/{path}",
+        }
+
+    def _graphql(self, handler: BaseHTTPRequestHandler, body: bytes) -> None:
+        if not handler.headers.get("Authorization"):
+            self._send(handler, "POST", 401, b'{"message": "Requires authentication"}')
+            return
+        if self._inject_failure():
+            self._send(handler, "POST", self.failure_status, b'{"message": "Server Error"}')
+            return
+        headers = self._charge("graphql")
+        if headers is None:
+            with self._lock:
+                headers = self._rate_headers("graphql")
+            self._send(
+                handler, "POST", 403, json.dumps(RATE_LIMITED_BODY).encode(), headers=headers
+            )
+            return
+
+        variables = json.loads(body or b"{}").get("variables") or {}
+        data: dict[str, Any] = {}
+        errors = []
+        i = 0
+        while f"owner{i}" in variables:
+            owner, repo = variables[f"owner{i}"], variables[f"name{i}"]
+            alias = f"r{i}"
+            i += 1
+            if not self.repo_exists(owner, repo):
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias], "message": "Not found"})
+                continue
+            history_path = variables.get(f"path{i - 1}")
+            nodes = []
+            if not history_path or self._path_kind(owner, repo, history_path) is not None:
+                nodes = [{"committedDate": self.commit_date(owner, repo, history_path)}]
+            license_id = self.repo_license(owner, repo)
+            repository: dict[str, Any] = {
+                "licenseInfo": {"spdxId": license_id} if license_id else None,
+                "defaultBranchRef": {"target": {"history": {"nodes": nodes}}},
+            }
+            expression = variables.get(f"expr{i - 1}")
+            if expression is not None:
+                object_path = expression.partition(":")[2]
+                kind = self._path_kind(owner, repo, object_path)
+                repository["object"] = (
+                    {"__typename": "Blob" if kind == "file" else "Tree"} if kind else None
+                )
+            data[alias] = repository
+        remaining = int(headers["X-RateLimit-Remaining"])
+        data["rateLimit"] = {"cost": 1, "remaining": remaining}
+        payload: dict[str, Any] = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        self._send(handler, "POST", 200, json.dumps(payload).encode(), headers=headers)
+
+    def _raw(self, handler: BaseHTTPRequestHandler, method: str, path: str) -> None:
+        if self._inject_failure():
+            self._send(handler, method, self.failure_status, b"Server Error", "text/plain")
+            return
+        parts = path.split("/", 3)
+        if len(parts) == 4 and self.repo_exists(parts[0], parts[1]):
+            content = self.repo_files(parts[0], parts[1]).get(parts[3])
+            if content is not None:
+                self._send(handler, method, 200, content, "text/plain; charset=utf-8")
+                return
+        self._send(handler, method, 404, b"404: Not Found", "text/plain")
+
+    def _site(self, handler: BaseHTTPRequestHandler, method: str, path: str) -> None:
+        if self._inject_failure():
+            self._send(handler, method, self.failure_status, b"Server Error", "text/plain")
+            return
+        if path.startswith("/moved/"):
+            location = f"{self.site_url}/{path[len('/moved/') :]}"
+            self._send(handler, method, 301, b"", "text/plain", {"Location": location})
+        elif path.strip("/").startswith(MISSING_PREFIX):
+            self._send(handler, method, 404, b"Not Found", "text/html")
+        else:
+            self._send(handler, method, 200, b"<html><body>ok</body></html>", "text/html")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local mock GitHub server")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per request")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="Units per window")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of failures")
+    args = parser.parse_args()
+
+    server = MockGitHubServer(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        failure_rate=args.failure_rate,
+        port=args.port,
+    )
+    print(f"Mock GitHub serving on {server.base_url}")
+    print(f"  GITHUB_API_URL={server.api_url}")
+    print(f"  GITHUB_RAW_URL={server.raw_url}")
+    print(f"  Websites under {server.site_url}/")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+        print(json.dumps(server.stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+Shared store for THE_RESOURCES_TABLE.csv.
+
+The CSV stays the canonical artifact, but tools no longer parse it into dicts
+and rewrite every row to change one. The store indexes each record's byte span
+by resource ID; patches, appends and reorders are batched and committed in one
+pass that copies untouched records verbatim and serializes only changed rows.
+Every commit writes a temp file and renames it over the table, so an
+interrupted run can never leave a truncated CSV behind.
+
+An optional SQLite sidecar persists the index (position, ID, byte span and row
+data). While it matches the CSV's size and mtime, lookups and patches are
+served from it without parsing the CSV at all; it is rebuilt automatically
+whenever the CSV is edited by hand. Enable it by passing sidecar_path or by
+setting AWESOME_CC_RESOURCE_SIDECAR (see open_resource_store).
+
+Usage:
+    store = ResourceStore("THE_RESOURCES_TABLE.csv")
+    row = store.get("wf-1234abcd")
+    store.patch("wf-1234abcd", {"Active": "FALSE"})
+    store.commit()
+"""
+
+import csv
+import io
+import json
+import os
+import sqlite3
+from collections.abc import Callable
+from typing import Any
+
+ID_FIELD = "ID"
+LINE_TERMINATOR = "\r\n"
+SIDECAR_ENV_VAR = "AWESOME_CC_RESOURCE_SIDECAR"
+DEFAULT_SIDECAR_PATH = ".myob/resources.sqlite"
+COPY_CHUNK_SIZE = 1024 * 1024
+SIDECAR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS resources (
+    position INTEGER PRIMARY KEY,
+    id TEXT,
+    start_offset INTEGER NOT NULL,
+    end_offset INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resources_id ON resources (id);
+"""
+
+
+def open_resource_store(csv_path):
+    """Open a store for csv_path, using the SQLite sidecar if AWESOME_CC_RESOURCE_SIDECAR is set.
+
+    The variable may hold a path, or "1" for the default .myob/resources.sqlite.
+    """
+    sidecar_path = os.environ.get(SIDECAR_ENV_VAR, "").strip() or None
+    if sidecar_path == "1":
+        sidecar_path = DEFAULT_SIDECAR_PATH
+    return ResourceStore(csv_path, sidecar_path=sidecar_path)
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _copy_range(src, dst, start, end):
+    src.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = src.read(min(COPY_CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        dst.write(chunk)
+        remaining -= len(chunk)
+
+
+class ResourceStore:
+    """ID-indexed view of the resource CSV with batched, atomic row-level writes."""
+
+    def __init__(self, csv_path, sidecar_path=None):
+        self.csv_path = str(csv_path)
+        self.sidecar_path = str(sidecar_path) if sidecar_path else None
+        self._fieldnames: list[str] | None = None
+        self._header_end = 0
+        # Full index; None until the CSV (or a fresh sidecar) has been loaded
+        self._spans: list[tuple[int, int]] | None = None
+        self._rows: list[dict[str, Any]] = []
+        self._ids: dict[str, int] = {}
+        self._signature: tuple[int, int] | None = None
+        self._db: sqlite3.Connection | None = None
+        # Pending changes: position -> (start, end, merged row), new rows, new order
+        self._patches: dict[int, tuple[int, int, dict[str, Any]]] = {}
+        self._appends: list[dict[str, Any]] = []
+        self._order: list[int] | None = None
+
+    # --- Loading ---
+
+    def _open_sidecar(self):
+        """Return a connection to a sidecar that matches the CSV, or None."""
+        if not self.sidecar_path or not os.path.exists(self.csv_path):
+            return None
+        if self._db is not None:
+            return self._db
+        directory = os.path.dirname(self.sidecar_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(self.sidecar_path)
+        db.executescript(SIDECAR_SCHEMA)
+        meta = dict(db.execute("SELECT key, value FROM meta").fetchall())
+        signature = _file_signature(self.csv_path)
+        if meta.get("signature") == json.dumps(signature):
+            self._fieldnames = json.loads(meta["fieldnames"])
+            self._header_end = int(meta["header_end"])
+            self._signature = signature
+            self._db = db
+            return db
+        db.close()
+        return None
+
+    def _ensure_loaded(self):
+        """Load the full index, from a fresh sidecar if possible, else by scanning the CSV."""
+        if self._spans is not None:
+            return
+        db = self._open_sidecar()
+        if db is not None:
+            self._spans, self._rows, self._ids = [], [], {}
+            query = "SELECT id, start_offset, end_offset, data FROM resources ORDER BY position"
+            for resource_id, start, end, data in db.execute(query):
+                if resource_id and resource_id not in self._ids:
+                    self._ids[resource_id] = len(self._spans)
+                self._spans.append((start, end))
+                self._rows.append(json.loads(data))
+            return
+        self._scan()
+        if self.sidecar_path:
+            self._write_sidecar()
+
+    def _scan(self):
+        """Parse the CSV once, recording the byte span of every record."""
+        self._spans, self._rows, self._ids = [], [], {}
+        self._fieldnames, self._header_end = None, 0
+        if not os.path.exists(self.csv_path):
+            return
+        self._signature = _file_signature(self.csv_path)
+        with open(self.csv_path, "rb") as f:
+            data = f.read()
+
+        offset = 0
+
+        def lines():
+            nonlocal offset
+            for line in data.splitlines(keepends=True):
+                offset += len(line)
+                yield line.decode("utf-8")
+
+        # csv.reader pulls exactly the lines of one record per step, so `offset`
+        # marks the end of the record just returned
+        reader = csv.reader(lines())
+        header = next(reader, None)
+        if header is None:
+            return
+        self._fieldnames = header
+        self._header_end = start = offset
+        for record in reader:
+            if record:  # blank lines are skipped, like csv.DictReader
+                row = self._make_row(record)
+                resource_id = row.get(ID_FIELD)
+                if resource_id and resource_id not in self._ids:
+                    self._ids[resource_id] = len(self._spans)
+                self._spans.append((start, offset))
+                self._rows.append(row)
+            start = offset
+
+    def _make_row(self, record):
+        """Build a row dict with csv.DictReader semantics (None for missing/extra fields)."""
+        fieldnames = self._fieldnames or []
+        row: dict[Any, Any] = dict(zip(fieldnames, record, strict=False))
+        if len(record) > len(fieldnames):
+            row[None] = record[len(fieldnames) :]
+        for name in fieldnames[len(record) :]:
+            row[name] = None
+        return row
+
+    def _write_sidecar(self):
+        """Rebuild the sidecar from the in-memory index."""
+        assert self._spans is not None
+        if any(None in row for row in self._rows):
+            # Records with more cells than the header cannot round-trip through JSON
+            self._invalidate_sidecar()
+            return
+        if self._db is None:
+            directory = os.path.dirname(self.sidecar_path or "")
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.sidecar_path or "")
+            self._db.executescript(SIDECAR_SCHEMA)
+        with self._db:
+            self._db.execute("DELETE FROM resources")
+            self._db.executemany(
+                "INSERT INTO resources (position, id, start_offset, end_offset, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    (position, row.get(ID_FIELD), start, end, json.dumps(row))
+                    for position, ((start, end), row) in enumerate(
+                        zip(self._spans, self._rows, strict=True)
+                    )
+                ),
+            )
+            self._write_meta()
+
+    def _write_meta(self):
+        assert self._db is not None
+        self._db.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("signature", json.dumps(self._signature)),
+                ("fieldnames", json.dumps(self._fieldnames)),
+                ("header_end", str(self._header_end)),
+            ],
+        )
+
+    def _lookup(self, resource_id):
+        """Return (position, start, end, row) for a resource ID without a full load if possible."""
+        if self._spans is None:
+            db = self._open_sidecar()
+            if db is not None:
+                found = db.execute(
+                    "SELECT position, start_offset, end_offset, data FROM resources "
+                    "WHERE id = ? ORDER BY position LIMIT 1",
+                    (resource_id,),
+                ).fetchone()
+                if found is None:
+                    return None
+                position, start, end, data = found
+                return position, start, end, json.loads(data)
+            self._ensure_loaded()
+        assert self._spans is not None
+        position = self._ids.get(resource_id)
+        if position is None:
+            return None
+        start, end = self._spans[position]
+        return position, start, end, self._rows[position]
+
+    # --- Reading ---
+
+    @property
+    def fieldnames(self):
+        """Header of the table, or None for an empty file."""
+        if self._fieldnames is None and self._spans is None and self._open_sidecar() is None:
+            self._ensure_loaded()
+        return self._fieldnames
+
+    def get(self, resource_id):
+        """Return a copy of the row with this ID (including pending patches), or None."""
+        found = self._lookup(resource_id)
+        if found is None:
+            return None
+        position, _, _, row = found
+        if position in self._patches:
+            row = self._patches[position][2]
+        return dict(row)
+
+    def rows(self):
+        """Return copies of all rows in table order, as csv.DictReader would."""
+        self._ensure_loaded()
+        return [dict(row) for row in self._rows]
+
+    def __len__(self):
+        self._ensure_loaded()
+        assert self._spans is not None
+        return len(self._spans)
+
+    # --- Staging changes ---
+
+    def _check_fields(self, fields):
+        unknown = [name for name in fields if name not in (self.fieldnames or [])]
+        if unknown:
+            raise ValueError(f"Unknown fields for {self.csv_path}: {', '.join(map(str, unknown))}")
+
+    def patch(self, resource_id, fields):
+        """Stage field updates for one resource. Returns False if the ID is not in the table."""
+        self._check_fields(fields)
+        found = self._lookup(resource_id)
+        if found is None:
+            return False
+        position, start, end, row = found
+        pending = self._patches.get(position, (start, end, dict(row)))
+        pending[2].update(fields)
+        self._patches[position] = pending
+        return True
+
+    def patch_rows(self, rows):
+        """Stage patches for rows (as returned by rows()) that differ from the table.
+
+        Only changed rows are re-serialized on commit. Returns the number of rows staged.
+        """
+        self._ensure_loaded()
+        assert self._spans is not None
+        if len(rows) != len(self._rows):
+            raise ValueError("patch_rows expects every row of the table, in table order")
+        staged = 0
+        for position, (old, new) in enumerate(zip(self._rows, rows, strict=True)):
+            if old != new:
+                start, end = self._spans[position]
+                self._patches[position] = (start, end, dict(new))
+                staged += 1
+        return staged
+
+    def append(self, row):
+        """Stage a new row at the end of the table."""
+        if self.fieldnames is None:
+            raise ValueError(f"{self.csv_path} has no header row")
+        self._check_fields(row)
+        self._appends.append(self._normalize(row))
+
+    def reorder(self, key: Callable[[dict[str, Any]], Any]):
+        """Stage a stable reordering of the table's rows by key(row).
+
+        Records are moved byte-for-byte; only patched rows are re-serialized.
+        """
+        self._ensure_loaded()
+        rows = [self._patches[i][2] if i in self._patches else r for i, r in enumerate(self._rows)]
+        self._order = sorted(range(len(rows)), key=lambda i: key(rows[i]))
+
+    # --- Writing ---
+
+    def _normalize(self, row):
+        """Return the row as it reads back once written (every field, missing ones empty)."""
+        return {name: "" if row.get(name) is None else row[name] for name in self._fieldnames or []}
+
+    def _serialize(self, row):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator=LINE_TERMINATOR)
+        writer.writerow(list(self._normalize(row).values()))
+        return buffer.getvalue().encode("utf-8")
+
+    def commit(self, output_path=None):
+        """Atomically write all staged changes (to output_path, default the table itself).
+
+        Returns the number of rows patched or appended.
+        """
+        output_path = str(output_path or self.csv_path)
+        in_place = os.path.abspath(output_path) == os.path.abspath(self.csv_path)
+        if in_place and not (self._patches or self._appends or self._order is not None):
+            return 0
+        if self._signature is not None and _file_signature(self.csv_path) != self._signature:
+            raise RuntimeError(f"{self.csv_path} changed on disk since it was read; re-run")
+
+        changed = len(self._patches) + len(self._appends)
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(self.csv_path, "rb") as src, open(tmp_path, "wb") as dst:
+                if self._order is not None:
+                    new_spans = self._write_reordered(src, dst)
+                else:
+                    shifts, append_spans = self._write_patched(src, dst)
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        if not in_place:
+            self._discard_pending()
+            return changed
+
+        self._signature = _file_signature(self.csv_path)
+        if self._order is not None:
+            self._apply_reorder(new_spans)
+        else:
+            self._apply_patches(shifts, append_spans)
+        self._discard_pending()
+        return changed
+
+    def _write_patched(self, src, dst):
+        """Copy the table, replacing patched records and adding appends.
+
+        Returns ([(position, size delta)] for patched rows in table order,
+        [new byte span] for appended rows).
+        """
+        shifts = []
+        cursor = 0
+        for position in sorted(self._patches):
+            start, end, row = self._patches[position]
+            _copy_range(src, dst, cursor, start)
+            record = self._serialize(row)
+            dst.write(record)
+            shifts.append((position, len(record) - (end - start)))
+            cursor = end
+        src.seek(0, os.SEEK_END)
+        file_end = src.tell()
+        _copy_range(src, dst, cursor, file_end)
+        offset = file_end + sum(size_delta for _, size_delta in shifts)
+        append_spans = []
+        if self._appends:
+            if file_end:
+                src.seek(file_end - 1)
+                if src.read(1) not in (b"\n", b"\r"):
+                    dst.write(LINE_TERMINATOR.encode("utf-8"))
+                    offset += len(LINE_TERMINATOR)
+            for row in self._appends:
+                record = self._serialize(row)
+                dst.write(record)
+                append_spans.append((offset, offset + len(record)))
+                offset += len(record)
+        return shifts, append_spans
+
+    def _write_reordered(self, src, dst):
+        """Write the header, then every record in the staged order, then appends.
+
+        Returns the new byte span of every row (reordered rows, then appends).
+        """
+        assert self._spans is not None and self._order is not None
+        _copy_range(src, dst, 0, self._header_end)
+        offset = self._header_end
+        spans = []
+        for position in self._order:
+            if position in self._patches:
+                record = self._serialize(self._patches[position][2])
+            else:
+                start, end = self._spans[position]
+                src.seek(start)
+                record = src.read(end - start)
+                if not record.endswith((b"\n", b"\r")):
+                    record += LINE_TERMINATOR.encode("utf-8")
+            dst.write(record)
+            spans.append((offset, offset + len(record)))
+            offset += len(record)
+        for row in self._appends:
+            record = self._serialize(row)
+            dst.write(record)
+            spans.append((offset, offset + len(record)))
+            offset += len(record)
+        return spans
+
+    def _apply_patches(self, shifts, append_spans):
+        """Bring the in-memory index and sidecar in line with a patch/append commit."""
+        if self._spans is not None:
+            delta = 0
+            by_position = dict(shifts)
+            for position, (start, end) in enumerate(self._spans):
+                size_delta = by_position.get(position, 0)
+                self._spans[position] = (start + delta, end + delta + size_delta)
+                delta += size_delta
+                if position in self._patches:
+                    self._rows[position] = self._normalize(self._patches[position][2])
+            first_appended = len(self._spans)
+            for span, row in zip(append_spans, self._appends, strict=True):
+                resource_id = row.get(ID_FIELD)
+                if resource_id and resource_id not in self._ids:
+                    self._ids[resource_id] = len(self._spans)
+                self._spans.append(span)
+                self._rows.append(row)
+        if self._db is None:
+            return
+        with self._db:
+            self._db.executemany(
+                "UPDATE resources SET start_offset = ?, end_offset = ? WHERE position = ?",
+                self._shifted_spans([shift for shift in shifts if shift[1]]),
+            )
+            self._db.executemany(
+                "UPDATE resources SET data = ? WHERE position = ?",
+                (
+                    (json.dumps(self._normalize(row)), position)
+                    for position, (_, _, row) in self._patches.items()
+                ),
+            )
+            if self._spans is None:
+                (first_appended,) = self._db.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM resources"
+                ).fetchone()
+            self._db.executemany(
+                "INSERT INTO resources (position, id, start_offset, end_offset, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    (first_appended + i, row.get(ID_FIELD), start, end, json.dumps(row))
+                    for i, ((start, end), row) in enumerate(
+                        zip(append_spans, self._appends, strict=True)
+                    )
+                ),
+            )
+            self._write_meta()
+
+    def _shifted_spans(self, shifts):
+        """Return (start, end, position) for every sidecar row a patch commit moved.
+
+        Offsets are worked out in one pass from the first resized record, so the
+        sidecar is updated with one statement per moved row rather than one range
+        update per patch.
+        """
+        assert self._db is not None
+        if not shifts:
+            return []
+        first = shifts[0][0]
+        if self._spans is not None:
+            # Already shifted in memory; appended rows are inserted separately
+            end = len(self._spans) - len(self._appends)
+            return [
+                (start, stop, position)
+                for position, (start, stop) in enumerate(self._spans[first:end], first)
+            ]
+        by_position = dict(shifts)
+        delta = 0
+        spans = []
+        for position, start, stop in self._db.execute(
+            "SELECT position, start_offset, end_offset FROM resources "
+            "WHERE position >= ? ORDER BY position",
+            (first,),
+        ):
+            size_delta = by_position.get(position, 0)
+            spans.append((start + delta, stop + delta + size_delta, position))
+            delta += size_delta
+        return spans
+
+    def _apply_reorder(self, new_spans):
+        assert self._spans is not None and self._order is not None
+        rows = [
+            self._normalize(self._patches[i][2]) if i in self._patches else self._rows[i]
+            for i in self._order
+        ]
+        rows += self._appends
+        self._spans, self._rows = new_spans, [dict(row) for row in rows]
+        self._ids = {}
+        for position, row in enumerate(self._rows):
+            resource_id = row.get(ID_FIELD)
+            if resource_id and resource_id not in self._ids:
+                self._ids[resource_id] = position
+        if self.sidecar_path:
+            self._write_sidecar()
+
+    def _invalidate_sidecar(self):
+        """Mark the sidecar stale so the next run rebuilds it from the CSV."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self.sidecar_path and os.path.exists(self.sidecar_path):
+            db = sqlite3.connect(self.sidecar_path)
+            with db:
+                db.execute("DELETE FROM meta")
+            db.close()
+
+    def _discard_pending(self):
+        self._patches, self._appends, self._order = {}, [], None
+
+    def close(self):
+        """Close the sidecar connection, if any."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Shared run instrumentation for the pipeline scripts.
+
+Every HTTP response the scripts receive is counted by endpoint through a
+requests response hook, GitHub rate-limit units are tallied, and named phases
+are timed. Set AWESOME_CC_METRICS to a file path (or "-" for stderr) and the
+collected metrics are written as JSON when the script exits:
+
+    AWESOME_CC_METRICS=.myob/metrics.json python scripts/validate_links.py
+
+The report contains wall time per phase, request counts and time by endpoint,
+rate-limit units consumed per resource ("core", "graphql") and peak memory
+(peak RSS, plus the tracemalloc peak when run with PYTHONTRACEMALLOC=1).
+benchmark_pipeline.py collects these reports to catch regressions.
+
+Usage in a script:
+    from run_metrics import METRICS, instrument_session
+
+    session = instrument_session(requests.Session())
+    with METRICS.phase("validate"):
+        ...
+    METRICS.count("rows_validated", processed)
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+try:
+    from github_endpoints import GITHUB_API_URL, GITHUB_RAW_URL  # type: ignore[import-not-found]
+except ImportError:
+    # Fallback for when running as a module
+    from .github_endpoints import GITHUB_API_URL, GITHUB_RAW_URL
+
+METRICS_ENV = "AWESOME_CC_METRICS"
+
+# REST paths (relative to the API base) grouped into endpoint templates
+API_ROUTES = [
+    (re.compile(r"^/repos/[^/]+/[^/]+/?$"), "/repos/{owner}/{repo}"),
+    (re.compile(r"^/repos/[^/]+/[^/]+/contents(/.*)?$"), "/repos/{owner}/{repo}/contents/{path}"),
+    (re.compile(r"^/repos/[^/]+/[^/]+/commits/?$"), "/repos/{owner}/{repo}/commits"),
+    (re.compile(r"^/repos/[^/]+/[^/]+/git/trees/.+$"), "/repos/{owner}/{repo}/git/trees/{ref}"),
+    (re.compile(r"^/gists/[^/]+/?$"), "/gists/{gist_id}"),
+    (re.compile(r"^/rate_limit/?$"), "/rate_limit"),
+    (re.compile(r"^/graphql/?$"), "/graphql"),
+]
+# Endpoints that never draw from the core rate limit (GraphQL cost is reported separately)
+UNMETERED_ENDPOINTS = {"/rate_limit", "/graphql"}
+
+
+def classify_endpoint(
+    method: str, url: str, api_url: str = GITHUB_API_URL, raw_url: str = GITHUB_RAW_URL
+) -> tuple[str, bool]:
+    """
+    Name the endpoint a request went to, e.g. "GET /repos/{owner}/{repo}/commits".
+    Returns (name, is_github_api). Raw file downloads are grouped as one endpoint
+    and other sites by hostname.
+    """
+    if url.startswith(raw_url + "/"):
+        raw = urlsplit(raw_url)
+        return f"{method} {raw.hostname}{raw.path}/{{owner}}/{{repo}}/{{ref}}/{{path}}", False
+    if url.startswith(api_url + "/"):
+        path = urlsplit(url).path[len(urlsplit(api_url).path) :]
+        for pattern, template in API_ROUTES:
+            if pattern.match(path):
+                return f"{method} {template}", True
+        return f"{method} {path}", True
+    return f"{method} {urlsplit(url).hostname or url}", False
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """Return True if GitHub rejected the request because the rate limit is exhausted."""
+    return (
+        response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+
+def core_units(endpoint: str, response: requests.Response) -> int:
+    """
+    Core rate-limit units a GitHub REST response cost: one per request, except
+    304 revalidations, rate-limit rejections and the unmetered endpoints.
+    """
+    if endpoint.split(" ", 1)[1] in UNMETERED_ENDPOINTS:
+        return 0
+    if response.status_code == 304 or is_rate_limited(response):
+        return 0
+    return 1
+
+
+def peak_memory() -> dict[str, int | None]:
+    """Peak resident set size of this process and, if tracemalloc is tracing, its peak."""
+    peak_rss = None
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        peak_rss = max_rss if sys.platform == "darwin" else max_rss * 1024
+    peak_traced = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+    return {"peak_rss_bytes": peak_rss, "peak_traced_bytes": peak_traced}
+
+
+class RunMetrics:
+    """Thread-safe collector for one script run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.endpoints: dict[str, dict[str, Any]] = {}
+        self.rate_limit_units: dict[str, int] = {}
+        self.counters: dict[str, int] = {}
+        self.github_api_requests = 0
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block; repeated phases with the same name accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def record_response(self, response: requests.Response) -> None:
+        """Count one HTTP response (every redirect hop is its own request)."""
+        request = response.request
+        method = (request.method if request is not None else None) or "GET"
+        url = (request.url if request is not None else None) or response.url or ""
+        endpoint, is_github_api = classify_endpoint(method, url)
+        units = core_units(endpoint, response) if is_github_api else 0
+        with self._lock:
+            entry = self.endpoints.setdefault(
+                endpoint, {"requests": 0, "seconds": 0.0, "status": {}}
+            )
+            entry["requests"] += 1
+            entry["seconds"] += response.elapsed.total_seconds()
+            status = str(response.status_code)
+            entry["status"][status] = entry["status"].get(status, 0) + 1
+            if is_github_api:
+                self.github_api_requests += 1
+            if units:
+                self.rate_limit_units["core"] = self.rate_limit_units.get("core", 0) + units
+
+    def add_rate_limit_units(self, resource_name: str, units: int) -> None:
+        """Record units reported by the API itself (e.g. GraphQL query cost)."""
+        with self._lock:
+            self.rate_limit_units[resource_name] = (
+                self.rate_limit_units.get(resource_name, 0) + units
+            )
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a script-specific counter (rows processed, files downloaded, ...)."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def total_rate_limit_units(self) -> int:
+        with self._lock:
+            return sum(self.rate_limit_units.values())
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the metrics collected so far as a JSON-serializable dict."""
+        with self._lock:
+            endpoints = {
+                name: {
+                    **entry,
+                    "seconds": round(entry["seconds"], 6),
+                    "status": dict(entry["status"]),
+                }
+                for name, entry in sorted(self.endpoints.items())
+            }
+            return {
+                "script": os.path.basename(sys.argv[0]) if sys.argv else "",
+                "wall_seconds": round(time.perf_counter() - self.started, 6),
+                "phases": {name: round(seconds, 6) for name, seconds in self.phases.items()},
+                "http": {
+                    "requests": sum(entry["requests"] for entry in endpoints.values()),
+                    "github_api_requests": self.github_api_requests,
+                    "by_endpoint": endpoints,
+                },
+                "rate_limit_units": dict(sorted(self.rate_limit_units.items())),
+                "counters": dict(sorted(self.counters.items())),
+                "memory": peak_memory(),
+            }
+
+    def write(self, destination: str) -> None:
+        """Write the snapshot as JSON to a file path, or to stderr for "-"."""
+        report = json.dumps(self.snapshot(), indent=2)
+        if destination == "-":
+            print(report, file=sys.stderr)
+            return
+        directory = os.path.dirname(destination)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{destination}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(report)
+        os.replace(tmp_path, destination)
+
+
+METRICS = RunMetrics()
+
+
+def response_hook(response: requests.Response, *args: Any, **kwargs: Any) -> None:
+    """requests response hook that records every response in METRICS."""
+    METRICS.record_response(response)
+
+
+def instrument_session(session: requests.Session) -> requests.Session:
+    """Attach the metrics hook to a session (idempotent) and return it."""
+    hooks = session.hooks.setdefault("response", [])
+    if response_hook not in hooks:
+        hooks.append(response_hook)
+    return session
+
+
+if os.getenv(METRICS_ENV):
+    atexit.register(METRICS.write, os.environ[METRICS_ENV])
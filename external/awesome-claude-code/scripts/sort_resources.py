@@ -6,7 +6,6 @@ This utility ensures resources are properly ordered for consistent presentation
 in the generated README and other outputs.
 """
 
-import csv
 import sys
 from pathlib import Path
 
@@ -17,6 +16,8 @@ def sort_resources(csv_path: Path) -> None:
     # Load category order from category_utils
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from scripts.category_utils import category_manager
+    from scripts.resource_store import open_resource_store
+    from scripts.run_metrics import METRICS
 
     category_order = []
     categories = []
@@ -40,10 +41,10 @@ def sort_resources(csv_path: Path) -> None:
             }
 
     # Read the CSV data
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames
-        rows = list(reader)
+    with METRICS.phase("load"):
+        store = open_resource_store(csv_path)
+        headers = store.fieldnames
+        rows = store.rows()
 
     # Sort the rows
     # First by Category (using custom order), then by Sub-Category
@@ -61,21 +62,22 @@ def sort_resources(csv_path: Path) -> None:
         # If no sort map, fall back to alphabetical
         return 997  # Categories without defined subcategory order
 
-    sorted_rows = sorted(
-        rows,
-        key=lambda row: (
+    def resource_sort_key(row):
+        return (
             category_sort_map.get(row.get("Category", ""), 999),  # Unknown categories sort last
             subcategory_sort_key(row.get("Category", ""), row.get("Sub-Category", "")),
             row.get("Display Name", "").lower(),
-        ),
-    )
+        )
+
+    with METRICS.phase("sort"):
+        sorted_rows = sorted(rows, key=resource_sort_key)
 
-    # Write the sorted data back
-    with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        if headers:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(sorted_rows)
+    # Write the sorted data back (records are moved as-is, atomically)
+    if headers:
+        with METRICS.phase("write"):
+            store.reorder(resource_sort_key)
+            store.commit()
+    METRICS.count("resources_sorted", len(sorted_rows))
 
     print(f"✓ Sorted {len(sorted_rows)} resources in {csv_path}")
 
@@ -8,26 +8,74 @@ Features:
 - Supports GitHub API for repository URLs with license detection
 - Fetches last modified dates for GitHub resources using Commits API
 - Implements exponential backoff retry logic
+- Persistent ETag cache for GitHub API responses (304 revalidations are free)
+- Optional GraphQL backend that batches existence, license and last-commit lookups
+- Scheduled mode that validates the stalest rows first within a time or API budget
+- Optional concurrent mode with pooled keep-alive sessions, per-host caps and a
+  shared GitHub rate-limit budget
 - Respects field overrides from resource-overrides.yaml
 - Updates CSV with Active status, Last Checked timestamp, and Last Modified date
+  (only changed rows are rewritten, atomically, via resource_store.py)
 - Provides detailed logging and broken link summary
+- Reports the GitHub API requests actually sent and rate-limit units consumed
+  (phase timings and per-endpoint counts are available via run_metrics.py)
 - GitHub Action mode for CI/CD integration
 """
 
 import argparse
-import csv
 import json
 import logging
 import os
 import random
 import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlparse
 
 import requests
 import yaml  # type: ignore[import-untyped]
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+try:
+    from github_cache import DEFAULT_CACHE_DIR, GitHubResponseCache  # type: ignore[import-not-found]
+    from github_endpoints import GITHUB_API_URL, is_github_api_url  # type: ignore[import-not-found]
+    from github_graphql import (  # type: ignore[import-not-found]
+        GitHubGraphQLFetcher,
+        chunk_targets,
+        target_key,
+    )
+    from resource_store import open_resource_store  # type: ignore[import-not-found]
+    from run_metrics import METRICS, instrument_session  # type: ignore[import-not-found]
+    from validation_scheduler import (  # type: ignore[import-not-found]
+        DEFAULT_STATE_FILE,
+        apply_api_budget,
+        load_schedule_state,
+        order_by_priority,
+        prune_state,
+        record_result,
+        save_schedule_state,
+    )
+except ImportError:
+    # Fallback for when running as a module
+    from .github_cache import DEFAULT_CACHE_DIR, GitHubResponseCache
+    from .github_endpoints import GITHUB_API_URL, is_github_api_url
+    from .github_graphql import GitHubGraphQLFetcher, chunk_targets, target_key
+    from .resource_store import open_resource_store
+    from .run_metrics import METRICS, instrument_session
+    from .validation_scheduler import (
+        DEFAULT_STATE_FILE,
+        apply_api_budget,
+        load_schedule_state,
+        order_by_priority,
+        prune_state,
+        record_result,
+        save_schedule_state,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -50,9 +98,137 @@ HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/vnd.github+json"}
 if GITHUB_TOKEN:
     HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
 
+# Connection pooling / concurrency settings
+MAX_CONNECTIONS_PER_HOST = 8
+
 PRINT_FILE = None
 
 
+class GitHubRateLimiter:
+    """Shared X-RateLimit-Remaining budget for all GitHub API requests.
+
+    Every request to the GitHub API draws from one budget. When the budget is
+    exhausted (or GitHub answers with a rate-limit 403), the whole pool pauses
+    once until the reset time instead of each worker sleeping on its own.
+
+    The server's count is authoritative: each response resets the budget to it,
+    less the requests still in flight. Conditional requests answered with 304
+    are not charged by GitHub, so they leave the budget where it was.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.remaining: int | None = None
+        self.reset_at = 0.0
+        self._announced_reset = 0.0
+        self._in_flight = 0
+
+    def acquire(self):
+        """Block until the budget allows another request, then consume one unit."""
+        with self._cond:
+            while self.remaining is not None and self.remaining <= 0:
+                wait_time = self.reset_at - time.time()
+                if wait_time <= 0:
+                    # Reset has passed; the next response will refresh the budget
+                    self.remaining = None
+                    break
+                if self._announced_reset != self.reset_at:
+                    self._announced_reset = self.reset_at
+                    print(f"GitHub rate limit hit. Sleeping for {int(wait_time)} seconds...")
+                self._cond.wait(wait_time)
+            self._in_flight += 1
+            if self.remaining is not None:
+                self.remaining -= 1
+
+    def release(self):
+        """Return the slot of a request that failed without a response."""
+        with self._cond:
+            self._in_flight = max(self._in_flight - 1, 0)
+
+    def update(self, response):
+        """Refresh the budget from a GitHub API response's rate-limit headers."""
+        self.release()
+        remaining_header = response.headers.get("X-RateLimit-Remaining")
+        if remaining_header is None:
+            return
+        try:
+            remaining = int(remaining_header)
+            # Sleep one extra second past the reset, as the serial path always did
+            reset_at = float(response.headers.get("X-RateLimit-Reset", 0)) + 1
+        except ValueError:
+            return
+        with self._cond:
+            # Requests still in flight may be charged after this response was counted
+            self.remaining = remaining - self._in_flight
+            self.reset_at = reset_at
+            self._cond.notify_all()
+
+
+RATE_LIMITER = GitHubRateLimiter()
+
+# Conditional-request cache for GitHub API GETs; enabled by main() unless --no-cache
+RESPONSE_CACHE: GitHubResponseCache | None = None
+
+_thread_local = threading.local()
+_host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return this thread's pooled keep-alive session."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONNECTIONS_PER_HOST, pool_maxsize=MAX_CONNECTIONS_PER_HOST
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = instrument_session(session)
+    return session
+
+
+def _host_semaphore(host: str) -> threading.BoundedSemaphore:
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST)
+        return _host_semaphores[host]
+
+
+def http_request(method, url, **kwargs) -> requests.Response:
+    """
+    Issue an HTTP request through the pooled session.
+    Caps concurrent requests per host and draws GitHub API calls from the shared budget.
+    """
+    kwargs.setdefault("headers", HEADERS)
+    kwargs.setdefault("timeout", 10)
+    if RESPONSE_CACHE is not None and method == "GET" and is_github_api_url(url):
+        return RESPONSE_CACHE.get(
+            url,
+            lambda headers: _send_request(method, url, **{**kwargs, "headers": headers}),
+            headers=kwargs["headers"],
+            params=kwargs.get("params"),
+        )
+    return _send_request(method, url, **kwargs)
+
+
+def _send_request(method, url, **kwargs) -> requests.Response:
+    host = urlparse(url).netloc
+    is_github_api = is_github_api_url(url)
+    if is_github_api:
+        RATE_LIMITER.acquire()
+    try:
+        with _host_semaphore(host):
+            response = get_session().request(method, url, **kwargs)
+    except requests.exceptions.RequestException:
+        if is_github_api:
+            RATE_LIMITER.release()
+        raise
+    if is_github_api:
+        RATE_LIMITER.update(response)
+    return response
+
+
 def load_overrides():
     """Load override configuration from YAML file."""
     if not os.path.exists(OVERRIDE_FILE):
@@ -111,6 +287,44 @@ def apply_overrides(row, overrides):
     return row, locked_fields, skip_validation
 
 
+def split_branch_and_path(branch_and_path: str) -> tuple[str, str]:
+    """
+    Split the part of a GitHub blob/tree URL after /blob/ or /tree/ into (branch, path).
+    Branch names may contain slashes, so the path start is detected heuristically.
+    """
+    # Split on the first occurrence of a path starting with . or containing a file extension
+    # Common patterns: .github/, .claude/, src/, file.ext
+    parts = branch_and_path.split("/")
+
+    # Find where the file path likely starts
+    branch_parts = []
+    path_parts: list[str] = []
+    found_path_start = False
+
+    for i, part in enumerate(parts):
+        if not found_path_start:
+            # Check if this looks like the start of a file path
+            if (
+                part.startswith(".")  # Hidden directories like .github, .claude
+                or "." in part  # Files with extensions
+                or part in ["src", "lib", "bin", "scripts", "docs", "test", "tests"]
+            ):  # Common directories
+                found_path_start = True
+                path_parts = parts[i:]
+            else:
+                branch_parts.append(part)
+
+    # If we didn't find an obvious path start, treat the last part as the path
+    if not path_parts and parts:
+        branch_parts = parts[:-1] if len(parts) > 1 else parts
+        path_parts = parts[-1:] if len(parts) > 1 else []
+
+    branch = "/".join(branch_parts) if branch_parts else "main"
+    path = "/".join(path_parts)
+
+    return branch, path
+
+
 def parse_github_url(url) -> tuple[str, bool, str | None, str | None]:
     """
     Parse GitHub URL and return API endpoint if it's a GitHub repository content URL.
@@ -125,41 +339,11 @@ def parse_github_url(url) -> tuple[str, bool, str | None, str | None]:
     if match:
         owner, repo, _, branch_and_path = match.groups()  # _ is blob_or_tree, which we don't need
 
-        # Split on the first occurrence of a path starting with . or containing a file extension
-        # Common patterns: .github/, .claude/, src/, file.ext
-        parts = branch_and_path.split("/")
-
-        # Find where the file path likely starts
-        branch_parts = []
-        path_parts: list[str] = []
-        found_path_start = False
-
-        for i, part in enumerate(parts):
-            if not found_path_start:
-                # Check if this looks like the start of a file path
-                if (
-                    part.startswith(".")  # Hidden directories like .github, .claude
-                    or "." in part  # Files with extensions
-                    or part in ["src", "lib", "bin", "scripts", "docs", "test", "tests"]
-                ):  # Common directories
-                    found_path_start = True
-                    path_parts = parts[i:]
-                else:
-                    branch_parts.append(part)
-
-        # If we didn't find an obvious path start, treat the last part as the path
-        if not path_parts and parts:
-            branch_parts = parts[:-1] if len(parts) > 1 else parts
-            path_parts = parts[-1:] if len(parts) > 1 else []
-
-        branch = "/".join(branch_parts) if branch_parts else "main"
-        path = "/".join(path_parts)
+        branch, path = split_branch_and_path(branch_and_path)
 
         # URL-encode the branch name to handle slashes
         encoded_branch = quote(branch, safe="")
-        api_url = (
-            f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={encoded_branch}"
-        )
+        api_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{path}?ref={encoded_branch}"
         return api_url, True, owner, repo
 
     # Check if it's a repository root URL
@@ -167,17 +351,22 @@ def parse_github_url(url) -> tuple[str, bool, str | None, str | None]:
     match = re.match(github_repo_pattern, url)
     if match:
         owner, repo = match.groups()
-        api_url = f"https://api.github.com/repos/{owner}/{repo}"
+        api_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}"
         return api_url, True, owner, repo
 
     return url, False, None, None
 
 
+def uses_github_api(url):
+    """Return True if validate_url checks this URL through the GitHub API."""
+    return parse_github_url(url.strip())[1]
+
+
 def get_github_license(owner, repo):
     """Fetch license information from GitHub API."""
-    api_url = f"https://api.github.com/repos/{owner}/{repo}"
+    api_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}"
     try:
-        response = requests.get(api_url, headers=HEADERS, timeout=10)
+        response = http_request("GET", api_url)
         if response.status_code == 200:
             data = response.json()
             license_info = data.get("license")
@@ -196,7 +385,10 @@ def get_committer_date_from_response(
     if isinstance(data, list) and len(data) > 0:
         # Get the committer date from the latest commit
         commit = data[0]
-        commit_date = commit.get("committer", {}).get("date")
+        # The git committer lives under "commit"; the top-level "committer" is the GitHub user
+        commit_date = (commit.get("commit") or {}).get("committer", {}).get("date")
+        if not commit_date:
+            commit_date = (commit.get("committer") or {}).get("date")
         return commit_date
     return None
 
@@ -212,9 +404,9 @@ def format_commit_date(commit_date: str) -> str:
 def get_github_last_modified(owner, repo, path=None):
     """Fetch last modified date for a GitHub file or repository."""
     try:
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/commits"
+        api_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits"
         params = {"per_page": 1, "path": path} if path else {"per_page": 1}
-        response = requests.get(api_url, headers=HEADERS, params=params, timeout=10)
+        response = http_request("GET", api_url, params=params)
         if response.status_code == 200:
             commit_date = get_committer_date_from_response(response)
             if commit_date:
@@ -238,18 +430,20 @@ def validate_url(url, max_retries=5):
     for attempt in range(max_retries):
         try:
             if is_github:
-                response = requests.get(api_url, headers=HEADERS, timeout=10)
+                response = http_request("GET", api_url)
             else:
-                response = requests.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
+                response = http_request("HEAD", url, allow_redirects=True)
 
-            # Check if we hit GitHub rate limit
+            # Check if we hit GitHub rate limit. The shared limiter has already recorded
+            # the reset time, so the retry blocks (with every other worker) until then.
             if response.status_code == 403 and "X-RateLimit-Remaining" in response.headers:
                 remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
                 if remaining == 0:
-                    reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-                    sleep_time = max(reset_time - int(time.time()), 0) + 1
-                    print(f"GitHub rate limit hit. Sleeping for {sleep_time} seconds...")
-                    time.sleep(sleep_time)
+                    if not is_github:
+                        reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+                        sleep_time = max(reset_time - int(time.time()), 0) + 1
+                        print(f"Rate limit hit. Sleeping for {sleep_time} seconds...")
+                        time.sleep(sleep_time)
                     continue
 
             # Success cases
@@ -298,25 +492,187 @@ def validate_url(url, max_retries=5):
     return False, "Max retries exceeded", None, None
 
 
-def validate_links(csv_file, max_links=None, ignore_overrides=False):
+def graphql_target(url):
+    """
+    Describe the GraphQL lookup equivalent to validate_url's REST calls for a URL.
+    Returns None for URLs the GraphQL backend cannot express (non-repository URLs).
+    """
+    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/(blob|tree)/(.+)", url)
+    if match:
+        owner, repo, blob_or_tree, branch_and_path = match.groups()
+        branch, path = split_branch_and_path(branch_and_path)
+        # Mirror validate_url: only blob URLs get a path-scoped last-commit lookup
+        history_path = None
+        file_match = re.match(r"[^/]+/(.+)", branch_and_path)
+        if blob_or_tree == "blob" and file_match:
+            history_path = file_match.group(1)
+        return {
+            "owner": owner,
+            "repo": repo,
+            "expression": f"{branch}:{path}",
+            "history_path": history_path,
+        }
+
+    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/?$", url)
+    if match:
+        owner, repo = match.groups()
+        return {"owner": owner, "repo": repo, "expression": None, "history_path": None}
+
+    return None
+
+
+def fetch_graphql_results(urls, fetcher):
+    """
+    Resolve as many URLs as possible with batched GraphQL queries.
+    Returns {url: validate_url-style result}; unresolved URLs are left for REST.
+    """
+    targets = {}
+    for url in urls:
+        target = graphql_target(url.strip()) if url else None
+        if target:
+            targets[url] = target
+
+    metadata = fetcher.fetch(list(targets.values()))
+
+    results = {}
+    for url, target in targets.items():
+        info = metadata.get(target_key(target))
+        if info is None:
+            continue
+        if not info["exists"]:
+            print(f"Client error 404 Not Found for URL: {url}")
+            results[url] = (False, 404, None, None)
+            continue
+        last_modified = None
+        if info["committed_date"]:
+            last_modified = format_commit_date(info["committed_date"])
+        results[url] = (True, 200, info["license"], last_modified)
+    return results
+
+
+def graphql_batches(urls, fetcher):
+    """
+    Split the GraphQL lookups for urls into the fetcher's query-sized chunks.
+    Returns [(index, chunk_urls)] in order, where index is the position of the
+    first URL in urls that needs the chunk.
+    """
+    targets = {}
+    first_index = {}
+    urls_by_key: dict[tuple, list[str]] = {}
+    for index, url in enumerate(urls):
+        target = graphql_target(url.strip()) if url else None
+        if target:
+            key = target_key(target)
+            targets.setdefault(key, target)
+            first_index.setdefault(key, index)
+            urls_by_key.setdefault(key, []).append(url)
+
+    batches = []
+    for chunk in chunk_targets(list(targets.values()), fetcher.max_aliases, fetcher.max_nodes):
+        keys = [target_key(target) for target in chunk]
+        batches.append((first_index[keys[0]], [url for key in keys for url in urls_by_key[key]]))
+    return batches
+
+
+def run_validations(urls, concurrency=1, graphql_fetcher=None, deadline=None):
+    """
+    Validate URLs, yielding validate_url results in input order.
+    With concurrency > 1 the URLs are checked by a thread pool sharing pooled
+    sessions and the GitHub rate-limit budget. With a GraphQL fetcher, GitHub
+    repository URLs are resolved in batches and only the rest use REST.
+    With a deadline (time.monotonic() value), no new URL or GraphQL query is
+    started after it passes and the results stop short.
+    """
+    batches = deque(graphql_batches(urls, graphql_fetcher) if graphql_fetcher else [])
+    prefetched = {}
+
+    def prefetch_through(index):
+        # Each query runs just before the first URL that needs it, so the
+        # deadline bounds the GraphQL prefetch as well as validation
+        while batches and batches[0][0] <= index:
+            prefetched.update(fetch_graphql_results(batches.popleft()[1], graphql_fetcher))
+
+    def validate(url):
+        if url in prefetched:
+            return prefetched[url]
+        return validate_url(url)
+
+    def before_deadline():
+        return deadline is None or time.monotonic() < deadline
+
+    if deadline is None:
+        prefetch_through(len(urls))
+
+    if concurrency <= 1:
+        for index, url in enumerate(urls):
+            if before_deadline():
+                prefetch_through(index)
+            if not before_deadline():
+                return
+            yield validate(url)
+        return
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        if deadline is None:
+            yield from executor.map(validate, urls)
+            return
+
+        # Keep a bounded window in flight so nothing new starts after the deadline
+        remaining = enumerate(urls)
+        in_flight: deque = deque()
+
+        def fill():
+            while len(in_flight) < concurrency and before_deadline():
+                index, url = next(remaining, (None, None))
+                if index is None:
+                    return
+                prefetch_through(index)
+                if not before_deadline():
+                    return
+                in_flight.append(executor.submit(validate, url))
+
+        fill()
+        while in_flight:
+            yield in_flight.popleft().result()
+            fill()
+
+
+def validate_links(
+    csv_file,
+    max_links=None,
+    ignore_overrides=False,
+    concurrency=1,
+    backend="rest",
+    schedule=False,
+    time_budget=None,
+    api_budget=None,
+    schedule_state_file=DEFAULT_STATE_FILE,
+):
     """
     Validate links in the CSV file and update the Active status and timestamp.
+
+    In scheduled mode (implied by a time or API budget) rows are validated in
+    priority order - stalest, recently failing and frequently changing first -
+    and only as many as fit the budget; the rest are deferred to later runs.
     """
-    # Load overrides
-    overrides = {} if ignore_overrides else load_overrides()
+    schedule = schedule or time_budget is not None or api_budget is not None
+    # GitHub API usage is measured from the requests actually sent during this run
+    api_requests_before = METRICS.github_api_requests
+    rate_limit_units_before = METRICS.total_rate_limit_units()
 
-    # Read the CSV file
-    with open(csv_file, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = reader.fieldnames
+    with METRICS.phase("load"):
+        # Load overrides
+        overrides = {} if ignore_overrides else load_overrides()
+
+        # Read the CSV file
+        store = open_resource_store(csv_file)
+        rows = store.rows()
 
     total_resources = len(rows)
     processed = 0
     broken_links = []
     newly_broken_links = []  # Track newly discovered broken links
     github_links = 0
-    github_api_calls = 0
     override_count = 0
     locked_field_count = 0
     last_modified_updates = 0
@@ -324,98 +680,147 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
     print(f"Starting validation of {total_resources} resources...")
     if overrides and not ignore_overrides:
         print(f"Loaded {len(overrides)} resource overrides")
+    if concurrency > 1:
+        print(f"Validating with {concurrency} concurrent workers")
 
-    for _, row in enumerate(rows):
-        if max_links and processed >= max_links:
-            print(f"\nReached maximum link limit ({max_links}). Stopping validation.")
-            break
-
-        # Apply overrides
-        row, locked_fields, skip_validation = apply_overrides(row, overrides)
-        if locked_fields:
-            override_count += 1
-            locked_field_count += len(locked_fields)
+    graphql_fetcher = None
+    if backend == "graphql":
+        if GITHUB_TOKEN:
+            graphql_fetcher = GitHubGraphQLFetcher(GITHUB_TOKEN)
+        else:
+            print("GraphQL backend requires GITHUB_TOKEN; falling back to REST")
+
+    with METRICS.phase("select"):
+        # Select the rows to validate (overrides are applied before any network access)
+        pending = []
+        for row in rows:
+            if max_links and not schedule and len(pending) >= max_links:
+                print(f"\nReached maximum link limit ({max_links}). Stopping validation.")
+                break
+
+            # Apply overrides
+            row, locked_fields, skip_validation = apply_overrides(row, overrides)
+            if locked_fields:
+                override_count += 1
+                locked_field_count += len(locked_fields)
+
+            # Skip entire validation if skip_validation is true
+            if skip_validation:
+                print(f"Skipping {row['Display Name']} - validation disabled by override")
+                continue
 
-        # Skip entire validation if skip_validation is true
-        if skip_validation:
-            print(f"Skipping {row['Display Name']} - validation disabled by override")
-            continue
+            # Skip validation for locked fields
+            if "active" in locked_fields and "last_checked" in locked_fields:
+                print(f"Skipping {row['Display Name']} - fields locked by override")
+                continue
 
-        # Skip validation for locked fields
-        if "active" in locked_fields and "last_checked" in locked_fields:
-            print(f"Skipping {row['Display Name']} - fields locked by override")
-            continue
+            primary_url = row.get(PRIMARY_LINK_HEADER_NAME, "").strip()
+            # Ignoring secondary URLs:
+            # secondary_url = row.get(SECONDARY_LINK_HEADER_NAME, "").strip()
+            pending.append((row, locked_fields, primary_url))
+
+        deadline = None
+        if schedule:
+            schedule_state = load_schedule_state(schedule_state_file)
+            candidates = len(pending)
+            pending = order_by_priority(pending, schedule_state, datetime.now())
+            if max_links:
+                pending = pending[:max_links]
+            if api_budget is not None:
+                pending = apply_api_budget(
+                    pending,
+                    api_budget,
+                    uses_github_api,
+                    backend="graphql" if graphql_fetcher else "rest",
+                )
+            if time_budget is not None:
+                deadline = time.monotonic() + time_budget
+            print(f"Scheduled {len(pending)} of {candidates} resources by revalidation priority")
+
+    with METRICS.phase("validate"):
+        results = run_validations(
+            [primary_url for _, _, primary_url in pending], concurrency, graphql_fetcher, deadline
+        )
 
-        primary_url = row.get(PRIMARY_LINK_HEADER_NAME, "").strip()
-        # secondary_url = row.get(SECONDARY_LINK_HEADER_NAME, "").strip()  # Ignoring secondary URLs
-
-        # Track GitHub links
-        if "github.com" in primary_url:
-            github_links += 1
-
-        # Validate primary URL
-        primary_valid, primary_status, license_info, last_modified = validate_url(primary_url)
-
-        # Update license if found and not locked
-        if license_info and "license" not in locked_fields:
-            row[LICENSE_HEADER_NAME] = license_info
-            github_api_calls += 1
-
-        # Update last modified if found and not locked
-        if last_modified and "last_modified" not in locked_fields:
-            row[LAST_MODIFIED_HEADER_NAME] = last_modified
-            github_api_calls += 1
-            last_modified_updates += 1
-
-        # Validate secondary URL if present
-        # secondary_valid = True
-        # if secondary_url:
-        #     secondary_valid, _, _, _ = validate_url(secondary_url)  # Ignoring secondary URLs
-
-        # Check previous status before updating
-        was_active = row.get(ACTIVE_HEADER_NAME, "TRUE").upper() == "TRUE"
-        # Update Active status if not locked
-        if "active" not in locked_fields:
-            # is_active = primary_valid and secondary_valid  # Original logic included secondary URL
-            is_active = primary_valid  # Now only depends on primary URL validity
-            row[ACTIVE_HEADER_NAME] = "TRUE" if is_active else "FALSE"
-        else:
-            is_active = row[ACTIVE_HEADER_NAME].upper() == "TRUE"
-
-        # Update timestamp if not locked
-        if "last_checked" not in locked_fields:
-            row[LAST_CHECKED_HEADER_NAME] = datetime.now().strftime("%Y-%m-%d:%H-%M-%S")
-
-        # Track broken links
-        if not is_active and "active" not in locked_fields:
-            link_info = {
-                "name": row.get("Display Name", "Unknown"),
-                "primary_url": primary_url,
-                "primary_status": primary_status,
-                # "secondary_url": secondary_url if not secondary_valid else None,
-                # No longer tracking secondary URLs
-            }
-            broken_links.append(link_info)
-
-            # Check if this is a newly discovered broken link
-            if was_active:
-                newly_broken_links.append(link_info)
-                print(f"❌ NEW: {row.get('Display Name', 'Unknown')}: {primary_status}")
+        # Results are consumed in order so output matches the serial path exactly;
+        # a time budget may end the results before every pending row is validated
+        for (row, locked_fields, primary_url), result in zip(pending, results, strict=False):
+            # Track GitHub links
+            if "github.com" in primary_url:
+                github_links += 1
+
+            # Validate primary URL
+            primary_valid, primary_status, license_info, last_modified = result
+
+            # Update license if found and not locked
+            if license_info and "license" not in locked_fields:
+                row[LICENSE_HEADER_NAME] = license_info
+
+            # Update last modified if found and not locked
+            if last_modified and "last_modified" not in locked_fields:
+                row[LAST_MODIFIED_HEADER_NAME] = last_modified
+                last_modified_updates += 1
+
+            # Validate secondary URL if present
+            # secondary_valid = True
+            # if secondary_url:
+            #     secondary_valid, _, _, _ = validate_url(secondary_url)  # Ignoring secondary URLs
+
+            # Check previous status before updating
+            was_active = row.get(ACTIVE_HEADER_NAME, "TRUE").upper() == "TRUE"
+            # Update Active status if not locked
+            if "active" not in locked_fields:
+                # Original logic included secondary URL:
+                # is_active = primary_valid and secondary_valid
+                is_active = primary_valid  # Now only depends on primary URL validity
+                row[ACTIVE_HEADER_NAME] = "TRUE" if is_active else "FALSE"
             else:
-                print(f"Already broken: {row.get('Display Name', 'Unknown')}: {primary_status}")
-        elif not is_active and "active" in locked_fields:
-            print(f"🔒 {row.get('Display Name', 'Unknown')}: Inactive (locked by override)")
-        else:
-            print(f"✓ {row.get('Display Name', 'Unknown')}")
+                is_active = row[ACTIVE_HEADER_NAME].upper() == "TRUE"
+
+            # Update timestamp if not locked
+            if "last_checked" not in locked_fields:
+                row[LAST_CHECKED_HEADER_NAME] = datetime.now().strftime("%Y-%m-%d:%H-%M-%S")
+
+            # Track broken links
+            if not is_active and "active" not in locked_fields:
+                link_info = {
+                    "name": row.get("Display Name", "Unknown"),
+                    "primary_url": primary_url,
+                    "primary_status": primary_status,
+                    # "secondary_url": secondary_url if not secondary_valid else None,
+                    # No longer tracking secondary URLs
+                }
+                broken_links.append(link_info)
+
+                # Check if this is a newly discovered broken link
+                if was_active:
+                    newly_broken_links.append(link_info)
+                    print(f"❌ NEW: {row.get('Display Name', 'Unknown')}: {primary_status}")
+                else:
+                    print(f"Already broken: {row.get('Display Name', 'Unknown')}: {primary_status}")
+            elif not is_active and "active" in locked_fields:
+                print(f"🔒 {row.get('Display Name', 'Unknown')}: Inactive (locked by override)")
+            else:
+                print(f"✓ {row.get('Display Name', 'Unknown')}")
+
+            if schedule:
+                record_result(schedule_state, row, primary_valid, datetime.now())
+
+            processed += 1
 
-        processed += 1
+    with METRICS.phase("write"):
+        if schedule:
+            prune_state(schedule_state, rows)
+            save_schedule_state(schedule_state, schedule_state_file)
 
-    # Write updated CSV
-    with open(OUTPUT_FILE, "w", encoding="utf-8", newline="") as f:
-        assert fieldnames is not None
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        # Write updated CSV (only rows that changed are re-serialized)
+        store.patch_rows(rows)
+        store.commit(OUTPUT_FILE)
+
+    github_api_calls = METRICS.github_api_requests - api_requests_before
+    rate_limit_units = METRICS.total_rate_limit_units() - rate_limit_units_before
+    METRICS.count("resources_processed", processed)
+    METRICS.count("broken_links", len(broken_links))
 
     # Summary
     print("\nValidation complete!")
@@ -423,6 +828,7 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
     print(f"Processed: {processed}")
     print(f"GitHub links: {github_links}")
     print(f"GitHub API calls: {github_api_calls}")
+    print(f"GitHub rate-limit units used: {rate_limit_units}")
     if last_modified_updates:
         print(f"Last modified dates fetched: {last_modified_updates}")
     if override_count:
@@ -430,6 +836,12 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
         print(f"Total locked fields: {locked_field_count}")
     print(f"Total broken links: {len(broken_links)}")
     print(f"Newly broken links: {len(newly_broken_links)}")
+    if schedule:
+        print(f"Deferred to later runs: {candidates - processed}")
+    if RESPONSE_CACHE is not None:
+        print(RESPONSE_CACHE.report())
+    if graphql_fetcher is not None:
+        print(graphql_fetcher.report())
 
     # Print broken links
     if newly_broken_links:
@@ -444,19 +856,23 @@ def validate_links(csv_file, max_links=None, ignore_overrides=False):
             # if link.get("secondary_url"):  # No longer reporting secondary URLs
             #     print(f"    Secondary: {link['secondary_url']}")
 
-    return {
+    summary = {
         "total": total_resources,
         "processed": processed,
         "broken": len(broken_links),
         "newly_broken": len(newly_broken_links),
         "github_links": github_links,
         "github_api_calls": github_api_calls,
+        "github_rate_limit_units": rate_limit_units,
         "override_count": override_count,
         "locked_fields": locked_field_count,
         "broken_links": broken_links,
         "newly_broken_links": newly_broken_links,
         "timestamp": datetime.now().strftime("%Y-%m-%d:%H-%M-%S"),
     }
+    if schedule:
+        summary["deferred"] = candidates - processed
+    return summary
 
 
 def main():
@@ -466,15 +882,69 @@ def main():
     parser.add_argument(
         "--ignore-overrides", action="store_true", help="Ignore override configuration"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of links to validate concurrently (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["rest", "graphql"],
+        default="rest",
+        help="GitHub metadata backend: per-row REST calls or batched GraphQL (default: rest)",
+    )
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="Validate rows in revalidation priority order (stalest first)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        help="Stop starting new validations after this many seconds (implies --schedule)",
+    )
+    parser.add_argument(
+        "--api-budget",
+        type=int,
+        help="Validate only rows that fit this many GitHub API calls (implies --schedule)",
+    )
+    parser.add_argument(
+        "--schedule-state",
+        default=DEFAULT_STATE_FILE,
+        help=f"Scheduling state file (default: {DEFAULT_STATE_FILE})",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the GitHub API response cache"
+    )
+    parser.add_argument(
+        "--cache-dir", default=DEFAULT_CACHE_DIR, help="GitHub API response cache directory"
+    )
     args = parser.parse_args()
 
+    global RESPONSE_CACHE
+    if not args.no_cache:
+        RESPONSE_CACHE = GitHubResponseCache(args.cache_dir)
+
     csv_file = INPUT_FILE
     if not os.path.exists(csv_file):
         print(f"Error: CSV file not found at {csv_file}")
         sys.exit(1)
 
     try:
-        results = validate_links(csv_file, args.max_links, args.ignore_overrides)
+        results = validate_links(
+            csv_file,
+            args.max_links,
+            args.ignore_overrides,
+            concurrency=args.concurrency,
+            backend=args.backend,
+            schedule=args.schedule,
+            time_budget=args.time_budget,
+            api_budget=args.api_budget,
+            schedule_state_file=args.schedule_state,
+        )
+        if RESPONSE_CACHE is not None:
+            RESPONSE_CACHE.prune()
 
         if args.github_action:
             # Output JSON for GitHub Action
@@ -34,6 +34,8 @@ except ImportError:
     print("Error: Could not import from validate_links.py")
     sys.exit(1)
 
+from resource_store import open_resource_store  # type: ignore[import-not-found]  # noqa: E402
+
 CSV_FILE = "THE_RESOURCES_TABLE.csv"
 UPSTREAM_REMOTE = os.environ.get("AWESOME_CC_UPSTREAM_REMOTE", "upstream")
 
@@ -186,36 +188,18 @@ def validate_and_update_resource(resource: dict[str, str]) -> bool:
 def update_csv_file(updated_resource: dict[str, str]) -> bool:
     """Update the CSV file with the validated resource data."""
     try:
-        # Read all rows
-        with open(CSV_FILE, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            fieldnames = reader.fieldnames
-
-        if not fieldnames:
+        store = open_resource_store(CSV_FILE)
+        if not store.fieldnames:
             print("Error: Could not read CSV fieldnames")
             return False
 
-        # Find and update the matching row
+        # Patch the matching row by ID; the rest of the table is copied verbatim
         resource_id = updated_resource.get(ID_HEADER_NAME)
-        updated = False
-
-        for i, row in enumerate(rows):
-            if row.get(ID_HEADER_NAME) == resource_id:
-                # Update the row with validated data
-                rows[i].update(updated_resource)
-                updated = True
-                break
-
-        if not updated:
+        if not store.patch(resource_id, updated_resource):
             print(f"Warning: Could not find resource with ID {resource_id} in CSV")
             return False
 
-        # Write back to CSV
-        with open(CSV_FILE, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+        store.commit()
 
         print(f"\n✓ Updated {CSV_FILE} successfully")
         return True
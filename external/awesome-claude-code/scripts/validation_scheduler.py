@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Incremental revalidation scheduler for validate_links.py.
+
+Instead of re-checking every row on every run, scheduled runs order rows by
+priority and validate only as many as fit in a time or GitHub API budget.
+Priority combines:
+- Staleness: time since the row was last checked (Last Checked column, or the
+  last recorded attempt for rows whose Last Checked is locked by an override)
+- Recent failures: rows that are inactive or failed recently are re-checked sooner
+- Change frequency: rows whose Last Modified is recent are more likely to change
+
+Per-resource attempts and failure streaks are recorded in a small JSON state
+file so consecutive small runs cover the whole table over a rolling window.
+"""
+
+import json
+import os
+from datetime import datetime
+
+DEFAULT_STATE_FILE = ".myob/validation-schedule.json"
+DATE_FORMAT = "%Y-%m-%d:%H-%M-%S"
+
+# Rows that have never been checked sort ahead of everything else
+NEVER_CHECKED_HOURS = 24 * 365 * 10
+# Each consecutive failure (up to the cap) adds this much weight
+FAILURE_WEIGHT = 1.0
+MAX_FAILURE_BOOST = 3
+# (age in days, multiplier) for recently modified resources
+CHANGE_FREQUENCY_BOOSTS = [(30, 2.0), (180, 1.5)]
+# REST calls for a GitHub row: existence check, license, last commit
+GITHUB_API_CALLS_PER_ROW = 3
+# The GraphQL backend folds those lookups into one alias of a batched query
+GRAPHQL_ALIASES_PER_ROW = 1
+
+
+def parse_timestamp(value):
+    """Parse a YYYY-MM-DD:HH-MM-SS (or YYYY-MM-DD) timestamp, returning None if invalid."""
+    if not value:
+        return None
+    for fmt in (DATE_FORMAT, "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def load_schedule_state(path=DEFAULT_STATE_FILE):
+    """Load per-resource scheduling state, returning an empty state if none exists."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        print(f"Warning: could not read schedule state from {path}; starting fresh")
+        return {}
+    return data.get("resources", {})
+
+
+def save_schedule_state(state, path=DEFAULT_STATE_FILE):
+    """Atomically write scheduling state."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"resources": state}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def schedule_key(row):
+    """Key a row in the state file by resource ID, falling back to its primary link."""
+    return row.get("ID") or row.get("Primary Link", "").strip()
+
+
+def priority(row, entry, now):
+    """Score a row for revalidation; higher scores are validated first."""
+    last_checked = parse_timestamp(row.get("Last Checked", ""))
+    last_attempt = parse_timestamp(entry.get("last_attempt", "")) if entry else None
+    checked_times = [t for t in (last_checked, last_attempt) if t]
+    if checked_times:
+        staleness_hours = max((now - max(checked_times)).total_seconds() / 3600, 0)
+    else:
+        staleness_hours = NEVER_CHECKED_HOURS
+
+    failures = entry.get("failures", 0) if entry else 0
+    if row.get("Active", "TRUE").upper() != "TRUE":
+        failures = max(failures, 1)
+    score = staleness_hours * (1 + FAILURE_WEIGHT * min(failures, MAX_FAILURE_BOOST))
+
+    last_modified = parse_timestamp(row.get("Last Modified", ""))
+    if last_modified:
+        age_days = (now - last_modified).days
+        for max_age_days, boost in CHANGE_FREQUENCY_BOOSTS:
+            if age_days <= max_age_days:
+                score *= boost
+                break
+
+    return score
+
+
+def order_by_priority(pending, state, now):
+    """
+    Sort pending (row, locked_fields, url) entries by descending priority.
+    Ties keep table order, so equally stale rows are taken front to back.
+    """
+    return sorted(
+        pending,
+        key=lambda item: -priority(item[0], state.get(schedule_key(item[0])), now),
+    )
+
+
+def estimate_api_calls(url, uses_github_api, backend="rest"):
+    """
+    Estimate the GitHub API calls needed to validate a URL.
+    uses_github_api is validate_links' own URL classifier, so only URLs it sends
+    to the API are charged (gists, raw files and other pages are a plain HEAD).
+    """
+    if not url or not uses_github_api(url):
+        return 0
+    return GRAPHQL_ALIASES_PER_ROW if backend == "graphql" else GITHUB_API_CALLS_PER_ROW
+
+
+def apply_api_budget(pending, api_budget, uses_github_api, backend="rest"):
+    """Take entries in order until the estimated GitHub API budget is spent."""
+    selected = []
+    spent = 0
+    for item in pending:
+        cost = estimate_api_calls(item[2], uses_github_api, backend)
+        if spent + cost > api_budget:
+            break
+        selected.append(item)
+        spent += cost
+    return selected
+
+
+def record_result(state, row, is_valid, now):
+    """Record a validation attempt and update the row's failure streak."""
+    key = schedule_key(row)
+    entry = state.setdefault(key, {})
+    entry["last_attempt"] = now.strftime(DATE_FORMAT)
+    entry["failures"] = 0 if is_valid else entry.get("failures", 0) + 1
+
+
+def prune_state(state, rows):
+    """Drop state for resources no longer in the table."""
+    keys = {schedule_key(row) for row in rows}
+    for key in list(state):
+        if key not in keys:
+            del state[key]
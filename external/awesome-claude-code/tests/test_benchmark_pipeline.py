@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the benchmark tooling: run_metrics.py, mock_github_server.py
+and benchmark_pipeline.py.
+
+Tests cover:
+- Endpoint classification and rate-limit unit accounting
+- Mock server behaviour: ETag revalidation, rate limiting, injected failures,
+  GraphQL batching, tree blob SHAs and redirects
+- A small end-to-end pipeline run whose client and server counts agree
+- Regression detection against a baseline report
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import benchmark_pipeline as bp  # noqa
+from scripts.github_graphql import GitHubGraphQLFetcher, target_key  # noqa
+from scripts.mock_github_server import MockGitHubServer, blob_sha  # noqa
+from scripts.run_metrics import RunMetrics, classify_endpoint, instrument_session  # noqa
+
+API = "https://api.github.com"
+RAW = "https://raw.githubusercontent.com"
+
+
+@pytest.fixture
+def server() -> Generator[MockGitHubServer, None, None]:
+    with MockGitHubServer(rate_limit=5) as mock:
+        yield mock
+
+
+class TestRunMetrics:
+    def test_classify_endpoint(self) -> None:
+        assert classify_endpoint("GET", f"{API}/repos/o/r", API, RAW) == (
+            "GET /repos/{owner}/{repo}",
+            True,
+        )
+        contents_url = f"{API}/repos/o/r/contents/a/b.md?ref=main"
+        assert classify_endpoint("GET", contents_url, API, RAW)[0] == (
+            "GET /repos/{owner}/{repo}/contents/{path}"
+        )
+        assert classify_endpoint("GET", f"{RAW}/o/r/main/README.md", API, RAW) == (
+            "GET raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}",
+            False,
+        )
+        assert classify_endpoint("HEAD", "https://example.com:8443/page", API, RAW) == (
+            "HEAD example.com",
+            False,
+        )
+
+    def test_records_requests_and_units(self, server: MockGitHubServer) -> None:
+        metrics = RunMetrics()
+        session = requests.Session()
+        session.hooks["response"].append(
+            lambda response, *a, **k: metrics.record_response(response)
+        )
+        with metrics.phase("fetch"):
+            first = session.get(f"{server.api_url}/repos/o/r")
+            session.get(
+                f"{server.api_url}/repos/o/r", headers={"If-None-Match": first.headers["ETag"]}
+            )
+            session.get(f"{server.api_url}/rate_limit")
+        metrics.count("rows", 2)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["http"]["requests"] == 3
+        assert snapshot["rate_limit_units"] == {}  # URLs outside GITHUB_API_URL are not metered
+        assert snapshot["counters"] == {"rows": 2}
+        assert snapshot["phases"]["fetch"] > 0
+        assert (
+            snapshot["memory"]["peak_rss_bytes"] is None or snapshot["memory"]["peak_rss_bytes"] > 0
+        )
+
+    def test_instrument_session_is_idempotent(self) -> None:
+        session = requests.Session()
+        assert instrument_session(instrument_session(session)) is session
+        assert len(session.hooks["response"]) == 1
+
+    def test_write_is_json(self, tmp_path: Path) -> None:
+        metrics = RunMetrics()
+        metrics.add_rate_limit_units("graphql", 3)
+        metrics.write(str(tmp_path / "out" / "metrics.json"))
+
+        data = json.loads((tmp_path / "out" / "metrics.json").read_text())
+        assert data["rate_limit_units"] == {"graphql": 3}
+        assert metrics.total_rate_limit_units() == 3
+
+
+class TestMockServer:
+    def test_etag_revalidation_is_free(self, server: MockGitHubServer) -> None:
+        first = requests.get(f"{server.api_url}/repos/o/r")
+        second = requests.get(
+            f"{server.api_url}/repos/o/r", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert second.status_code == 304
+        assert second.headers["X-RateLimit-Remaining"] == "4"
+        assert server.stats["rate_limit_units"] == {"core": 1}
+        assert server.stats["not_modified"] == 1
+
+    def test_rate_limit_exhaustion(self, server: MockGitHubServer) -> None:
+        statuses = [requests.get(f"{server.api_url}/repos/o/r{i}").status_code for i in range(6)]
+        limit = requests.get(f"{server.api_url}/rate_limit").json()
+
+        assert statuses == [200] * 5 + [403]
+        assert limit["rate"]["remaining"] == 0
+        assert server.stats["rate_limited"] == 1
+        assert server.stats["by_endpoint"]["GET /rate_limit"] == 1
+
+    def test_missing_repositories_and_pages(self, server: MockGitHubServer) -> None:
+        assert requests.get(f"{server.api_url}/repos/o/missing-r").status_code == 404
+        assert requests.head(f"{server.site_url}/missing-page").status_code == 404
+
+        moved = requests.get(f"{server.site_url}/moved/page")
+        assert moved.status_code == 200
+        assert [hop.status_code for hop in moved.history] == [301]
+
+    def test_injected_failures(self) -> None:
+        with MockGitHubServer(failure_rate=1.0) as mock:
+            response = requests.get(f"{mock.api_url}/repos/o/r")
+
+            assert response.status_code == 502
+            assert mock.stats["failures_injected"] == 1
+            assert mock.stats["rate_limit_units"] == {"core": 1}
+
+    def test_tree_matches_raw_content(self, server: MockGitHubServer) -> None:
+        tree = requests.get(f"{server.api_url}/repos/o/r/git/trees/main?recursive=1").json()
+        blobs = {entry["path"]: entry for entry in tree["tree"] if entry["type"] == "blob"}
+        raw = requests.get(f"{server.raw_url}/o/r/main/.claude/commands/command-0.md").content
+
+        assert len(blobs) == 1 + server.files_per_repo
+        assert blobs[".claude/commands/command-0.md"]["sha"] == blob_sha(raw)
+
+    def test_graphql_fetcher_against_mock(self, server: MockGitHubServer) -> None:
+        fetcher = GitHubGraphQLFetcher("token", endpoint=f"{server.api_url}/graphql")
+        targets = [
+            {
+                "owner": "o",
+                "repo": "r",
+                "expression": "main:README.md",
+                "history_path": "README.md",
+            },
+            {"owner": "o", "repo": "r", "expression": "main:nope.md", "history_path": "nope.md"},
+            {"owner": "o", "repo": "missing-r"},
+        ]
+
+        results = fetcher.fetch(targets)
+
+        assert [results[target_key(t)]["exists"] for t in targets] == [True, False, False]
+        assert results[target_key(targets[0])]["committed_date"] == server.commit_date(
+            "o", "r", "README.md"
+        )
+        assert server.stats["rate_limit_units"] == {"graphql": 1}
+
+
+def bench_args(workdir: Path, **overrides: Any) -> argparse.Namespace:
+    options = {
+        "rows": 30,
+        "seed": 1,
+        "latency": 0.0,
+        "rate_limit": 5000,
+        "rate_limit_window": 3600.0,
+        "failure_rate": 0.0,
+        "broken_rate": 0.1,
+        "concurrency": 2,
+        "backend": "rest",
+        "scripts": ",".join(bp.SCRIPTS),
+        "workdir": str(workdir),
+        "trace_memory": False,
+    }
+    options.update(overrides)
+    return argparse.Namespace(**options)
+
+
+class TestBenchmarkPipeline:
+    def test_resource_table_is_reproducible(self) -> None:
+        table = bp.make_resource_table(20, "http://site", seed=3)
+
+        assert table == bp.make_resource_table(20, "http://site", seed=3)
+        assert list(table[0]) == bp.CSV_FIELDS
+        assert len({row["ID"] for row in table}) == 20
+
+    def test_end_to_end_counts_agree(self, tmp_path: Path) -> None:
+        report = bp.run_benchmark(bench_args(tmp_path))
+
+        assert bp.check_consistency(report) == []
+        validate = report["runs"]["validate"]
+        log = Path(validate["log"]).read_text(encoding="utf-8")
+        api_requests = sum(
+            count
+            for endpoint, count in validate["server"]["by_endpoint"].items()
+            if " /" in endpoint
+        )
+        assert f"GitHub API calls: {api_requests}\n" in log
+        assert validate["client"]["phases"].keys() >= {"load", "validate", "write"}
+        assert report["runs"]["download"]["client"]["counters"]["resources_downloaded"] > 0
+        assert (tmp_path / "repo" / "README.md").exists()
+        assert bp.compare_reports(report, report) == []
+
+    def test_compare_reports_flags_regressions(self) -> None:
+        def run(requests_sent: int, seconds: float, rss: int) -> dict[str, Any]:
+            return {
+                "process_seconds": seconds,
+                "client": {
+                    "http": {
+                        "requests": requests_sent,
+                        "by_endpoint": {"GET /repos/{owner}/{repo}": {"requests": requests_sent}},
+                    },
+                    "rate_limit_units": {"core": requests_sent},
+                    "memory": {"peak_rss_bytes": rss, "peak_traced_bytes": None},
+                },
+            }
+
+        baseline = {"runs": {"validate": run(10, 1.0, 100 * 2**20)}}
+        same = {"runs": {"validate": run(10, 1.2, 110 * 2**20)}}
+        worse = {"runs": {"validate": run(12, 2.0, 200 * 2**20)}}
+
+        assert bp.compare_reports(same, baseline) == []
+        regressions = bp.compare_reports(worse, baseline)
+        assert len(regressions) == 5
+        assert any("rate-limit units" in regression for regression in regressions)
+        assert any("peak memory" in regression for regression in regressions)
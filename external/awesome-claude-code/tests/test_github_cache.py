@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Unit tests for github_cache.py module.
+
+Tests cover:
+- Conditional revalidation with ETag / Last-Modified
+- In-process deduplication of repeated lookups
+- Cache keys separated by auth identity and Accept header
+- Age- and size-based eviction
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts.github_cache import GitHubResponseCache  # noqa
+
+API_URL = "https://api.github.com/repos/owner/repo"
+HEADERS = {"Accept": "application/vnd.github+json", "Authorization": "Bearer token-a"}
+
+
+def make_response(status_code: int, body: bytes = b"", headers: dict | None = None):
+    response = requests.Response()
+    response.url = API_URL
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    return response
+
+
+class FakeGitHub:
+    """Records outgoing request headers and answers like GitHub's conditional API."""
+
+    def __init__(self, body: bytes = b'{"license": {"spdx_id": "MIT"}}', etag: str = '"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests: list[dict[str, str]] = []
+
+    def send(self, headers: dict[str, str]) -> requests.Response:
+        self.requests.append(headers)
+        if headers.get("If-None-Match") == self.etag:
+            return make_response(304, headers={"ETag": self.etag})
+        return make_response(200, self.body, {"ETag": self.etag, "Content-Type": "json"})
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    return tmp_path / "http-cache"
+
+
+class TestConditionalRequests:
+    def test_second_run_revalidates_with_etag(self, cache_dir: Path) -> None:
+        github = FakeGitHub()
+        GitHubResponseCache(str(cache_dir)).get(API_URL, github.send, HEADERS)
+
+        cache = GitHubResponseCache(str(cache_dir))
+        response = cache.get(API_URL, github.send, HEADERS)
+
+        assert github.requests[1]["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.json() == {"license": {"spdx_id": "MIT"}}
+        assert cache.stats["revalidated"] == 1
+        assert cache.stats["misses"] == 0
+
+    def test_changed_resource_replaces_cached_body(self, cache_dir: Path) -> None:
+        github = FakeGitHub()
+        GitHubResponseCache(str(cache_dir)).get(API_URL, github.send, HEADERS)
+        github.body, github.etag = b'{"license": null}', '"v2"'
+
+        GitHubResponseCache(str(cache_dir)).get(API_URL, github.send, HEADERS)
+        response = GitHubResponseCache(str(cache_dir)).get(API_URL, github.send, HEADERS)
+
+        assert response.json() == {"license": None}
+        assert github.requests[-1]["If-None-Match"] == '"v2"'
+
+    def test_last_modified_sent_as_if_modified_since(self, cache_dir: Path) -> None:
+        stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+        sent: list[dict[str, str]] = []
+
+        def send(headers: dict[str, str]) -> requests.Response:
+            sent.append(headers)
+            return make_response(200, b"[]", {"Last-Modified": stamp})
+
+        GitHubResponseCache(str(cache_dir)).get(API_URL, send, HEADERS)
+        GitHubResponseCache(str(cache_dir)).get(API_URL, send, HEADERS)
+
+        assert sent[1]["If-Modified-Since"] == stamp
+
+    def test_errors_are_not_cached(self, cache_dir: Path) -> None:
+        calls = []
+
+        def send(headers: dict[str, str]) -> requests.Response:
+            calls.append(headers)
+            return make_response(404, b"Not Found", {"ETag": '"x"'})
+
+        cache = GitHubResponseCache(str(cache_dir))
+        assert cache.get(API_URL, send, HEADERS).status_code == 404
+        assert cache.get(API_URL, send, HEADERS).status_code == 404
+
+        assert len(calls) == 2
+        assert "If-None-Match" not in calls[1]
+        assert cache.stats["uncacheable"] == 2
+
+
+class TestDeduplication:
+    def test_repeated_lookup_served_from_memory(self, cache_dir: Path) -> None:
+        github = FakeGitHub()
+        cache = GitHubResponseCache(str(cache_dir))
+
+        for _ in range(5):
+            cache.get(API_URL, github.send, HEADERS)
+
+        assert len(github.requests) == 1
+        assert cache.stats["memory_hits"] == 4
+        assert "4 in-process hits" in cache.report()
+
+    def test_auth_identity_separates_entries(self, cache_dir: Path) -> None:
+        github = FakeGitHub()
+        cache = GitHubResponseCache(str(cache_dir))
+
+        cache.get(API_URL, github.send, HEADERS)
+        cache.get(API_URL, github.send, {**HEADERS, "Authorization": "Bearer token-b"})
+        cache.get(API_URL, github.send, {"Accept": HEADERS["Accept"]})
+
+        assert len(github.requests) == 3
+
+    def test_accept_header_and_params_separate_entries(self, cache_dir: Path) -> None:
+        github = FakeGitHub()
+        cache = GitHubResponseCache(str(cache_dir))
+
+        cache.get(API_URL, github.send, HEADERS)
+        cache.get(API_URL, github.send, {**HEADERS, "Accept": "application/vnd.github.v3.raw"})
+        cache.get(API_URL, github.send, HEADERS, params={"per_page": 1})
+
+        assert len(github.requests) == 3
+
+    def test_token_not_written_to_disk(self, cache_dir: Path) -> None:
+        GitHubResponseCache(str(cache_dir)).get(API_URL, FakeGitHub().send, HEADERS)
+
+        for path in cache_dir.iterdir():
+            assert b"token-a" not in path.read_bytes()
+
+
+class TestEviction:
+    def test_prune_removes_expired_entries(self, cache_dir: Path) -> None:
+        cache = GitHubResponseCache(str(cache_dir), max_age_days=1)
+        cache.get(API_URL, FakeGitHub().send, HEADERS)
+        old = time.time() - 2 * 24 * 60 * 60
+        for path in cache_dir.glob("*.json"):
+            os.utime(path, (old, old))
+
+        result = cache.prune()
+
+        assert result["removed"] == 1
+        assert list(cache_dir.iterdir()) == []
+
+    def test_prune_evicts_least_recently_used_over_size(self, cache_dir: Path) -> None:
+        cache = GitHubResponseCache(str(cache_dir), max_bytes=3000)
+        urls = [f"{API_URL}-{i}" for i in range(3)]
+        for i, url in enumerate(urls):
+            cache.get(url, FakeGitHub(body=b"x" * 1000).send, HEADERS)
+            stamp = time.time() - 100 + i
+            os.utime(cache_dir / f"{cache.cache_key(url, HEADERS)}.json", (stamp, stamp))
+
+        result = cache.prune()
+
+        remaining = {path.stem for path in cache_dir.glob("*.json")}
+        assert result["removed"] == 1
+        assert cache.cache_key(urls[0], HEADERS) not in remaining
+        assert result["bytes"] <= 3000
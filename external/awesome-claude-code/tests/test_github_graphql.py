@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Unit tests for github_graphql.py module, run against a local stub GraphQL server.
+
+Tests cover:
+- Aliased batching of existence, license and last-commit lookups
+- Chunking under alias and node limits
+- NOT_FOUND handling and REST fallback for unresolved targets
+- validate_links integration via run_validations
+"""
+
+import json
+import re
+import sys
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import validate_links as vl  # noqa
+from scripts.github_graphql import (  # noqa
+    GitHubGraphQLFetcher,
+    build_query,
+    chunk_targets,
+    target_key,
+)
+
+# owner/name -> repository fixture served by the stub
+REPOSITORIES: dict[str, dict[str, Any]] = {
+    "octo/alpha": {
+        "license": "MIT",
+        "objects": {"main:README.md", "main:.claude/commands"},
+        "history": {None: "2024-05-01T10:00:00Z", "README.md": "2024-04-01T09:30:00Z"},
+    },
+    "octo/beta": {"license": None, "objects": set(), "history": {None: "2023-01-02T03:04:05Z"}},
+    "octo/empty": {"license": "Apache-2.0", "objects": set(), "history": {}},
+}
+# Repositories for which the stub reports a non-NOT_FOUND error
+FLAKY = {"octo/flaky"}
+
+
+class StubGraphQLHandler(BaseHTTPRequestHandler):
+    """Answers aliased repository queries the way api.github.com/graphql does."""
+
+    queries: list[dict[str, Any]] = []
+    fail_next = 0
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StubGraphQLHandler.queries.append(body)
+        if self.headers.get("Authorization") != "Bearer test-token":
+            self._reply(401, {"message": "Bad credentials"})
+            return
+        if StubGraphQLHandler.fail_next:
+            StubGraphQLHandler.fail_next -= 1
+            self._reply(502, {"message": "Bad gateway"})
+            return
+
+        variables = body["variables"]
+        data: dict[str, Any] = {"rateLimit": {"cost": 1, "remaining": 4999}}
+        errors = []
+        aliases = re.findall(r"(r\d+): repository\(", body["query"])
+        for alias in aliases:
+            i = alias[1:]
+            name = f"{variables[f'owner{i}']}/{variables[f'name{i}']}"
+            if name in FLAKY:
+                data[alias] = None
+                errors.append({"type": "SERVICE_UNAVAILABLE", "path": [alias]})
+                continue
+            repo = REPOSITORIES.get(name)
+            if repo is None:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias]})
+                continue
+            committed = repo["history"].get(variables[f"path{i}"])
+            result: dict[str, Any] = {
+                "licenseInfo": {"spdxId": repo["license"]} if repo["license"] else None,
+                "defaultBranchRef": {
+                    "target": {
+                        "history": {"nodes": [{"committedDate": committed}] if committed else []}
+                    }
+                },
+            }
+            if f"expr{i}" in variables:
+                exists = variables[f"expr{i}"] in repo["objects"]
+                result["object"] = {"__typename": "Blob"} if exists else None
+            data[alias] = result
+
+        payload: dict[str, Any] = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        self._reply(200, payload)
+
+    def _reply(self, status: int, payload: dict[str, Any]) -> None:
+        encoded = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+@pytest.fixture
+def graphql_endpoint() -> Generator[str, None, None]:
+    """Run the stub GraphQL server on a free local port."""
+    StubGraphQLHandler.queries = []
+    StubGraphQLHandler.fail_next = 0
+    server = HTTPServer(("127.0.0.1", 0), StubGraphQLHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/graphql"
+    server.shutdown()
+    server.server_close()
+
+
+def make_target(repo: str, expression: str | None = None, history_path: str | None = None):
+    owner, name = repo.split("/")
+    return {"owner": owner, "repo": name, "expression": expression, "history_path": history_path}
+
+
+class TestQueryBuilding:
+    def test_chunks_respect_alias_limit(self) -> None:
+        targets = [make_target(f"octo/repo{i}") for i in range(7)]
+
+        chunks = list(chunk_targets(targets, max_aliases=3, max_nodes=1000))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+    def test_chunks_respect_node_limit(self) -> None:
+        targets = [make_target(f"octo/repo{i}", expression="main:x") for i in range(5)]
+
+        chunks = list(chunk_targets(targets, max_aliases=50, max_nodes=7))
+
+        # Each target with an object lookup is estimated at 3 nodes
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    def test_values_passed_as_variables(self) -> None:
+        query, variables = build_query([make_target('evil/"repo', expression="main:a b")])
+
+        assert '"repo' not in query
+        assert variables == {
+            "owner0": "evil",
+            "name0": '"repo',
+            "path0": None,
+            "expr0": "main:a b",
+        }
+        assert "object(expression: $expr0)" in query
+
+
+class TestFetcher:
+    def test_batches_metadata_into_one_query(self, graphql_endpoint: str) -> None:
+        fetcher = GitHubGraphQLFetcher("test-token", endpoint=graphql_endpoint)
+        targets = [
+            make_target("octo/alpha"),
+            make_target("octo/alpha", "main:README.md", "README.md"),
+            make_target("octo/beta"),
+            make_target("octo/missing"),
+        ]
+
+        results = fetcher.fetch(targets)
+
+        assert len(StubGraphQLHandler.queries) == 1
+        assert results[target_key(targets[0])] == {
+            "exists": True,
+            "license": "MIT",
+            "committed_date": "2024-05-01T10:00:00Z",
+        }
+        assert results[target_key(targets[1])]["committed_date"] == "2024-04-01T09:30:00Z"
+        assert results[target_key(targets[2])]["license"] == "NOT_FOUND"
+        assert results[target_key(targets[3])]["exists"] is False
+        assert fetcher.stats["cost"] == 1
+
+    def test_missing_object_reports_not_found(self, graphql_endpoint: str) -> None:
+        fetcher = GitHubGraphQLFetcher("test-token", endpoint=graphql_endpoint)
+        target = make_target("octo/alpha", "main:nope.md", "nope.md")
+
+        assert fetcher.fetch([target])[target_key(target)]["exists"] is False
+
+    def test_duplicate_targets_share_an_alias(self, graphql_endpoint: str) -> None:
+        fetcher = GitHubGraphQLFetcher("test-token", endpoint=graphql_endpoint)
+
+        fetcher.fetch([make_target("octo/alpha"), make_target("Octo/Alpha")])
+
+        assert len(StubGraphQLHandler.queries[0]["variables"]) == 3
+
+    def test_chunked_queries(self, graphql_endpoint: str) -> None:
+        fetcher = GitHubGraphQLFetcher("test-token", endpoint=graphql_endpoint, max_aliases=2)
+
+        results = fetcher.fetch([make_target(name) for name in REPOSITORIES])
+
+        assert len(StubGraphQLHandler.queries) == 2
+        assert len(results) == 3
+
+    def test_unexpected_errors_left_for_rest(self, graphql_endpoint: str) -> None:
+        fetcher = GitHubGraphQLFetcher("test-token", endpoint=graphql_endpoint)
+        flaky, beta = make_target("octo/flaky"), make_target("octo/beta")
+
+        results = fetcher.fetch([flaky, beta])
+
+        assert target_key(flaky) not in results
+        assert target_key(beta) in results
+        assert fetcher.stats["unresolved"] == 1
+
+    def test_failed_query_leaves_chunk_unresolved(self, graphql_endpoint: str) -> None:
+        StubGraphQLHandler.fail_next = 1
+        fetcher = GitHubGraphQLFetcher("test-token", endpoint=graphql_endpoint, max_aliases=2)
+
+        results = fetcher.fetch([make_target(name) for name in REPOSITORIES])
+
+        assert len(results) == 1
+        assert fetcher.stats["unresolved"] == 2
+
+    def test_bad_credentials_resolve_nothing(self, graphql_endpoint: str) -> None:
+        fetcher = GitHubGraphQLFetcher("wrong-token", endpoint=graphql_endpoint)
+
+        assert fetcher.fetch([make_target("octo/alpha")]) == {}
+
+
+class TestValidateLinksBackend:
+    def test_graphql_target_mirrors_rest_lookups(self) -> None:
+        assert vl.graphql_target("https://github.com/octo/alpha") == make_target("octo/alpha")
+        assert vl.graphql_target(
+            "https://github.com/octo/alpha/blob/main/docs/README.md"
+        ) == make_target("octo/alpha", "main:docs/README.md", "docs/README.md")
+        # Tree URLs check the directory but use the repository's last commit, like REST
+        assert vl.graphql_target(
+            "https://github.com/octo/alpha/tree/main/.claude/commands"
+        ) == make_target("octo/alpha", "main:.claude/commands")
+        assert vl.graphql_target("https://github.com/octo") is None
+        assert vl.graphql_target("https://example.com/tool") is None
+
+    def test_run_validations_falls_back_to_rest(self, graphql_endpoint: str) -> None:
+        fetcher = GitHubGraphQLFetcher("test-token", endpoint=graphql_endpoint)
+        urls = [
+            "https://github.com/octo/alpha/blob/main/README.md",
+            "https://github.com/octo/missing",
+            "https://github.com/octo/flaky",
+            "https://example.com/tool",
+            "https://github.com/octo/alpha/tree/main/.claude/commands",
+        ]
+        rest_calls = []
+
+        def fake_validate_url(url: str):
+            rest_calls.append(url)
+            return True, 200, None, None
+
+        with patch.object(vl, "validate_url", side_effect=fake_validate_url):
+            results = list(vl.run_validations(urls, concurrency=2, graphql_fetcher=fetcher))
+
+        assert results == [
+            (True, 200, "MIT", "2024-04-01:09-30-00"),
+            (False, 404, None, None),
+            (True, 200, None, None),
+            (True, 200, None, None),
+            (True, 200, "MIT", "2024-05-01:10-00-00"),
+        ]
+        assert rest_calls == ["https://github.com/octo/flaky", "https://example.com/tool"]
+
+    @pytest.mark.parametrize("concurrency", [1, 2])
+    def test_deadline_bounds_graphql_prefetch(
+        self, graphql_endpoint: str, concurrency: int
+    ) -> None:
+        fetcher = GitHubGraphQLFetcher("test-token", endpoint=graphql_endpoint, max_aliases=1)
+        urls = [f"https://github.com/{name}" for name in REPOSITORIES]
+        clock = [0.0]
+        query = fetcher._query
+
+        def slow_query(chunk: list[dict[str, Any]]) -> dict[str, Any] | None:
+            clock[0] += 10
+            return query(chunk)
+
+        with (
+            patch.object(fetcher, "_query", side_effect=slow_query),
+            patch.object(vl, "time", SimpleNamespace(monotonic=lambda: clock[0])),
+        ):
+            results = list(
+                vl.run_validations(urls, concurrency, graphql_fetcher=fetcher, deadline=15)
+            )
+
+        # The second query overruns the budget, so the third is never sent
+        assert results == [(True, 200, "MIT", "2024-05-01:10-00-00")]
+        assert len(StubGraphQLHandler.queries) == 2
+
+    def test_graphql_batches_follow_first_use(self) -> None:
+        fetcher = GitHubGraphQLFetcher("test-token", max_aliases=2)
+        urls = [
+            "https://example.com/tool",
+            "https://github.com/octo/alpha",
+            "https://github.com/octo/beta",
+            "https://github.com/Octo/Alpha",
+            "https://github.com/octo/empty",
+        ]
+
+        # Both spellings of octo/alpha share the first chunk's alias
+        assert vl.graphql_batches(urls, fetcher) == [
+            (1, [urls[1], urls[3], urls[2]]),
+            (4, [urls[4]]),
+        ]
+
+    def test_graphql_backend_without_token_uses_rest(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.csv"
+        path.write_text(
+            "ID,Display Name,Primary Link,Active,Last Checked,Last Modified,License\n"
+            "r-1,Alpha,https://github.com/octo/alpha,TRUE,,,\n",
+            encoding="utf-8",
+        )
+        with (
+            patch.object(vl, "GITHUB_TOKEN", ""),
+            patch.object(vl, "OUTPUT_FILE", str(path)),
+            patch.object(vl, "load_overrides", return_value={}),
+            patch.object(vl, "validate_url", return_value=(True, 200, "MIT", None)) as rest,
+        ):
+            results = vl.validate_links(str(path), backend="graphql")
+
+        assert rest.call_count == 1
+        assert results["broken"] == 0
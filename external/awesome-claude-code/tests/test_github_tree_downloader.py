@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Unit tests for github_tree_downloader.py module.
+
+Tests cover:
+- Resolving files and subtrees from one recursive git-trees call
+- Chunked, SHA-verified blob downloads
+- Skipping unchanged blobs via the manifest and resuming interrupted runs
+- Byte accounting for transferred vs. skipped files
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import github_tree_downloader as tree_downloader  # noqa
+from scripts.github_tree_downloader import (  # noqa
+    MANIFEST_NAME,
+    DownloadManifest,
+    GitHubTreeDownloader,
+    git_blob_sha,
+)
+
+FILES = {
+    "README.md": b"# Repo\n",
+    ".claude/commands/commit.md": b"Commit helper\n" * 10,
+    ".claude/commands/nested/review.md": b"Review helper\n",
+    ".claude/settings.json": b"{}",
+}
+
+
+def blob_sha(content: bytes) -> str:
+    return hashlib.sha1(f"blob {len(content)}\0".encode() + content).hexdigest()
+
+
+def json_response(status_code: int, payload: Any) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+    response._content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+class FakeRawResponse:
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+    def __enter__(self) -> "FakeRawResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self.content), 4):
+            yield self.content[i : i + 4]
+
+
+class FakeGitHub:
+    """Serves a git tree and raw blobs for one repository."""
+
+    def __init__(self, files: dict[str, bytes]):
+        self.files = dict(files)
+        self.tree_calls: list[str] = []
+        self.raw_calls: list[str] = []
+        self.corrupt: set[str] = set()
+        self.truncated = False
+        self._lock = threading.Lock()
+
+    def api_get(self, url: str, headers: dict[str, str]) -> requests.Response:
+        self.tree_calls.append(url)
+        tree = [
+            {"path": path, "type": "blob", "sha": blob_sha(c), "size": len(c)}
+            for path, c in self.files.items()
+        ]
+        tree.append({"path": ".claude", "type": "tree", "sha": "0" * 40})
+        return json_response(200, {"tree": tree, "truncated": self.truncated})
+
+    def raw_get(self, url: str, **kwargs: Any) -> FakeRawResponse:
+        path = url.split("/main/", 1)[1]
+        with self._lock:
+            self.raw_calls.append(path)
+        content = self.files.get(path)
+        if content is None:
+            return FakeRawResponse(404, b"")
+        if path in self.corrupt:
+            content = content[::-1]
+        return FakeRawResponse(200, content)
+
+
+def dir_info(path: str = ".claude") -> dict[str, str]:
+    return {"type": "dir", "owner": "octo", "repo": "alpha", "branch": "main", "path": path}
+
+
+@pytest.fixture
+def github() -> FakeGitHub:
+    return FakeGitHub(FILES)
+
+
+def make_downloader(github: FakeGitHub, root: Path) -> GitHubTreeDownloader:
+    downloader = GitHubTreeDownloader(
+        github.api_get, {"User-Agent": "test"}, DownloadManifest(str(root)), concurrency=4
+    )
+    downloader.session.get = github.raw_get  # type: ignore[method-assign]
+    return downloader
+
+
+class TestResolve:
+    def test_subtree_is_resolved_recursively(self, github: FakeGitHub, tmp_path: Path) -> None:
+        entries = make_downloader(github, tmp_path).resolve(dir_info())
+
+        assert entries is not None
+        assert sorted(e["relative_path"] for e in entries) == [
+            "commands/commit.md",
+            "commands/nested/review.md",
+            "settings.json",
+        ]
+        assert github.tree_calls == [
+            "https://api.github.com/repos/octo/alpha/git/trees/main?recursive=1"
+        ]
+
+    def test_single_file(self, github: FakeGitHub, tmp_path: Path) -> None:
+        info = {**dir_info("README.md"), "type": "file"}
+
+        entries = make_downloader(github, tmp_path).resolve(info)
+
+        assert entries == [
+            {
+                "path": "README.md",
+                "relative_path": "README.md",
+                "sha": blob_sha(FILES["README.md"]),
+                "size": len(FILES["README.md"]),
+            }
+        ]
+
+    def test_truncated_or_missing_tree_falls_back(self, github: FakeGitHub, tmp_path: Path) -> None:
+        downloader = make_downloader(github, tmp_path)
+        assert downloader.download(dir_info("does-not-exist"), str(tmp_path / "x")) is None
+
+        github.truncated = True
+        assert downloader.download(dir_info(), str(tmp_path / "x")) is None
+
+
+class TestDownload:
+    def test_downloads_and_verifies_subtree(self, github: FakeGitHub, tmp_path: Path) -> None:
+        downloader = make_downloader(github, tmp_path)
+        target = tmp_path / "tooling" / "alpha"
+
+        assert downloader.download(dir_info(), str(target)) is True
+
+        nested = target / "commands" / "nested" / "review.md"
+        assert nested.read_bytes() == FILES[".claude/commands/nested/review.md"]
+        assert git_blob_sha(str(nested)) == blob_sha(nested.read_bytes())
+        assert not list(target.rglob("*.part"))
+        stats = downloader.manifest.stats
+        assert stats["files_downloaded"] == 3
+        assert stats["bytes_downloaded"] == sum(
+            len(c) for p, c in FILES.items() if p.startswith(".claude/")
+        )
+
+    def test_second_run_skips_unchanged_blobs(self, github: FakeGitHub, tmp_path: Path) -> None:
+        target = tmp_path / "alpha"
+        make_downloader(github, tmp_path).download(dir_info(), str(target))
+        github.files[".claude/settings.json"] = b'{"changed": true}'
+        github.raw_calls.clear()
+
+        downloader = make_downloader(github, tmp_path)
+        assert downloader.download(dir_info(), str(target)) is True
+
+        assert github.raw_calls == [".claude/settings.json"]
+        stats = downloader.manifest.stats
+        assert stats["files_skipped"] == 2
+        assert stats["bytes_skipped"] == len(FILES[".claude/commands/commit.md"]) + len(
+            FILES[".claude/commands/nested/review.md"]
+        )
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+        assert manifest["files"]["alpha/settings.json"]["sha"] == blob_sha(b'{"changed": true}')
+        assert manifest["last_run"]["files_downloaded"] == 1
+
+    def test_resumes_from_files_left_by_interrupted_run(
+        self, github: FakeGitHub, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "alpha"
+        # A previous run wrote one file but died before saving the manifest
+        (target / "commands").mkdir(parents=True)
+        (target / "commands" / "commit.md").write_bytes(FILES[".claude/commands/commit.md"])
+
+        downloader = make_downloader(github, tmp_path)
+        downloader.download(dir_info(), str(target))
+
+        assert ".claude/commands/commit.md" not in github.raw_calls
+        assert downloader.manifest.stats["files_skipped"] == 1
+
+    def test_sha_mismatch_fails_without_leaving_partial_file(
+        self, github: FakeGitHub, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(tree_downloader.time, "sleep", lambda _: None)
+        github.corrupt.add(".claude/settings.json")
+        downloader = make_downloader(github, tmp_path)
+        target = tmp_path / "alpha"
+
+        assert downloader.download(dir_info(), str(target)) is False
+
+        assert not (target / "settings.json").exists()
+        assert not (target / "settings.json.part").exists()
+        assert downloader.manifest.stats["files_failed"] == 1
+        assert "alpha/settings.json" not in downloader.manifest.files
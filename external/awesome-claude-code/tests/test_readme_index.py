@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Parity tests and benchmark for the indexed README renderer in generate_readme.py.
+
+Tests cover:
+- Byte-identical TOC, weekly and category sections against the previous
+  per-category scanning renderer (kept below as a frozen reference)
+- A synthetic 50k-row benchmark comparing both renderers (opt-in: pytest -m benchmark)
+- Incremental regeneration reusing unchanged sections from the section cache
+"""
+
+import csv
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# Add the scripts directory to the path (generate_readme imports its siblings directly)
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+import generate_readme  # type: ignore  # noqa: E402
+from category_utils import category_manager  # type: ignore  # noqa: E402
+from generate_readme import (  # type: ignore  # noqa: E402
+    build_resource_index,
+    format_resource_entry,
+    generate_readme_from_templates,
+    generate_section_content,
+    generate_toc_from_categories,
+    generate_weekly_section,
+    parse_resource_date,
+)
+
+BENCHMARK_ROWS = 50_000
+FIELDNAMES = [
+    "ID",
+    "Display Name",
+    "Category",
+    "Sub-Category",
+    "Primary Link",
+    "Author Name",
+    "Author Link",
+    "Active",
+    "Date Added",
+    "Last Modified",
+    "Last Checked",
+    "License",
+    "Description",
+    "Removed From Origin",
+]
+
+
+# --- Reference renderer: the pre-index implementation, kept verbatim for parity checks ---
+
+
+def legacy_generate_toc(csv_data=None):
+    """Generate table of contents based on category definitions.
+
+    Args:
+        csv_data: List of resource dictionaries from CSV.
+                 If None, TOC will include all subcategories.
+    """
+    categories = category_manager.get_categories_for_readme()
+
+    toc_lines = []
+
+    # Track "General" occurrences across all categories that actually have them
+    general_counter = 0
+
+    # Make the entire TOC collapsible (open by default)
+    toc_lines.append("<details open>")
+    toc_lines.append("<summary>Table of Contents</summary>")
+    toc_lines.append("")
+
+    # Use unordered list for categories
+    for category in categories:
+        # Main section link
+        section_title = category["name"]
+        anchor = (
+            section_title.lower()
+            .replace(" ", "-")
+            .replace("&", "")
+            .replace("/", "")
+            .replace(".", "")
+        )
+
+        # All category headers now have back-to-top links, so they all need "-" suffix
+        anchor_suffix = "-"
+
+        # Check if this category has subcategories
+        subcategories = category.get("subcategories", [])
+
+        if subcategories:
+            # Make category collapsible if it has subcategories (open by default)
+            toc_lines.append("- <details open>")
+            toc_lines.append(
+                f'  <summary><a href="#{anchor}{anchor_suffix}">{section_title}</a></summary>'
+            )
+            toc_lines.append("")
+
+            # Add subcategories as nested list, but only if they have resources
+            for subcat in subcategories:
+                sub_title = subcat["name"]
+
+                # Check if this subcategory has any resources (if csv_data is provided)
+                # NOTE: Subcategories are only shown in ToC if they have resources.
+                # This keeps the ToC clean and avoids empty sections.
+                # New categories will appear empty in ToC until resources are added.
+                include_subcategory = True
+                if csv_data is not None:
+                    category_name = category.get("name", "")
+                    resources = [
+                        r
+                        for r in csv_data
+                        if r["Category"] == category_name
+                        and r.get("Sub-Category", "").strip() == sub_title
+                    ]
+                    include_subcategory = bool(resources)
+
+                # Only include subcategory if it has resources (or if csv_data not provided)
+                if include_subcategory:
+                    sub_anchor = (
+                        sub_title.lower().replace(" ", "-").replace("&", "").replace("/", "")
+                    )
+
+                    # Special handling for "General" subcategories
+                    if sub_title == "General":
+                        if general_counter == 0:
+                            # First occurrence: just #general-
+                            sub_anchor = "general-"
+                        else:
+                            # Subsequent occurrences: #general--1, #general--2, etc.
+                            sub_anchor = f"general--{general_counter}"
+                        general_counter += 1
+                    else:
+                        # Non-General subcategories also need "-" suffix due to back-to-top links
+                        sub_anchor = sub_anchor + "-"
+
+                    toc_lines.append(f"  - [{sub_title}](#{sub_anchor})")
+
+            toc_lines.append("")
+            toc_lines.append("  </details>")
+        else:
+            # Simple link if no subcategories
+            toc_lines.append(f"- [{section_title}](#{anchor}{anchor_suffix})")
+
+        toc_lines.append("")
+
+    # Close main TOC details
+    toc_lines.append("</details>")
+
+    return "\n".join(toc_lines).strip()
+
+
+def legacy_generate_weekly_section(csv_data):
+    """Generate the weekly resources section that appears above Contents."""
+    lines = []
+
+    lines.append("## This Week's Additions ✨ [🔝](#awesome-claude-code)")
+    lines.append("")
+    lines.append("> Resources added in the past 7 days")
+
+    # Get resources added in the past week
+    one_week_ago = datetime.now() - timedelta(days=7)
+    weekly_resources = []
+
+    for resource in csv_data:
+        date_added = resource.get("Date Added", "")
+        resource_date = parse_resource_date(date_added)
+
+        if resource_date and resource_date >= one_week_ago:
+            weekly_resources.append(resource)
+
+    if weekly_resources:
+        lines.append("")
+        # Sort by date added (newest first) using parsed dates
+        weekly_resources.sort(
+            key=lambda x: parse_resource_date(x.get("Date Added", "")) or datetime.min, reverse=True
+        )
+
+        for resource in weekly_resources:
+            lines.append(format_resource_entry(resource))
+            lines.append("")
+    else:
+        lines.append("")
+        lines.append("*No new resources added this week.*")
+        lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def legacy_generate_section_content(category, csv_data):
+    """Generate content for a category based on CSV data."""
+    lines = []
+
+    # Get category details
+    title = category.get("name", "")
+    icon = category.get("icon", "")
+    description = category.get("description", "").strip()
+    category_name = category.get("name", "")
+    subcategories = category.get("subcategories", [])
+
+    # Categories WITHOUT subcategories are collapsible
+    # Categories WITH subcategories have regular headers (subcategories are collapsible)
+    if not subcategories:
+        # No subcategories - make the entire category collapsible
+        lines.append("<details open>")
+
+        # Add section title as summary
+        if icon:
+            lines.append(
+                f'<summary><h2>{title} {icon} <a href="#awesome-claude-code">🔝</a></h2></summary>'
+            )
+        else:
+            lines.append(
+                f'<summary><h2>{title} <a href="#awesome-claude-code">🔝</a></h2></summary>'
+            )
+
+        # Add section description if present
+        if description:
+            lines.append("")
+            lines.append(description)
+
+        # Render all resources for this category
+        resources = [
+            r
+            for r in csv_data
+            if r["Category"] == category_name and not r.get("Sub-Category", "").strip()
+        ]
+        if resources:
+            lines.append("")
+            for resource in resources:
+                lines.append(format_resource_entry(resource))
+                lines.append("")
+
+        # Close the category disclosure element
+        lines.append("</details>")
+    else:
+        # Has subcategories - use regular header (not collapsible at category level)
+        if icon:
+            lines.append(f"## {title} {icon} [🔝](#awesome-claude-code)")
+        else:
+            lines.append(f"## {title} [🔝](#awesome-claude-code)")
+
+        # Add section description if present
+        if description:
+            lines.append("")
+            lines.append(description)
+
+        # First render main category resources without subcategory
+        main_resources = [
+            r
+            for r in csv_data
+            if r["Category"] == category_name and not r.get("Sub-Category", "").strip()
+        ]
+        if main_resources:
+            lines.append("")
+            for resource in main_resources:
+                lines.append(format_resource_entry(resource))
+                lines.append("")
+
+        # Then render each subsection as a collapsible element
+        for subcat in subcategories:
+            sub_title = subcat["name"]
+
+            resources = [
+                r
+                for r in csv_data
+                if r["Category"] == category_name and r.get("Sub-Category", "").strip() == sub_title
+            ]
+
+            if resources:
+                lines.append("")
+                # Start subcategory disclosure element (open by default)
+                lines.append("<details open>")
+                lines.append(
+                    f'<summary><h3>{sub_title} <a href="#awesome-claude-code">🔝</a></h3></summary>'
+                )
+                lines.append("")
+
+                for resource in resources:
+                    lines.append(format_resource_entry(resource))
+                    lines.append("")
+
+                # Close subcategory disclosure element
+                lines.append("</details>")
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+# --- Synthetic data ---
+
+
+def make_table(rows: int, seed: int = 0) -> list[dict[str, str]]:
+    """Build a synthetic resource table spread over every category and sub-category."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    placements = []
+    for category in category_manager.get_categories_for_readme():
+        placements.append((category["name"], ""))
+        for subcat in category.get("subcategories", []):
+            placements.append((category["name"], subcat["name"]))
+    # Rows filed under unknown categories or sub-categories are never rendered
+    placements += [("Unknown Category", ""), (placements[0][0], "Not A Sub-Category")]
+
+    table = []
+    for i in range(rows):
+        category, subcategory = rng.choice(placements)
+        # Keep dates well clear of the one-week boundary; reuse some timestamps
+        # so equal dates exercise the stable newest-first ordering
+        days_ago = rng.choice([0, 1, 2, 3, 20, 400])
+        date_added = (now - timedelta(days=days_ago)).strftime("%Y-%m-%d:%H-00-00")
+        is_github = rng.random() < 0.6
+        table.append(
+            {
+                "ID": f"res-{i:06d}",
+                "Display Name": f"Resource {i}",
+                "Category": category,
+                # Padding is stripped when matching sub-categories
+                "Sub-Category": f" {subcategory}" if subcategory and i % 7 == 0 else subcategory,
+                "Primary Link": (
+                    f"https://github.com/owner{i % 97}/repo{i}"
+                    if is_github
+                    else f"https://example.com/tools/{i}"
+                ),
+                "Author Name": f"Author {i % 50}" if i % 5 else "",
+                "Author Link": f"https://github.com/owner{i % 97}" if i % 3 else "",
+                "Active": "TRUE",
+                "Date Added": rng.choice([date_added, date_added[:10], "", "not-a-date"]),
+                "License": rng.choice(["MIT", "Apache-2.0", "NOT_FOUND", ""]),
+                "Description": f"Synthetic resource number {i}." if i % 11 else "",
+                "Removed From Origin": "TRUE" if i % 53 == 0 else "",
+            }
+        )
+    return table
+
+
+def render_legacy(csv_data: list[dict[str, str]]) -> list[str]:
+    categories = category_manager.get_categories_for_readme()
+    return [legacy_generate_toc(csv_data), legacy_generate_weekly_section(csv_data)] + [
+        legacy_generate_section_content(category, csv_data) for category in categories
+    ]
+
+
+def render_indexed(csv_data: list[dict[str, str]]) -> list[str]:
+    categories = category_manager.get_categories_for_readme()
+    index = build_resource_index(csv_data)
+    return [
+        generate_toc_from_categories(csv_data, index),
+        generate_weekly_section(csv_data, index),
+    ] + [generate_section_content(category, csv_data, index) for category in categories]
+
+
+class TestIndexedRendererParity:
+    def test_index_groups_rows_in_csv_order(self) -> None:
+        rows = make_table(200, seed=1)
+
+        index = build_resource_index(rows)
+
+        for category, groups in index["categories"].items():
+            for subcategory, grouped in groups.items():
+                expected = [
+                    r
+                    for r in rows
+                    if r["Category"] == category
+                    and r.get("Sub-Category", "").strip() == subcategory
+                ]
+                assert grouped == expected
+        dates = [date for date, _ in index["by_date"]]
+        assert dates == sorted(dates, reverse=True)
+        assert len(dates) == sum(1 for r in rows if parse_resource_date(r["Date Added"]))
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_output_matches_reference(self, seed: int) -> None:
+        rows = make_table(2_000, seed=seed)
+
+        assert render_indexed(rows) == render_legacy(rows)
+
+    def test_csv_data_only_callers_unchanged(self) -> None:
+        rows = make_table(300, seed=3)
+        category = category_manager.get_categories_for_readme()[2]
+
+        assert generate_section_content(category, rows) == legacy_generate_section_content(
+            category, rows
+        )
+        assert generate_toc_from_categories(rows) == legacy_generate_toc(rows)
+        assert generate_toc_from_categories() == legacy_generate_toc()
+
+    @pytest.mark.benchmark
+    def test_benchmark_50k_rows(self, record_property: Any) -> None:
+        rows = make_table(BENCHMARK_ROWS)
+
+        start = time.perf_counter()
+        legacy = render_legacy(rows)
+        legacy_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        indexed = render_indexed(rows)
+        indexed_seconds = time.perf_counter() - start
+
+        assert "".join(indexed).encode("utf-8") == "".join(legacy).encode("utf-8")
+        record_property("reference_seconds", round(legacy_seconds, 3))
+        record_property("indexed_seconds", round(indexed_seconds, 3))
+
+
+# --- Incremental regeneration ---
+
+
+def write_table(path: Path, rows: list[dict[str, str]]) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def readme_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """A template directory, resource table and section cache under tmp_path."""
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "README.template.md").write_text(
+        "# Test\n\n{{ANNOUNCEMENTS}}\n{{WEEKLY_SECTION}}\n{{TABLE_OF_CONTENTS}}\n\n"
+        "{{BODY_SECTIONS}}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(generate_readme, "create_backup", lambda path: None)
+    rows = make_table(500, seed=4)
+    write_table(tmp_path / "table.csv", rows)
+    return {
+        "rows": rows,
+        "csv": str(tmp_path / "table.csv"),
+        "templates": str(template_dir),
+        "output": tmp_path / "README.md",
+        "cache": str(tmp_path / "cache" / "sections.json"),
+    }
+
+
+def build(env: dict[str, Any], incremental: bool = True) -> str:
+    generate_readme_from_templates(
+        env["csv"],
+        env["templates"],
+        str(env["output"]),
+        incremental=incremental,
+        cache_path=env["cache"],
+    )
+    return env["output"].read_text(encoding="utf-8")
+
+
+class TestIncrementalRegeneration:
+    def test_only_changed_sections_rerendered(
+        self, readme_env: dict[str, Any], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        sections = len(category_manager.get_categories_for_readme())
+        build(readme_env)
+        assert f"Re-rendered {sections} of {sections} sections" in capsys.readouterr().out
+
+        build(readme_env)
+        assert f"Re-rendered 0 of {sections} sections" in capsys.readouterr().out
+
+        rows = readme_env["rows"]
+        changed = next(r for r in rows if r["Category"] == "Tooling")
+        changed["Description"] = "Edited description."
+        write_table(Path(readme_env["csv"]), rows)
+
+        incremental = build(readme_env)
+        assert f"Re-rendered 1 of {sections} sections" in capsys.readouterr().out
+        assert "Edited description." in incremental
+        assert incremental == build(readme_env, incremental=False)
+
+    def test_validation_bookkeeping_keeps_cache(
+        self, readme_env: dict[str, Any], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        build(readme_env)
+        capsys.readouterr()
+        rows = readme_env["rows"]
+        for row in rows:
+            row["Last Checked"] = "2099-01-01:00-00-00"
+            row["Last Modified"] = "2099-01-01:00-00-00"
+        write_table(Path(readme_env["csv"]), rows)
+
+        build(readme_env)
+
+        sections = len(category_manager.get_categories_for_readme())
+        assert f"Re-rendered 0 of {sections} sections" in capsys.readouterr().out
+
+    def test_renderer_change_invalidates_cache(
+        self,
+        readme_env: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        sections = len(category_manager.get_categories_for_readme())
+        build(readme_env)
+        monkeypatch.setattr(generate_readme, "get_renderer_digest", lambda: "new-renderer")
+
+        build(readme_env)
+
+        assert f"Re-rendered {sections} of {sections} sections" in capsys.readouterr().out
+
+    def test_corrupt_cache_renders_everything(
+        self, readme_env: dict[str, Any], capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        expected = build(readme_env, incremental=False)
+        cache = Path(readme_env["cache"])
+        cache.parent.mkdir()
+        cache.write_text("{not json", encoding="utf-8")
+
+        assert build(readme_env) == expected
+        assert "could not read section cache" in capsys.readouterr().out
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Unit tests for resource_store.py module.
+
+Tests cover:
+- ID lookups and row parity with csv.DictReader
+- Batched patches that leave untouched records byte-for-byte intact
+- Appends and stable reorders
+- Atomic temp-file-and-rename writes
+- The SQLite sidecar: lookups without parsing the CSV, incremental updates
+  and rebuilds after hand edits
+"""
+
+import csv
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import resource_store  # noqa
+from scripts.resource_store import ResourceStore, open_resource_store  # noqa
+
+# Quoting the csv module would not produce itself, to prove records are copied verbatim
+TABLE = (
+    "ID,Display Name,Category,Active,Description\r\n"
+    'res-1,"Alpha",Tooling,TRUE,"Plain, with comma"\r\n'
+    'res-2,Beta,Hooks,TRUE,"Line one\r\nline two"\r\n'
+    "res-3,Gamma,Tooling,FALSE,\r\n"
+)
+
+
+def read_rows(path: Path) -> list[dict[str, str]]:
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture
+def table(tmp_path: Path) -> Path:
+    path = tmp_path / "table.csv"
+    path.write_bytes(TABLE.encode("utf-8"))
+    return path
+
+
+class TestReading:
+    def test_rows_match_dict_reader(self, table: Path) -> None:
+        store = ResourceStore(table)
+
+        assert store.rows() == read_rows(table)
+        assert store.fieldnames == ["ID", "Display Name", "Category", "Active", "Description"]
+        assert len(store) == 3
+
+    def test_get_by_id(self, table: Path) -> None:
+        store = ResourceStore(table)
+
+        assert store.get("res-2")["Description"] == "Line one\r\nline two"
+        assert store.get("missing") is None
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+        store = ResourceStore(path)
+
+        assert store.fieldnames is None
+        assert store.rows() == []
+        assert store.commit() == 0
+        assert path.read_text() == ""
+
+
+class TestWriting:
+    def test_patch_rewrites_only_that_record(self, table: Path) -> None:
+        store = ResourceStore(table)
+
+        assert store.patch("res-3", {"Active": "TRUE", "Description": "Now with text"})
+        assert not store.patch("missing", {"Active": "TRUE"})
+        assert store.commit() == 1
+
+        expected = TABLE.replace("Tooling,FALSE,", "Tooling,TRUE,Now with text")
+        assert table.read_bytes() == expected.encode("utf-8")
+
+    def test_batched_patches_and_index_stay_consistent(self, table: Path) -> None:
+        store = ResourceStore(table)
+        store.patch("res-1", {"Description": "Much longer description than before"})
+        store.patch("res-2", {"Active": "FALSE"})
+        store.commit()
+
+        # A second batch on the same store uses the shifted byte spans
+        store.patch("res-3", {"Display Name": "Gamma 2"})
+        store.commit()
+
+        rows = read_rows(table)
+        assert [row["Display Name"] for row in rows] == ["Alpha", "Beta", "Gamma 2"]
+        assert rows[0]["Description"] == "Much longer description than before"
+        assert rows[1]["Active"] == "FALSE"
+        assert ResourceStore(table).rows() == rows
+
+    def test_patch_rows_stages_only_changed_rows(self, table: Path) -> None:
+        store = ResourceStore(table)
+        rows = store.rows()
+        rows[1]["Active"] = "FALSE"
+
+        assert store.patch_rows(rows) == 1
+        store.commit()
+
+        assert read_rows(table) == rows
+        assert table.read_bytes().startswith(TABLE.split("res-2")[0].encode("utf-8"))
+
+    def test_unknown_fields_rejected(self, table: Path) -> None:
+        store = ResourceStore(table)
+
+        with pytest.raises(ValueError, match="Unknown fields"):
+            store.patch("res-1", {"Stars": "5"})
+
+    def test_append_and_reorder(self, table: Path) -> None:
+        store = ResourceStore(table)
+        store.append({"ID": "res-0", "Display Name": "Aardvark", "Active": "TRUE"})
+        store.commit()
+        assert store.get("res-0")["Display Name"] == "Aardvark"
+
+        store.reorder(lambda row: (row["Category"], row["Display Name"]))
+        store.commit()
+
+        rows = read_rows(table)
+        assert [row["ID"] for row in rows] == ["res-0", "res-2", "res-1", "res-3"]
+        assert rows[1]["Description"] == "Line one\r\nline two"
+        assert b'res-1,"Alpha",Tooling' in table.read_bytes()
+
+    def test_append_to_table_without_trailing_newline(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.csv"
+        path.write_text("ID,Display Name\r\nres-1,Alpha", encoding="utf-8")
+        store = ResourceStore(path)
+
+        store.append({"ID": "res-2", "Display Name": "Beta"})
+        store.commit()
+
+        assert [row["ID"] for row in read_rows(path)] == ["res-1", "res-2"]
+
+    def test_failed_write_leaves_table_intact(self, table: Path) -> None:
+        store = ResourceStore(table)
+        store.patch("res-1", {"Active": "FALSE"})
+
+        with (
+            patch.object(resource_store.os, "replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            store.commit()
+
+        assert table.read_bytes() == TABLE.encode("utf-8")
+        assert not Path(f"{table}.tmp").exists()
+
+    def test_concurrent_edit_detected(self, table: Path) -> None:
+        store = ResourceStore(table)
+        store.patch("res-1", {"Active": "FALSE"})
+        table.write_text(TABLE + "res-4,Delta,Hooks,TRUE,\r\n", encoding="utf-8")
+
+        with pytest.raises(RuntimeError, match="changed on disk"):
+            store.commit()
+
+    def test_commit_to_other_path(self, table: Path, tmp_path: Path) -> None:
+        output = tmp_path / "out.csv"
+        store = ResourceStore(table)
+        store.patch("res-2", {"Active": "FALSE"})
+
+        store.commit(output)
+
+        assert read_rows(output)[1]["Active"] == "FALSE"
+        assert table.read_bytes() == TABLE.encode("utf-8")
+
+
+class TestSidecar:
+    def test_fresh_sidecar_serves_lookups_without_parsing(
+        self, table: Path, tmp_path: Path
+    ) -> None:
+        sidecar = tmp_path / "cache" / "resources.sqlite"
+        ResourceStore(table, sidecar).rows()
+
+        store = ResourceStore(table, sidecar)
+        with patch.object(ResourceStore, "_scan", side_effect=AssertionError("CSV parsed")):
+            assert store.get("res-2")["Display Name"] == "Beta"
+            store.patch("res-1", {"Description": "A description long enough to shift spans"})
+            store.append({"ID": "res-4", "Display Name": "Delta"})
+            store.commit()
+
+            # Spans were shifted in the sidecar, so a new store can still patch in place
+            follow_up = ResourceStore(table, sidecar)
+            follow_up.patch("res-3", {"Active": "TRUE"})
+            follow_up.commit()
+            assert follow_up.get("res-4")["Display Name"] == "Delta"
+
+        rows = read_rows(table)
+        assert [row["Active"] for row in rows] == ["TRUE", "TRUE", "TRUE", ""]
+        assert rows[0]["Description"] == "A description long enough to shift spans"
+        assert ResourceStore(table, sidecar).rows() == rows
+
+    def test_sidecar_offsets_match_scan_after_patch_rows(self, table: Path, tmp_path: Path) -> None:
+        sidecar = tmp_path / "resources.sqlite"
+        store = ResourceStore(table, sidecar)
+        rows = store.rows()
+        rows[0]["Description"] = "Grown enough to move every later record"
+        rows[1]["Active"] = "F"
+        rows[2]["Description"] = "Last"
+        assert store.patch_rows(rows) == 3
+        store.commit()
+
+        # Lookup-only patches (no full load) shift offsets from the sidecar itself
+        follow_up = ResourceStore(table, sidecar)
+        follow_up.patch("res-1", {"Description": "Short"})
+        follow_up.patch("res-2", {"Description": "Longer than the two lines it replaces"})
+        follow_up.commit()
+
+        scanned = ResourceStore(table)
+        scanned.rows()
+        db = sqlite3.connect(sidecar)
+        offsets = db.execute(
+            "SELECT start_offset, end_offset FROM resources ORDER BY position"
+        ).fetchall()
+        db.close()
+        assert offsets == scanned._spans
+
+    def test_hand_edit_triggers_rebuild(self, table: Path, tmp_path: Path) -> None:
+        sidecar = tmp_path / "resources.sqlite"
+        ResourceStore(table, sidecar).rows()
+        table.write_text(TABLE.replace("Beta", "Beta (edited)"), encoding="utf-8")
+        os.utime(table, ns=(1, 1))
+
+        store = ResourceStore(table, sidecar)
+
+        assert store.get("res-2")["Display Name"] == "Beta (edited)"
+
+    def test_env_var_enables_sidecar(
+        self, table: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sidecar = tmp_path / "env.sqlite"
+        monkeypatch.setenv("AWESOME_CC_RESOURCE_SIDECAR", str(sidecar))
+
+        open_resource_store(table).rows()
+
+        assert sidecar.exists()
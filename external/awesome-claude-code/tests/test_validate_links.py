@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Unit tests for validate_links.py script.
+
+Tests cover:
+- Concurrent validation producing the same CSV and summary as the serial path
+- max_links and override handling in concurrent mode
+- Shared GitHub rate-limit budget
+"""
+
+import csv
+import sys
+import threading
+import time
+from collections.abc import Generator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import validate_links as vl  # noqa
+
+FIELDNAMES = [
+    "ID",
+    "Display Name",
+    "Category",
+    "Primary Link",
+    "Active",
+    "Last Modified",
+    "Last Checked",
+    "License",
+    "Description",
+]
+
+
+class FixedDatetime(datetime):
+    """datetime with a frozen now() so timestamps are comparable across runs."""
+
+    @classmethod
+    def now(cls, tz=None):  # type: ignore[override]
+        return cls(2025, 1, 1, 12, 0, 0)
+
+
+def fake_validate_url(url: str) -> tuple[bool, Any, str | None, str | None]:
+    """Deterministic stand-in for validate_url with a little jitter."""
+    time.sleep(0.001 * (hash(url) % 5))
+    if "broken" in url:
+        return False, 404, None, None
+    if "github.com" in url:
+        return True, 200, "MIT", "2024-06-01:10-00-00"
+    return True, 200, None, None
+
+
+def make_rows(count: int) -> list[dict[str, str]]:
+    rows = []
+    for i in range(count):
+        host = "github.com/owner" if i % 2 else "example.com"
+        suffix = "broken" if i % 7 == 3 else "ok"
+        rows.append(
+            {
+                "ID": f"res-{i:03d}",
+                "Display Name": f"Resource {i}",
+                "Category": "Tooling",
+                "Primary Link": f"https://{host}/{suffix}-{i}",
+                "Active": "TRUE" if i % 3 else "FALSE",
+                "Last Modified": "",
+                "Last Checked": "",
+                "License": "NOT_FOUND",
+                "Description": f"Description {i}",
+            }
+        )
+    return rows
+
+
+@pytest.fixture
+def csv_factory(tmp_path: Path) -> Generator[Any, None, None]:
+    """Write sample rows to a fresh CSV and return its path."""
+
+    def _make(name: str, rows: list[dict[str, str]]) -> Path:
+        path = tmp_path / name
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    yield _make
+
+
+def run_validation(csv_path: Path, overrides: dict | None = None, **kwargs: Any) -> dict:
+    with (
+        patch.object(vl, "validate_url", side_effect=fake_validate_url),
+        patch.object(vl, "load_overrides", return_value=overrides or {}),
+        patch.object(vl, "OUTPUT_FILE", str(csv_path)),
+        patch.object(vl, "datetime", FixedDatetime),
+    ):
+        return vl.validate_links(str(csv_path), **kwargs)
+
+
+class TestConcurrentValidation:
+    """Concurrent mode must be indistinguishable from the serial path."""
+
+    @pytest.mark.parametrize("max_links", [None, 10])
+    def test_concurrent_matches_serial(self, csv_factory: Any, max_links: int | None) -> None:
+        rows = make_rows(40)
+        overrides = {
+            "res-002": {"skip_validation": True},
+            "res-005": {"license": "Apache-2.0"},
+            "res-008": {"active": "FALSE", "last_checked": "2024-01-01:00-00-00"},
+        }
+        serial_csv = csv_factory("serial.csv", rows)
+        concurrent_csv = csv_factory("concurrent.csv", rows)
+
+        serial = run_validation(serial_csv, overrides, max_links=max_links)
+        concurrent = run_validation(concurrent_csv, overrides, max_links=max_links, concurrency=8)
+
+        assert serial_csv.read_text(encoding="utf-8") == concurrent_csv.read_text(encoding="utf-8")
+        assert serial == concurrent
+
+    def test_max_links_counts_only_validated_rows(self, csv_factory: Any) -> None:
+        rows = make_rows(10)
+        overrides = {"res-000": {"skip_validation": True}}
+        path = csv_factory("limited.csv", rows)
+
+        results = run_validation(path, overrides, max_links=3, concurrency=4)
+
+        assert results["processed"] == 3
+        with open(path, encoding="utf-8") as f:
+            checked = [row["ID"] for row in csv.DictReader(f) if row["Last Checked"]]
+        assert checked == ["res-001", "res-002", "res-003"]
+
+    def test_locked_license_not_overwritten(self, csv_factory: Any) -> None:
+        path = csv_factory("locked.csv", make_rows(6))
+
+        run_validation(path, {"res-001": {"license": "Apache-2.0"}}, concurrency=3)
+
+        with open(path, encoding="utf-8") as f:
+            licenses = {row["ID"]: row["License"] for row in csv.DictReader(f)}
+        assert licenses["res-001"] == "Apache-2.0"
+        assert licenses["res-005"] == "MIT"
+
+
+def rate_limit_response(remaining: int, reset: float) -> MagicMock:
+    response = MagicMock()
+    response.headers = {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset)}
+    return response
+
+
+class TestGitHubRateLimiter:
+    """The shared budget pauses every worker once when it is exhausted."""
+
+    def test_budget_decrements_per_request(self) -> None:
+        limiter = vl.GitHubRateLimiter()
+        limiter.update(rate_limit_response(5, time.time() + 60))
+
+        limiter.acquire()
+        limiter.acquire()
+
+        assert limiter.remaining == 3
+
+    def test_server_count_is_authoritative(self) -> None:
+        limiter = vl.GitHubRateLimiter()
+        reset = time.time() + 60
+        limiter.update(rate_limit_response(10, reset))
+        limiter.update(rate_limit_response(12, reset))
+
+        assert limiter.remaining == 12
+
+    def test_in_flight_requests_stay_reserved(self) -> None:
+        limiter = vl.GitHubRateLimiter()
+        reset = time.time() + 60
+        limiter.update(rate_limit_response(50, reset))
+        for _ in range(3):
+            limiter.acquire()
+
+        limiter.update(rate_limit_response(49, reset))
+
+        assert limiter.remaining == 47
+
+    def test_uncharged_304_stream_does_not_drain_budget(self) -> None:
+        limiter = vl.GitHubRateLimiter()
+        reset = time.time() + 3600
+        limiter.update(rate_limit_response(50, reset))
+
+        start = time.time()
+        for _ in range(200):
+            limiter.acquire()
+            limiter.update(rate_limit_response(50, reset))
+
+        assert limiter.remaining == 50
+        assert time.time() - start < 1
+
+    def test_failed_request_releases_its_slot(self) -> None:
+        limiter = vl.GitHubRateLimiter()
+        reset = time.time() + 60
+        limiter.update(rate_limit_response(50, reset))
+        limiter.acquire()
+        limiter.release()
+
+        limiter.update(rate_limit_response(49, reset))
+
+        assert limiter.remaining == 49
+
+    def test_new_window_replaces_budget(self) -> None:
+        limiter = vl.GitHubRateLimiter()
+        limiter.update(rate_limit_response(0, time.time() - 5))
+        limiter.update(rate_limit_response(5000, time.time() + 3600))
+
+        assert limiter.remaining == 5000
+
+    def test_exhausted_budget_pauses_all_workers_until_reset(self) -> None:
+        limiter = vl.GitHubRateLimiter()
+        # update() adds one second of slack past the reset timestamp
+        limiter.update(rate_limit_response(0, time.time() - 0.7))
+        finished: list[float] = []
+
+        def worker() -> None:
+            limiter.acquire()
+            finished.append(time.time())
+
+        start = time.time()
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(finished) == 4
+        assert all(done - start >= 0.2 for done in finished)
+
+    def test_expired_reset_does_not_block(self) -> None:
+        limiter = vl.GitHubRateLimiter()
+        limiter.update(rate_limit_response(0, time.time() - 10))
+
+        start = time.time()
+        limiter.acquire()
+
+        assert time.time() - start < 0.1
+        assert limiter.remaining is None
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Unit tests for validation_scheduler.py and scheduled validate_links runs.
+
+Tests cover:
+- Priority ordering by staleness, failures and change frequency
+- API and time budgets
+- Rolling coverage across consecutive runs via the state file
+- Override locks respected in scheduled mode
+"""
+
+import csv
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+# Add parent directory to path to import the script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import validate_links as vl  # noqa
+from scripts.validation_scheduler import (  # noqa
+    apply_api_budget,
+    estimate_api_calls,
+    load_schedule_state,
+    order_by_priority,
+    priority,
+    record_result,
+    save_schedule_state,
+)
+
+NOW = datetime(2025, 6, 1, 12, 0, 0)
+FIELDNAMES = ["ID", "Display Name", "Primary Link", "Active", "Last Modified", "Last Checked"]
+
+
+def stamp(days_ago: float) -> str:
+    return (NOW - timedelta(days=days_ago)).strftime("%Y-%m-%d:%H-%M-%S")
+
+
+def make_row(resource_id: str, checked_days_ago: float | None, **fields: str) -> dict[str, str]:
+    row = {
+        "ID": resource_id,
+        "Display Name": resource_id,
+        "Primary Link": f"https://example.com/{resource_id}",
+        "Active": "TRUE",
+        "Last Modified": "",
+        "Last Checked": stamp(checked_days_ago) if checked_days_ago is not None else "",
+    }
+    row.update(fields)
+    return row
+
+
+class TestPriority:
+    def test_never_checked_rows_come_first(self) -> None:
+        assert priority(make_row("a", None), None, NOW) > priority(make_row("b", 300), None, NOW)
+
+    def test_staler_rows_rank_higher(self) -> None:
+        assert priority(make_row("a", 10), None, NOW) > priority(make_row("b", 2), None, NOW)
+
+    def test_failures_boost_priority(self) -> None:
+        healthy = priority(make_row("a", 5), None, NOW)
+        failing = priority(make_row("b", 5), {"failures": 2}, NOW)
+        inactive = priority(make_row("c", 5, Active="FALSE"), None, NOW)
+
+        assert failing > inactive > healthy
+
+    def test_recently_modified_rows_boosted(self) -> None:
+        recent = priority(make_row("a", 5, **{"Last Modified": stamp(3)}), None, NOW)
+        dormant = priority(make_row("b", 5, **{"Last Modified": stamp(900)}), None, NOW)
+
+        assert recent == 2 * dormant
+
+    def test_recorded_attempt_counts_when_last_checked_locked(self) -> None:
+        row = make_row("a", 60)
+        assert priority(row, {"last_attempt": stamp(1)}, NOW) < priority(row, None, NOW)
+
+    def test_ties_keep_table_order(self) -> None:
+        pending = [(make_row(f"r{i}", 4), set(), f"https://example.com/{i}") for i in range(4)]
+
+        ordered = order_by_priority(pending, {}, NOW)
+
+        assert [item[0]["ID"] for item in ordered] == ["r0", "r1", "r2", "r3"]
+
+
+class TestBudgetsAndState:
+    def test_api_budget_counts_github_rows(self) -> None:
+        pending = [
+            (make_row("a", 1), set(), "https://github.com/o/a"),
+            (make_row("b", 1), set(), "https://example.com/b"),
+            (make_row("c", 1), set(), "https://github.com/o/c"),
+            (make_row("d", 1), set(), "https://github.com/o/d"),
+        ]
+
+        selected = apply_api_budget(pending, 7, vl.uses_github_api)
+
+        assert [item[0]["ID"] for item in selected] == ["a", "b", "c"]
+
+    def test_api_budget_charges_only_github_api_urls(self) -> None:
+        assert estimate_api_calls("https://github.com/o/r/blob/main/a.md", vl.uses_github_api) == 3
+        for url in (
+            "https://gist.github.com/o/abc123",
+            "https://raw.githubusercontent.com/o/r/main/a.md",
+            "https://github.com/o",
+            "https://github.com/o/r/issues/1",
+            "",
+        ):
+            assert estimate_api_calls(url, vl.uses_github_api) == 0, url
+
+    def test_api_budget_depends_on_backend(self) -> None:
+        pending = [(make_row(f"r{i}", 1), set(), f"https://github.com/o/r{i}") for i in range(5)]
+
+        assert len(apply_api_budget(pending, 4, vl.uses_github_api)) == 1
+        assert len(apply_api_budget(pending, 4, vl.uses_github_api, backend="graphql")) == 4
+
+    def test_state_round_trip_and_failure_streak(self, tmp_path: Path) -> None:
+        state: dict[str, Any] = {}
+        row = make_row("a", 1)
+        record_result(state, row, False, NOW)
+        record_result(state, row, False, NOW)
+        path = tmp_path / "state" / "schedule.json"
+
+        save_schedule_state(state, str(path))
+        loaded = load_schedule_state(str(path))
+
+        assert loaded == {"a": {"last_attempt": stamp(0), "failures": 2}}
+        record_result(loaded, row, True, NOW)
+        assert loaded["a"]["failures"] == 0
+
+    def test_corrupt_state_starts_fresh(self, tmp_path: Path) -> None:
+        path = tmp_path / "schedule.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert load_schedule_state(str(path)) == {}
+
+
+def write_table(path: Path, rows: list[dict[str, str]]) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_table(path: Path) -> list[dict[str, str]]:
+    with open(path, encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def scheduled_run(path: Path, state_file: Path, overrides: dict | None = None, **kwargs: Any):
+    validated: list[str] = []
+
+    def fake_validate_url(url: str):
+        validated.append(url.rsplit("/", 1)[-1])
+        return True, 200, None, None
+
+    with (
+        patch.object(vl, "validate_url", side_effect=fake_validate_url),
+        patch.object(vl, "load_overrides", return_value=overrides or {}),
+        patch.object(vl, "OUTPUT_FILE", str(path)),
+    ):
+        summary = vl.validate_links(
+            str(path), schedule=True, schedule_state_file=str(state_file), **kwargs
+        )
+    return summary, validated
+
+
+class TestScheduledValidation:
+    def test_consecutive_runs_cover_whole_table(self, tmp_path: Path) -> None:
+        path, state_file = tmp_path / "table.csv", tmp_path / "schedule.json"
+        rows = [make_row(f"r{i}", 10 + i) for i in range(6)]
+        write_table(path, rows)
+
+        seen = []
+        for _ in range(3):
+            summary, validated = scheduled_run(path, state_file, max_links=2)
+            assert summary["processed"] == 2
+            seen += validated
+
+        # Stalest first (r5 was checked longest ago), and no row repeats
+        assert seen == ["r5", "r4", "r3", "r2", "r1", "r0"]
+        assert summary["deferred"] == 4
+        # CSV row order is untouched
+        assert [row["ID"] for row in read_table(path)] == [f"r{i}" for i in range(6)]
+
+    def test_api_budget_limits_run(self, tmp_path: Path) -> None:
+        path, state_file = tmp_path / "table.csv", tmp_path / "schedule.json"
+        rows = [
+            make_row(f"r{i}", 10 + i, **{"Primary Link": f"https://github.com/o/r{i}"})
+            for i in range(5)
+        ]
+        write_table(path, rows)
+
+        summary, validated = scheduled_run(path, state_file, api_budget=6)
+
+        assert validated == ["r4", "r3"]
+        assert summary["deferred"] == 3
+
+    def test_time_budget_stops_starting_new_rows(self, tmp_path: Path) -> None:
+        path, state_file = tmp_path / "table.csv", tmp_path / "schedule.json"
+        write_table(path, [make_row(f"r{i}", 10 + i) for i in range(20)])
+
+        def slow_validate(url: str):
+            time.sleep(0.05)
+            return True, 200, None, None
+
+        with (
+            patch.object(vl, "validate_url", side_effect=slow_validate),
+            patch.object(vl, "load_overrides", return_value={}),
+            patch.object(vl, "OUTPUT_FILE", str(path)),
+        ):
+            summary = vl.validate_links(
+                str(path), time_budget=0.12, schedule_state_file=str(state_file), concurrency=2
+            )
+
+        assert 0 < summary["processed"] < 20
+        assert summary["deferred"] == 20 - summary["processed"]
+        checked = [row for row in read_table(path) if row["Last Checked"] > stamp(1)]
+        assert len(checked) == summary["processed"]
+
+    def test_override_locks_respected(self, tmp_path: Path) -> None:
+        path, state_file = tmp_path / "table.csv", tmp_path / "schedule.json"
+        write_table(path, [make_row("skip", 100), make_row("locked", 90), make_row("free", 1)])
+        overrides = {
+            "skip": {"skip_validation": True},
+            "locked": {"last_checked": "2020-01-01:00-00-00"},
+        }
+
+        _, first = scheduled_run(path, state_file, overrides, max_links=1)
+        _, second = scheduled_run(path, state_file, overrides, max_links=1)
+
+        assert first == ["locked"]
+        # The locked Last Checked never changes, so the recorded attempt moves it back
+        assert second == ["free"]
+        table = {row["ID"]: row for row in read_table(path)}
+        assert table["locked"]["Last Checked"] == "2020-01-01:00-00-00"
+        assert table["skip"]["Last Checked"] == stamp(100)
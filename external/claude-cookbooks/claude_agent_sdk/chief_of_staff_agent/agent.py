@@ -70,7 +70,7 @@ async def send_query(
     system_prompt = """You are the Chief of Staff for TechStart Inc, a 50-person startup.
 
         Apart from your tools and two subagents, you also have custom Python scripts in the scripts/ directory you can run with Bash:
-        - python scripts/financial_forecast.py: Advanced financial modeling
+        - python scripts/financial_forecast.py: Advanced financial modeling (--simulations N for Monte Carlo percentile bands)
         - python scripts/talent_scorer.py: Candidate scoring algorithm
         - python scripts/decision_matrix.py: Strategic decision framework
 
@@ -2,75 +2,227 @@
 """
 Financial Forecast Tool - Advanced financial modeling for strategic decisions
 Custom Python tool executed via Bash by the Chief of Staff agent
+
+All scenarios are projected together as (scenario x month) NumPy arrays. The
+default output is the classic base / optimistic / pessimistic forecast; pass
+--simulations N to sample N growth and burn paths (Monte Carlo) and report
+percentile bands instead.
 """
 
 import argparse
 import json
 
+import numpy as np
+
+CASH_IN_BANK = 10_000_000  # $10M in bank
+SCENARIO_MULTIPLIERS = {"base_case": 1.0, "optimistic": 1.5, "pessimistic": 0.5}
+PERCENTILES = (10, 50, 90)
+
+
+def project(current_arr, growth, burn, cash=CASH_IN_BANK):
+    """
+    Compound monthly growth rates into ARR and net burn paths.
+
+    Args:
+        current_arr: Starting ARR
+        growth: Monthly growth rates, shape (scenarios, months)
+        burn: Monthly gross burn, broadcastable to (scenarios, months)
+        cash: Cash in bank at the start of the forecast
+
+    Returns:
+        Dictionary of (scenarios, months) arrays: arr, monthly_revenue, net_burn, cash_balance
+    """
+    growth = np.atleast_2d(np.asarray(growth, dtype=float))
+    # Seeding the product with current_arr multiplies in the same order as a month-by-month loop
+    factors = np.concatenate(
+        [np.full((growth.shape[0], 1), float(current_arr)), 1 + growth], axis=1
+    )
+    arr = np.cumprod(factors, axis=1)[:, 1:]
+    monthly_revenue = arr / 12
+    net_burn = np.broadcast_to(burn, arr.shape) - monthly_revenue
+    return {
+        "arr": arr,
+        "monthly_revenue": monthly_revenue,
+        "net_burn": net_burn,
+        "cash_balance": cash - np.cumsum(net_burn, axis=1),
+    }
+
 
-def forecast_financials(current_arr, growth_rate, months, burn_rate):
+def months_to_profitability(net_burn):
+    """First month (1-based) each scenario has net_burn <= 0, or inf if never in the forecast"""
+    profitable = net_burn <= 0
+    if profitable.shape[1] == 0:
+        # argmax has nothing to search in a zero-month forecast
+        return np.full(profitable.shape[0], np.inf)
+    return np.where(profitable.any(axis=1), profitable.argmax(axis=1) + 1.0, np.inf)
+
+
+def cash_required(net_burn):
+    """Total net burn of each scenario until it first becomes profitable"""
+    if net_burn.shape[1] == 0:
+        return np.zeros(net_burn.shape[0])
+    burning = ~np.logical_or.accumulate(net_burn <= 0, axis=1)
+    return np.where(burning, net_burn, 0).sum(axis=1)
+
+
+def runway_months(net_burn, cash_balance, cash=CASH_IN_BANK):
+    """Months until each scenario runs out of cash (fractional), or inf if it never does"""
+    broke = cash_balance < 0
+    if broke.shape[1] == 0:
+        return np.full(broke.shape[0], np.inf)
+    month = broke.argmax(axis=1)
+    rows = np.arange(len(month))
+    cash_left = np.where(month > 0, cash_balance[rows, month - 1], cash)
+    runway = month + cash_left / net_burn[rows, month]
+    return np.where(broke.any(axis=1), runway, np.inf)
+
+
+def forecast_financials(
+    current_arr, growth_rate, months, burn_rate, burn_path=None, cash=CASH_IN_BANK
+):
     """Generate financial forecast with multiple scenarios"""
 
+    growth = np.outer(list(SCENARIO_MULTIPLIERS.values()), np.full(months, growth_rate))
+    burn = burn_rate if burn_path is None else np.asarray(burn_path, dtype=float)[:months]
+    paths = project(current_arr, growth, burn, cash)
+    base = list(SCENARIO_MULTIPLIERS).index("base_case")
+
     forecasts = {"base_case": [], "optimistic": [], "pessimistic": [], "metrics": {}}
 
     # Base case
-    arr = current_arr
-    for month in range(1, months + 1):
-        arr = arr * (1 + growth_rate)
-        monthly_revenue = arr / 12
-        net_burn = burn_rate - monthly_revenue
-        runway = -1 if net_burn <= 0 else (10_000_000 / net_burn)  # Assuming $10M in bank
-
+    base_arr = paths["arr"][base].tolist()
+    base_revenue = paths["monthly_revenue"][base].tolist()
+    base_net_burn = paths["net_burn"][base].tolist()
+    for month in range(months):
+        net_burn = base_net_burn[month]
+        runway = -1 if net_burn <= 0 else (cash / net_burn)
         forecasts["base_case"].append(
             {
-                "month": month,
-                "arr": round(arr),
-                "monthly_revenue": round(monthly_revenue),
+                "month": month + 1,
+                "arr": round(base_arr[month]),
+                "monthly_revenue": round(base_revenue[month]),
                 "net_burn": round(net_burn),
                 "runway_months": round(runway, 1) if runway > 0 else "infinite",
             }
         )
 
-    # Optimistic (1.5x growth)
-    arr = current_arr
-    for month in range(1, months + 1):
-        arr = arr * (1 + growth_rate * 1.5)
-        forecasts["optimistic"].append({"month": month, "arr": round(arr)})
+    # Optimistic (1.5x growth) and pessimistic (0.5x growth)
+    for index, scenario in enumerate(SCENARIO_MULTIPLIERS):
+        if scenario != "base_case":
+            forecasts[scenario] = [
+                {"month": month + 1, "arr": round(arr)}
+                for month, arr in enumerate(paths["arr"][index].tolist())
+            ]
 
-    # Pessimistic (0.5x growth)
-    arr = current_arr
-    for month in range(1, months + 1):
-        arr = arr * (1 + growth_rate * 0.5)
-        forecasts["pessimistic"].append({"month": month, "arr": round(arr)})
-
-    # Key metrics
+    # Key metrics, from the rounded net burn reported in the base case
+    reported_net_burn = np.array([[entry["net_burn"] for entry in forecasts["base_case"]]])
+    profitability = months_to_profitability(reported_net_burn)[0]
     forecasts["metrics"] = {
-        "months_to_profitability": calculate_profitability_date(forecasts["base_case"]),
-        "cash_required": calculate_cash_needed(forecasts["base_case"]),
-        "break_even_arr": burn_rate * 12,
+        "months_to_profitability": int(profitability) if np.isfinite(profitability) else -1,
+        "cash_required": round(float(cash_required(reported_net_burn)[0])),
+        # With a burn path (e.g. hiring), break-even is against the burn at the end of the forecast
+        "break_even_arr": (
+            burn_rate * 12 if burn_path is None or not months else round(float(burn[-1]) * 12)
+        ),
         "current_burn_multiple": round(burn_rate / (current_arr / 12), 2),
     }
 
     return forecasts
 
 
-def calculate_profitability_date(forecast):
-    """Find when company becomes profitable"""
-    for entry in forecast:
-        if entry["net_burn"] <= 0:
-            return entry["month"]
-    return -1  # Not profitable in forecast period
+def simulate_financials(
+    current_arr,
+    growth_rate,
+    months,
+    burn_rate,
+    simulations=10_000,
+    growth_volatility=0.05,
+    burn_volatility=0.02,
+    burn_path=None,
+    cash=CASH_IN_BANK,
+    seed=None,
+):
+    """
+    Monte Carlo forecast: sample growth and burn paths and summarise them as percentile bands.
 
+    Monthly growth is drawn from N(growth_rate, growth_volatility) and compounded into ARR.
+    Gross burn follows burn_path (e.g. from hiring_impact.hiring_burn_path) or a flat
+    burn_rate, drifting by N(0, burn_volatility) per month. The same seed reproduces
+    the same forecast.
+    """
+    rng = np.random.default_rng(seed)
+    # A monthly rate below -100% would make ARR negative
+    growth = np.maximum(rng.normal(growth_rate, growth_volatility, (simulations, months)), -0.99)
+    burn_drift = np.maximum(rng.normal(0, burn_volatility, (simulations, months)), -0.99)
+    planned_burn = (
+        np.full(months, float(burn_rate))
+        if burn_path is None
+        else np.asarray(burn_path, dtype=float)[:months]
+    )
+    burn = planned_burn * np.cumprod(1 + burn_drift, axis=1)
+    paths = project(current_arr, growth, burn, cash)
 
-def calculate_cash_needed(forecast):
-    """Calculate total cash needed until profitability"""
-    total_burn = 0
-    for entry in forecast:
-        if entry["net_burn"] > 0:
-            total_burn += entry["net_burn"]
-        else:
-            break
-    return round(total_burn)
+    arr_bands = np.percentile(paths["arr"], PERCENTILES, axis=0)
+    # "nearest" keeps month counts whole and never interpolates between inf values
+    runway_by_scenario = runway_months(paths["net_burn"], paths["cash_balance"], cash)
+    runway = np.percentile(runway_by_scenario, PERCENTILES, method="nearest")
+    profitability = months_to_profitability(paths["net_burn"])
+    profitability_bands = np.percentile(profitability, PERCENTILES, method="nearest")
+    cash_bands = np.percentile(cash_required(paths["net_burn"]), PERCENTILES)
+
+    return {
+        "simulations": simulations,
+        "seed": seed,
+        "percentiles": list(PERCENTILES),
+        "arr": [
+            {
+                "month": month + 1,
+                **{f"p{p}": round(float(arr_bands[i, month])) for i, p in enumerate(PERCENTILES)},
+            }
+            for month in range(months)
+        ],
+        "runway_months": {
+            f"p{p}": round(float(value), 1) if np.isfinite(value) else "infinite"
+            for p, value in zip(PERCENTILES, runway, strict=True)
+        },
+        "months_to_profitability": {
+            f"p{p}": int(value) if np.isfinite(value) else -1
+            for p, value in zip(PERCENTILES, profitability_bands, strict=True)
+        },
+        "cash_required": {
+            f"p{p}": round(float(value)) for p, value in zip(PERCENTILES, cash_bands, strict=True)
+        },
+        "probability_profitable": round(float(np.isfinite(profitability).mean()), 3),
+        # Any month below zero counts, even if the scenario later recovers
+        "probability_out_of_cash": round(float(np.isfinite(runway_by_scenario).mean()), 3),
+    }
+
+
+def print_simulation(simulation):
+    """Text output of a Monte Carlo forecast for human reading"""
+    labels = [f"p{p}" for p in simulation["percentiles"]]
+    print(f"MONTE CARLO ({simulation['simulations']:,} scenarios, seed {simulation['seed']}):")
+    print("-" * 30)
+    for i in [2, 5, 11]:  # Show months 3, 6, 12
+        if i < len(simulation["arr"]):
+            band = simulation["arr"][i]
+            values = " / ".join(f"${band[label]:,}" for label in labels)
+            print(f"Month {band['month']:2} ARR ({'/'.join(labels)}): {values}")
+
+    print()
+    print("KEY METRICS:")
+    print("-" * 30)
+    values = " / ".join(str(simulation["runway_months"][label]) for label in labels)
+    print(f"Runway (months): {values}")
+    values = " / ".join(
+        str(month) if month > 0 else "not in forecast"
+        for month in (simulation["months_to_profitability"][label] for label in labels)
+    )
+    print(f"Profitability (month): {values}")
+    values = " / ".join(f"${simulation['cash_required'][label]:,}" for label in labels)
+    print(f"Cash Needed: {values}")
+    print(f"Chance of profitability: {simulation['probability_profitable']:.0%}")
+    print(f"Chance of running out of cash: {simulation['probability_out_of_cash']:.0%}")
 
 
 def main():
@@ -80,10 +232,70 @@ def main():
     parser.add_argument("--months", type=int, default=12, help="Forecast period")
     parser.add_argument("--burn", type=float, default=500000, help="Monthly burn rate")
     parser.add_argument("--format", choices=["json", "text"], default="text", help="Output format")
+    parser.add_argument(
+        "--simulations",
+        type=int,
+        default=0,
+        help="Number of Monte Carlo scenarios (0 = base/optimistic/pessimistic only)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for simulations")
+    parser.add_argument(
+        "--growth-volatility", type=float, default=0.05, help="Std dev of monthly growth"
+    )
+    parser.add_argument(
+        "--burn-volatility", type=float, default=0.02, help="Std dev of monthly burn drift"
+    )
+    parser.add_argument("--cash", type=float, default=CASH_IN_BANK, help="Cash in bank")
+    parser.add_argument(
+        "--hires", type=int, default=0, help="Engineers to hire (adds their cost to the burn)"
+    )
+    parser.add_argument(
+        "--salary", type=float, default=200000, help="Annual salary per engineer hired"
+    )
+    parser.add_argument(
+        "--hiring-months", type=int, default=1, help="Months over which hires are phased in"
+    )
 
     args = parser.parse_args()
 
-    forecast = forecast_financials(args.arr, args.growth, args.months, args.burn)
+    burn_path = None
+    if args.hires:
+        from hiring_impact import hiring_burn_path
+
+        burn_path = hiring_burn_path(
+            args.hires, args.months, args.salary, args.burn, args.hiring_months
+        )
+
+    if args.simulations > 0:
+        simulation = simulate_financials(
+            args.arr,
+            args.growth,
+            args.months,
+            args.burn,
+            simulations=args.simulations,
+            growth_volatility=args.growth_volatility,
+            burn_volatility=args.burn_volatility,
+            burn_path=burn_path,
+            cash=args.cash,
+            seed=args.seed,
+        )
+        if args.format == "json":
+            print(json.dumps(simulation, indent=2))
+        else:
+            print("📊 FINANCIAL FORECAST")
+            print("=" * 50)
+            print(f"Current ARR: ${args.arr:,.0f}")
+            print(
+                f"Growth Rate: {args.growth * 100:.1f}% ± {args.growth_volatility * 100:.1f}% monthly"
+            )
+            print(f"Burn Rate: ${args.burn:,.0f}/month")
+            print()
+            print_simulation(simulation)
+        return
+
+    forecast = forecast_financials(
+        args.arr, args.growth, args.months, args.burn, burn_path, args.cash
+    )
 
     if args.format == "json":
         print(json.dumps(forecast, indent=2))
@@ -117,6 +329,8 @@ def main():
         print()
         print("SCENARIO ANALYSIS:")
         print("-" * 30)
+        if not forecast["base_case"]:
+            return
         last_base = forecast["base_case"][-1]["arr"]
         last_opt = forecast["optimistic"][-1]["arr"]
         last_pess = forecast["pessimistic"][-1]["arr"]
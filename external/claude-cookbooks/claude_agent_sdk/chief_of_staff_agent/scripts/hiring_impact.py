@@ -8,6 +8,11 @@ import json
 import sys
 
 
+def monthly_loaded_cost(salary_per_engineer=200000):
+    """Monthly cost of one engineer (salary + benefits + taxes = salary * 1.3)"""
+    return salary_per_engineer * 1.3 / 12
+
+
 def calculate_hiring_impact(num_engineers, salary_per_engineer=200000):
     """
     Calculate the financial impact of hiring engineers.
@@ -25,8 +30,7 @@ def calculate_hiring_impact(num_engineers, salary_per_engineer=200000):
     CASH_IN_BANK = 10000000  # $10M
 
     # Calculate loaded cost (salary + benefits + taxes = salary * 1.3)
-    annual_loaded_cost_per_engineer = salary_per_engineer * 1.3
-    monthly_cost_per_engineer = annual_loaded_cost_per_engineer / 12
+    monthly_cost_per_engineer = monthly_loaded_cost(salary_per_engineer)
 
     # Total monthly cost increase
     total_monthly_increase = monthly_cost_per_engineer * num_engineers
@@ -64,6 +68,30 @@ def calculate_hiring_impact(num_engineers, salary_per_engineer=200000):
     }
 
 
+def hiring_burn_path(
+    num_engineers, months, salary_per_engineer=200000, current_burn=500000, hiring_months=1
+):
+    """
+    Month-by-month burn while engineers are hired, for financial_forecast.py.
+
+    Args:
+        num_engineers: Number of engineers to hire
+        months: Length of the forecast
+        salary_per_engineer: Annual salary per engineer (default: $200K)
+        current_burn: Monthly burn before hiring (default: $500K)
+        hiring_months: Months over which hires are phased in evenly (default: all in month 1)
+
+    Returns:
+        List of monthly gross burn, one entry per forecast month
+    """
+    hiring_months = max(hiring_months, 1)
+    cost = monthly_loaded_cost(salary_per_engineer)
+    return [
+        current_burn + cost * round(num_engineers * min(month, hiring_months) / hiring_months)
+        for month in range(1, months + 1)
+    ]
+
+
 def main():
     # Parse command line arguments
     if len(sys.argv) < 2:
@@ -0,0 +1,196 @@
+"""
+Unit tests for the financial forecast and hiring impact scripts.
+
+Tests the vectorized projections against a month-by-month reference, the
+Monte Carlo simulation, hiring burn paths and zero-month forecasts.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from financial_forecast import (
+    CASH_IN_BANK,
+    SCENARIO_MULTIPLIERS,
+    cash_required,
+    forecast_financials,
+    months_to_profitability,
+    project,
+    runway_months,
+    simulate_financials,
+)
+from hiring_impact import hiring_burn_path, monthly_loaded_cost
+
+
+def reference_base_case(current_arr, growth_rate, months, burn_rate):
+    """The original month-by-month base case loop."""
+    arr = current_arr
+    entries = []
+    for month in range(1, months + 1):
+        arr = arr * (1 + growth_rate)
+        net_burn = burn_rate - arr / 12
+        entries.append({"month": month, "arr": round(arr), "net_burn": round(net_burn)})
+    return entries
+
+
+class TestProjection(unittest.TestCase):
+    """Tests for project() and the metrics derived from it."""
+
+    def test_project_matches_month_by_month_loop(self):
+        paths = project(2_400_000, np.full((1, 12), 0.15), 500_000)
+        expected = reference_base_case(2_400_000, 0.15, 12, 500_000)
+
+        self.assertEqual([round(v) for v in paths["arr"][0]], [e["arr"] for e in expected])
+        self.assertEqual(
+            [round(v) for v in paths["net_burn"][0]], [e["net_burn"] for e in expected]
+        )
+        np.testing.assert_allclose(
+            paths["cash_balance"][0], CASH_IN_BANK - np.cumsum(paths["net_burn"][0])
+        )
+
+    def test_metrics(self):
+        net_burn = np.array([[100.0, 50.0, -10.0, 20.0], [100.0, 100.0, 100.0, 100.0]])
+        cash_balance = 250.0 - np.cumsum(net_burn, axis=1)
+
+        np.testing.assert_array_equal(months_to_profitability(net_burn), [3, np.inf])
+        np.testing.assert_array_equal(cash_required(net_burn), [150.0, 400.0])
+        np.testing.assert_array_equal(
+            runway_months(net_burn, cash_balance, cash=250.0), [np.inf, 2.5]
+        )
+
+    def test_zero_month_forecast(self):
+        empty = np.zeros((3, 0))
+
+        np.testing.assert_array_equal(months_to_profitability(empty), [np.inf] * 3)
+        np.testing.assert_array_equal(cash_required(empty), [0.0] * 3)
+        np.testing.assert_array_equal(runway_months(empty, empty), [np.inf] * 3)
+
+        forecast = forecast_financials(2_400_000, 0.15, 0, 500_000)
+        self.assertEqual(forecast["base_case"], [])
+        self.assertEqual(forecast["metrics"]["months_to_profitability"], -1)
+        self.assertEqual(forecast["metrics"]["cash_required"], 0)
+        self.assertEqual(simulate_financials(2_400_000, 0.15, 0, 500_000, 10, seed=1)["arr"], [])
+
+
+class TestSimulation(unittest.TestCase):
+    """Tests for the Monte Carlo forecast."""
+
+    def test_fixed_seed_is_reproducible(self):
+        first = simulate_financials(2_400_000, 0.15, 12, 500_000, simulations=500, seed=7)
+        second = simulate_financials(2_400_000, 0.15, 12, 500_000, simulations=500, seed=7)
+        other = simulate_financials(2_400_000, 0.15, 12, 500_000, simulations=500, seed=8)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first["arr"], other["arr"])
+
+    def test_zero_variance_reproduces_scenarios(self):
+        forecast = forecast_financials(2_400_000, 0.15, 12, 500_000)
+
+        for scenario, multiplier in SCENARIO_MULTIPLIERS.items():
+            simulation = simulate_financials(
+                2_400_000,
+                0.15 * multiplier,
+                12,
+                500_000,
+                simulations=20,
+                growth_volatility=0,
+                burn_volatility=0,
+                seed=0,
+            )
+            for band, entry in zip(simulation["arr"], forecast[scenario], strict=True):
+                self.assertEqual((band["p10"], band["p50"], band["p90"]), (entry["arr"],) * 3)
+
+        simulation = simulate_financials(
+            2_400_000, 0.15, 12, 500_000, simulations=20, growth_volatility=0, burn_volatility=0
+        )
+        metrics = forecast["metrics"]
+        self.assertEqual(
+            simulation["months_to_profitability"]["p50"], metrics["months_to_profitability"]
+        )
+        self.assertAlmostEqual(simulation["cash_required"]["p50"], metrics["cash_required"], -1)
+
+    def test_cash_dip_that_recovers_counts_as_out_of_cash(self):
+        paths = project(2_000_000, np.full((1, 24), 0.15), 600_000, 1_000_000)
+        self.assertLess(paths["cash_balance"][0].min(), 0)
+        self.assertGreater(paths["cash_balance"][0, -1], 0)
+
+        simulation = simulate_financials(
+            2_000_000,
+            0.15,
+            24,
+            600_000,
+            simulations=20,
+            growth_volatility=0,
+            burn_volatility=0,
+            cash=1_000_000,
+            seed=0,
+        )
+
+        self.assertEqual(simulation["runway_months"]["p50"], 2.6)
+        self.assertEqual(simulation["probability_out_of_cash"], 1.0)
+
+
+class TestHiringBurn(unittest.TestCase):
+    """Tests for hiring burn paths and their use in the forecast."""
+
+    def test_hires_phased_in_over_hiring_months(self):
+        cost = monthly_loaded_cost(200_000)
+
+        path = hiring_burn_path(4, 6, 200_000, 500_000, hiring_months=2)
+
+        expected = [500_000 + cost * n for n in (2, 4, 4, 4, 4, 4)]
+        np.testing.assert_allclose(path, expected)
+        np.testing.assert_allclose(hiring_burn_path(4, 3), [500_000 + 4 * cost] * 3)
+
+    def test_forecast_applies_burn_path(self):
+        path = hiring_burn_path(6, 12, 200_000, 500_000, hiring_months=3)
+        plain = forecast_financials(2_400_000, 0.15, 12, 500_000)
+        hiring = forecast_financials(2_400_000, 0.15, 12, 500_000, burn_path=path)
+
+        extra = [
+            h["net_burn"] - p["net_burn"]
+            for h, p in zip(hiring["base_case"], plain["base_case"], strict=True)
+        ]
+        np.testing.assert_allclose(extra, np.array(path) - 500_000, atol=1)
+        self.assertEqual(hiring["metrics"]["break_even_arr"], round(path[-1] * 12))
+        self.assertEqual(plain["metrics"]["break_even_arr"], 500_000 * 12)
+
+    def test_cli_hiring_months(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPTS_DIR / "financial_forecast.py"),
+                "--hires",
+                "3",
+                "--hiring-months",
+                "3",
+                "--months",
+                "4",
+                "--format",
+                "json",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=SCRIPTS_DIR,
+        )
+        forecast = json.loads(result.stdout)
+        plain = forecast_financials(2_400_000, 0.15, 4, 500_000)
+
+        extra = [
+            h["net_burn"] - p["net_burn"]
+            for h, p in zip(forecast["base_case"], plain["base_case"], strict=True)
+        ]
+        cost = monthly_loaded_cost(200_000)
+        np.testing.assert_allclose(extra, [cost, 2 * cost, 3 * cost, 3 * cost], atol=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,12 +3,36 @@ Production-ready memory tool handler for Claude's memory_20250818 tool.
 
 This implementation provides secure, client-side execution of memory operations
 with path validation, error handling, and comprehensive security measures.
+
+It also adds a client-side `search` command backed by an inverted index over the
+memory directory. The index is updated incrementally by every mutating command,
+persisted next to the memory directory as one small JSON file per indexed file (so
+a write only rewrites its own entry), and reconciled with file mtimes at startup.
+Repeated `view` calls are served from an mtime-keyed LRU content cache.
 """
 
+import bisect
+import hashlib
+import json
+import os
+import re
 import shutil
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+# Words are indexed lowercase; queries match indexed words by prefix
+TOKEN_PATTERN = re.compile(r"\w+")
+INDEX_FILENAME = ".memory_index"
+INDEX_VERSION = 2
+CONTENT_CACHE_SIZE = 64
+DEFAULT_MAX_SEARCH_RESULTS = 20
+SNIPPET_MAX_CHARS = 160
+
+
+def _tokenize(text: str) -> list[str]:
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
+
 
 class MemoryToolHandler:
     """
@@ -21,6 +45,8 @@ class MemoryToolHandler:
     Attributes:
         base_path: Root directory for memory storage
         memory_root: The /memories directory within base_path
+        index_path: Directory holding the persisted search index, one JSON file per
+            indexed file (kept outside /memories so Claude never sees it)
     """
 
     def __init__(self, base_path: str = "./memory_storage"):
@@ -33,6 +59,18 @@ class MemoryToolHandler:
         self.base_path = Path(base_path).resolve()
         self.memory_root = self.base_path / "memories"
         self.memory_root.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.base_path / INDEX_FILENAME
+
+        # path -> (mtime_ns, size, content), least recently used first
+        self._content_cache: OrderedDict[Path, tuple[int, int, str]] = OrderedDict()
+        # relative path -> {"mtime_ns", "size", "tokens": {token: [line numbers]}}
+        self._file_index: dict[str, dict[str, Any]] = {}
+        # token -> {relative path: [line numbers]}
+        self._postings: dict[str, dict[str, list[int]]] = {}
+        self._vocabulary: list[str] | None = None
+        # relative paths whose persisted index entry is out of date
+        self._dirty: set[str] = set()
+        self._load_index()
 
     def _validate_path(self, path: str) -> Path:
         """
@@ -90,6 +128,7 @@ class MemoryToolHandler:
             - insert: Insert text at a specific line
             - delete: Delete a file or directory
             - rename: Rename or move a file/directory
+            - search: Find lines containing every query word (client-side extension)
         """
         command = params.get("command")
 
@@ -106,10 +145,12 @@ class MemoryToolHandler:
                 return self._delete(params)
             elif command == "rename":
                 return self._rename(params)
+            elif command == "search":
+                return self._search(params)
             else:
                 return {
                     "error": f"Unknown command: '{command}'. "
-                    "Valid commands are: view, create, str_replace, insert, delete, rename"
+                    "Valid commands are: view, create, str_replace, insert, delete, rename, search"
                 }
         except ValueError as e:
             return {"error": str(e)}
@@ -147,7 +188,7 @@ class MemoryToolHandler:
         # Handle file reading
         elif full_path.is_file():
             try:
-                content = full_path.read_text(encoding="utf-8")
+                content = self._read_text(full_path)
                 lines = content.splitlines()
 
                 # Apply view range if specified
@@ -171,6 +212,67 @@ class MemoryToolHandler:
         else:
             return {"error": f"Path not found: {path}"}
 
+    def _search(self, params: dict[str, Any]) -> dict[str, str]:
+        """Find lines containing every word of the query (words match by prefix)."""
+        query = params.get("query")
+        path = params.get("path", "/memories")
+        max_results = params.get("max_results", DEFAULT_MAX_SEARCH_RESULTS)
+
+        if not query:
+            return {"error": "Missing required parameter: query"}
+
+        if isinstance(max_results, bool) or not isinstance(max_results, int) or max_results < 1:
+            return {"error": f"max_results must be a positive integer, got {max_results!r}"}
+
+        full_path = self._validate_path(path)
+        if not full_path.exists():
+            return {"error": f"Path not found: {path}"}
+
+        query_tokens = _tokenize(query)
+        if not query_tokens:
+            return {"error": f"Query must contain at least one word: {query!r}"}
+
+        # Intersect per-file line sets across query words
+        matches: dict[str, set[int]] | None = None
+        for token in dict.fromkeys(query_tokens):
+            token_matches: dict[str, set[int]] = {}
+            for indexed_token in self._expand_prefix(token):
+                for rel_path, line_numbers in self._postings[indexed_token].items():
+                    token_matches.setdefault(rel_path, set()).update(line_numbers)
+            if matches is None:
+                matches = token_matches
+            else:
+                matches = {
+                    rel_path: matches[rel_path] & lines
+                    for rel_path, lines in token_matches.items()
+                    if rel_path in matches and matches[rel_path] & lines
+                }
+            if not matches:
+                break
+
+        scope = self._relative_key(full_path)
+        results = []
+        for rel_path in sorted(matches or {}):
+            if scope and rel_path != scope and not rel_path.startswith(scope + "/"):
+                continue
+            try:
+                lines = self._read_text(self.memory_root / rel_path).splitlines()
+            except (OSError, UnicodeDecodeError):
+                continue
+            for line_number in sorted(matches[rel_path]):
+                if line_number <= len(lines):
+                    snippet = self._snippet(lines[line_number - 1], query_tokens[0])
+                    results.append(f"/memories/{rel_path}:{line_number}: {snippet}")
+
+        if not results:
+            return {"success": f"No matches for {query!r} in {path}"}
+
+        shown = results[:max_results]
+        header = f"Found {len(results)} matching lines for {query!r} in {path}"
+        if len(results) > len(shown):
+            header += f" (showing first {len(shown)})"
+        return {"success": header + ":\n" + "\n".join(shown)}
+
     def _create(self, params: dict[str, Any]) -> dict[str, str]:
         """Create or overwrite a file."""
         path = params.get("path")
@@ -193,7 +295,7 @@ class MemoryToolHandler:
             full_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write the file
-            full_path.write_text(file_text, encoding="utf-8")
+            self._write_text(full_path, file_text)
             return {"success": f"File created successfully at {path}"}
 
         except Exception as e:
@@ -214,7 +316,7 @@ class MemoryToolHandler:
             return {"error": f"File not found: {path}"}
 
         try:
-            content = full_path.read_text(encoding="utf-8")
+            content = self._read_text(full_path)
 
             # Check if old_str exists
             count = content.count(old_str)
@@ -230,7 +332,7 @@ class MemoryToolHandler:
 
             # Perform replacement
             new_content = content.replace(old_str, new_str, 1)
-            full_path.write_text(new_content, encoding="utf-8")
+            self._write_text(full_path, new_content)
 
             return {"success": f"File {path} has been edited successfully"}
 
@@ -252,7 +354,7 @@ class MemoryToolHandler:
             return {"error": f"File not found: {path}"}
 
         try:
-            lines = full_path.read_text(encoding="utf-8").splitlines()
+            lines = self._read_text(full_path).splitlines()
 
             # Validate insert_line
             if insert_line < 0 or insert_line > len(lines):
@@ -265,7 +367,7 @@ class MemoryToolHandler:
             lines.insert(insert_line, insert_text.rstrip("\n"))
 
             # Write back
-            full_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            self._write_text(full_path, "\n".join(lines) + "\n")
 
             return {"success": f"Text inserted at line {insert_line} in {path}"}
 
@@ -301,9 +403,11 @@ class MemoryToolHandler:
         try:
             if full_path.is_file():
                 full_path.unlink()
+                self._forget(full_path)
                 return {"success": f"File deleted: {path}"}
             elif full_path.is_dir():
                 shutil.rmtree(full_path)
+                self._forget(full_path)
                 return {"success": f"Directory deleted: {path}"}
 
         except Exception as e:
@@ -335,6 +439,7 @@ class MemoryToolHandler:
 
             # Perform rename/move
             old_full_path.rename(new_full_path)
+            self._move_index_entries(old_full_path, new_full_path)
 
             return {"success": f"Renamed {old_path} to {new_path}"}
 
@@ -357,6 +462,241 @@ class MemoryToolHandler:
             if self.memory_root.exists():
                 shutil.rmtree(self.memory_root)
             self.memory_root.mkdir(parents=True, exist_ok=True)
+            self._content_cache.clear()
+            self._forget(self.memory_root)
             return {"success": "All memory cleared successfully"}
         except Exception as e:
             return {"error": f"Cannot clear memory: {e}"}
+
+    # Content cache and search index helpers
+
+    def _read_text(self, full_path: Path) -> str:
+        """Read a UTF-8 file, serving unchanged files from the LRU content cache."""
+        stat = full_path.stat()
+        cached = self._content_cache.get(full_path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            self._content_cache.move_to_end(full_path)
+            return cached[2]
+
+        content = full_path.read_text(encoding="utf-8")
+        self._cache_content(full_path, content, stat)
+        return content
+
+    def _cache_content(self, full_path: Path, content: str, stat: os.stat_result) -> None:
+        self._content_cache[full_path] = (stat.st_mtime_ns, stat.st_size, content)
+        self._content_cache.move_to_end(full_path)
+        while len(self._content_cache) > CONTENT_CACHE_SIZE:
+            self._content_cache.popitem(last=False)
+
+    def _write_text(self, full_path: Path, content: str) -> None:
+        """Write a file and bring the content cache and search index up to date."""
+        full_path.write_text(content, encoding="utf-8")
+        stat = full_path.stat()
+        self._cache_content(full_path, content, stat)
+        self._index_content(self._relative_key(full_path), content, stat)
+        self._save_index()
+
+    def _relative_key(self, full_path: Path) -> str:
+        """Index key for a path: its POSIX path relative to /memories ("" for the root)."""
+        relative = full_path.relative_to(self.memory_root.resolve()).as_posix()
+        return "" if relative == "." else relative
+
+    @staticmethod
+    def _is_searchable(rel_path: str) -> bool:
+        # Hidden entries are not listed by view, so they are not searchable either
+        return not any(part.startswith(".") for part in rel_path.split("/"))
+
+    def _evict_cached(self, full_path: Path) -> None:
+        for cached_path in list(self._content_cache):
+            if cached_path == full_path or full_path in cached_path.parents:
+                del self._content_cache[cached_path]
+
+    def _unindex(self, rel_path: str) -> None:
+        entry = self._file_index.pop(rel_path, None)
+        if not entry:
+            return
+        self._dirty.add(rel_path)
+        for token in entry["tokens"]:
+            files = self._postings.get(token)
+            if files is None:
+                continue
+            files.pop(rel_path, None)
+            if not files:
+                del self._postings[token]
+                self._vocabulary = None
+
+    def _add_postings(self, rel_path: str, tokens: dict[str, list[int]]) -> None:
+        for token, line_numbers in tokens.items():
+            if token not in self._postings:
+                self._postings[token] = {}
+                self._vocabulary = None
+            self._postings[token][rel_path] = line_numbers
+
+    def _index_content(self, rel_path: str, content: str, stat: os.stat_result) -> None:
+        """(Re)index one file's content, replacing any previous postings for it."""
+        self._unindex(rel_path)
+        if not self._is_searchable(rel_path):
+            return
+        tokens: dict[str, list[int]] = {}
+        for line_number, line in enumerate(content.splitlines(), start=1):
+            for token in dict.fromkeys(_tokenize(line)):
+                tokens.setdefault(token, []).append(line_number)
+        self._file_index[rel_path] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "tokens": tokens,
+        }
+        self._dirty.add(rel_path)
+        self._add_postings(rel_path, tokens)
+
+    def _forget(self, full_path: Path) -> None:
+        """Drop a deleted file, or everything under a deleted directory, from the index."""
+        prefix = self._relative_key(full_path)
+        for rel_path in list(self._file_index):
+            if not prefix or rel_path == prefix or rel_path.startswith(prefix + "/"):
+                self._unindex(rel_path)
+        self._evict_cached(full_path)
+        self._save_index()
+
+    def _move_index_entries(self, old_full_path: Path, new_full_path: Path) -> None:
+        """Re-key index entries after a rename; file contents are unchanged."""
+        old_prefix = self._relative_key(old_full_path)
+        new_prefix = self._relative_key(new_full_path)
+        for rel_path in list(self._file_index):
+            if rel_path != old_prefix and not rel_path.startswith(old_prefix + "/"):
+                continue
+            entry = self._file_index[rel_path]
+            self._unindex(rel_path)
+            new_rel_path = new_prefix + rel_path[len(old_prefix) :]
+            if self._is_searchable(new_rel_path):
+                self._file_index[new_rel_path] = entry
+                self._dirty.add(new_rel_path)
+                self._add_postings(new_rel_path, entry["tokens"])
+        if new_full_path.is_file() and new_prefix not in self._file_index:
+            try:
+                content = new_full_path.read_text(encoding="utf-8")
+                self._index_content(new_prefix, content, new_full_path.stat())
+            except (OSError, UnicodeDecodeError):
+                pass
+        self._evict_cached(old_full_path)
+        # Picks up files moved out of hidden paths, which were never indexed
+        if new_full_path.is_dir():
+            self._sync_tree(new_full_path)
+        self._save_index()
+
+    def _expand_prefix(self, token: str) -> list[str]:
+        """Indexed words that start with token, via a sorted vocabulary."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect.bisect_left(self._vocabulary, token)
+        end = bisect.bisect_left(self._vocabulary, token + "\U0010ffff")
+        return self._vocabulary[start:end]
+
+    def _snippet(self, line: str, token: str) -> str:
+        """Trim a matching line to SNIPPET_MAX_CHARS around the first query word."""
+        line = line.strip()
+        if len(line) <= SNIPPET_MAX_CHARS:
+            return line
+        position = max(line.lower().find(token), 0)
+        start = max(0, min(position - SNIPPET_MAX_CHARS // 4, len(line) - SNIPPET_MAX_CHARS))
+        snippet = line[start : start + SNIPPET_MAX_CHARS]
+        prefix = "..." if start > 0 else ""
+        suffix = "..." if start + SNIPPET_MAX_CHARS < len(line) else ""
+        return prefix + snippet + suffix
+
+    def _load_index(self) -> None:
+        """Load the persisted index and re-index files whose mtime or size changed.
+
+        Unreadable or malformed entry files are discarded; the files they described
+        are then re-indexed from disk by the sync below.
+        """
+        self.index_path.mkdir(parents=True, exist_ok=True)
+        for entry_path in self.index_path.glob("*.json"):
+            try:
+                data = json.loads(entry_path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError, ValueError):
+                data = None
+            if not self._is_valid_entry(data) or entry_path != self._entry_path(data["path"]):
+                entry_path.unlink(missing_ok=True)
+                continue
+            self._file_index[data["path"]] = {
+                "mtime_ns": data["mtime_ns"],
+                "size": data["size"],
+                "tokens": data["tokens"],
+            }
+
+        for rel_path, entry in self._file_index.items():
+            self._add_postings(rel_path, entry["tokens"])
+        if self._sync_tree(self.memory_root):
+            self._save_index()
+
+    @staticmethod
+    def _is_valid_entry(data: Any) -> bool:
+        """Whether data has the shape written by _save_index for the current version."""
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return False
+        if not isinstance(data.get("path"), str) or not isinstance(data.get("tokens"), dict):
+            return False
+        if not all(
+            isinstance(data.get(key), int) and not isinstance(data.get(key), bool)
+            for key in ("mtime_ns", "size")
+        ):
+            return False
+        return all(
+            isinstance(lines, list)
+            and all(isinstance(line, int) and not isinstance(line, bool) for line in lines)
+            for lines in data["tokens"].values()
+        )
+
+    def _sync_tree(self, root: Path) -> bool:
+        """Re-index new or changed files under root and drop vanished ones. Returns True if changed."""
+        changed = False
+        on_disk: set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            for filename in filenames:
+                full_path = Path(dirpath) / filename
+                rel_path = self._relative_key(full_path)
+                if not self._is_searchable(rel_path):
+                    continue
+                on_disk.add(rel_path)
+                stat = full_path.stat()
+                entry = self._file_index.get(rel_path)
+                if entry and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                changed = True
+                try:
+                    content = full_path.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    self._unindex(rel_path)
+                    continue
+                self._index_content(rel_path, content, stat)
+
+        prefix = self._relative_key(root)
+        for rel_path in list(self._file_index):
+            in_root = not prefix or rel_path.startswith(prefix + "/")
+            if in_root and rel_path not in on_disk:
+                self._unindex(rel_path)
+                changed = True
+        return changed
+
+    def _entry_path(self, rel_path: str) -> Path:
+        digest = hashlib.sha1(rel_path.encode("utf-8")).hexdigest()
+        return self.index_path / f"{digest}.json"
+
+    def _save_index(self) -> None:
+        """Persist the index entries changed since the last save, each written atomically."""
+        self.index_path.mkdir(parents=True, exist_ok=True)
+        for rel_path in self._dirty:
+            entry_path = self._entry_path(rel_path)
+            entry = self._file_index.get(rel_path)
+            if entry is None:
+                entry_path.unlink(missing_ok=True)
+                continue
+            tmp_path = entry_path.with_name(entry_path.name + ".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": INDEX_VERSION, "path": rel_path, **entry}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, entry_path)
+        self._dirty.clear()
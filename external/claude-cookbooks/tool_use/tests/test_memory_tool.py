@@ -4,12 +4,15 @@ Unit tests for the memory tool handler.
 Tests security validation, command execution, and error handling.
 """
 
+import json
+import os
 import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from memory_tool import MemoryToolHandler
+from memory_tool import INDEX_FILENAME, MemoryToolHandler
 
 
 class TestMemoryToolHandler(unittest.TestCase):
@@ -384,5 +387,257 @@ class TestMemoryToolHandler(unittest.TestCase):
         self.assertEqual(len(list(memory_root.iterdir())), 0)
 
 
+class TestMemorySearch(unittest.TestCase):
+    """Test suite for the indexed search command and the view content cache."""
+
+    def setUp(self):
+        """Create temporary directory with a few memory files."""
+        self.test_dir = tempfile.mkdtemp()
+        self.handler = MemoryToolHandler(base_path=self.test_dir)
+        self.handler.execute(
+            command="create",
+            path="/memories/patterns/auth.md",
+            file_text="# Auth bugs\nToken refresh race condition\nAlways check token expiry",
+        )
+        self.handler.execute(
+            command="create",
+            path="/memories/notes.txt",
+            file_text="Remember the race in the cache layer\nUnrelated line",
+        )
+
+    def tearDown(self):
+        """Clean up temporary directory after each test."""
+        shutil.rmtree(self.test_dir)
+
+    def search(self, query, **params):
+        result = self.handler.execute(command="search", query=query, **params)
+        self.assertIn("success", result)
+        return result["success"]
+
+    def assertIndexConsistent(self):
+        """The incrementally maintained index must equal one rebuilt from scratch."""
+        shutil.rmtree(Path(self.test_dir) / INDEX_FILENAME)
+        rebuilt = MemoryToolHandler(base_path=self.test_dir)
+        self.assertEqual(self.handler._file_index, rebuilt._file_index)
+        self.assertEqual(self.handler._postings, rebuilt._postings)
+
+    # Search Tests
+
+    def test_search_returns_path_line_and_snippet(self):
+        """Test that matches report path, line number and the matching line."""
+        output = self.search("race")
+        self.assertIn("Found 2 matching lines", output)
+        self.assertIn("/memories/notes.txt:1: Remember the race in the cache layer", output)
+        self.assertIn("/memories/patterns/auth.md:2: Token refresh race condition", output)
+
+    def test_search_requires_every_word_on_the_line(self):
+        """Test that multi-word queries match lines containing all words."""
+        output = self.search("token race")
+        self.assertIn("Found 1 matching lines", output)
+        self.assertIn("auth.md:2:", output)
+
+    def test_search_matches_word_prefixes_case_insensitively(self):
+        """Test that query words match indexed words by prefix, ignoring case."""
+        output = self.search("EXPIR")
+        self.assertIn("/memories/patterns/auth.md:3: Always check token expiry", output)
+
+    def test_search_scoped_to_path(self):
+        """Test that the optional path restricts results to a subtree."""
+        output = self.search("race", path="/memories/patterns")
+        self.assertIn("auth.md", output)
+        self.assertNotIn("notes.txt", output)
+
+    def test_search_no_matches(self):
+        """Test searching for a word that does not exist."""
+        self.assertIn("No matches", self.search("nonexistent"))
+
+    def test_search_max_results(self):
+        """Test that results are truncated to max_results."""
+        output = self.search("race", max_results=1)
+        self.assertIn("showing first 1", output)
+        self.assertEqual(len(output.splitlines()), 2)  # header + one result
+
+    def test_search_rejects_invalid_max_results(self):
+        """Test that max_results must be a positive integer."""
+        for max_results in (0, -1, "5", 2.5, True, None):
+            result = self.handler.execute(command="search", query="race", max_results=max_results)
+            self.assertIn("error", result)
+            self.assertIn("max_results", result["error"])
+
+    def test_search_missing_query(self):
+        """Test error handling for a missing query."""
+        result = self.handler.execute(command="search")
+        self.assertIn("error", result)
+        self.assertIn("query", result["error"])
+
+    def test_search_rejects_traversal(self):
+        """Test that search paths are validated like every other command."""
+        result = self.handler.execute(command="search", query="x", path="/memories/../..")
+        self.assertIn("error", result)
+
+    # Incremental Index Tests
+
+    def test_index_after_create_overwrite(self):
+        """Test that overwriting a file replaces its postings."""
+        self.handler.execute(command="create", path="/memories/notes.txt", file_text="fresh")
+        self.assertNotIn("notes.txt", self.search("race"))
+        self.assertIn("notes.txt:1: fresh", self.search("fresh"))
+        self.assertIndexConsistent()
+
+    def test_index_after_str_replace(self):
+        """Test that replaced text is removed from and added to the index."""
+        self.handler.execute(
+            command="str_replace",
+            path="/memories/notes.txt",
+            old_str="cache layer",
+            new_str="session store",
+        )
+        self.assertIn("No matches", self.search("layer"))
+        self.assertIn("notes.txt:1:", self.search("session store"))
+        self.assertIndexConsistent()
+
+    def test_index_after_insert(self):
+        """Test that inserting a line shifts line numbers of later matches."""
+        self.handler.execute(
+            command="insert", path="/memories/notes.txt", insert_line=0, insert_text="Header"
+        )
+        self.assertIn("notes.txt:2: Remember the race", self.search("race"))
+        self.assertIn("notes.txt:1: Header", self.search("header"))
+        self.assertIndexConsistent()
+
+    def test_index_after_delete_file_and_directory(self):
+        """Test that deleted files and directories disappear from results."""
+        self.handler.execute(command="delete", path="/memories/notes.txt")
+        self.assertNotIn("notes.txt", self.search("race"))
+        self.assertIndexConsistent()
+
+        self.handler.execute(command="delete", path="/memories/patterns")
+        self.assertIn("No matches", self.search("race"))
+        self.assertIndexConsistent()
+
+    def test_index_after_rename_file_and_directory(self):
+        """Test that renamed files and directories are reported at their new paths."""
+        self.handler.execute(
+            command="rename", old_path="/memories/notes.txt", new_path="/memories/archive/n.txt"
+        )
+        self.handler.execute(
+            command="rename", old_path="/memories/patterns", new_path="/memories/learned"
+        )
+        output = self.search("race")
+        self.assertIn("/memories/archive/n.txt:1:", output)
+        self.assertIn("/memories/learned/auth.md:2:", output)
+        self.assertNotIn("/memories/patterns", output)
+        self.assertIndexConsistent()
+
+    def test_hidden_files_not_searchable_until_renamed(self):
+        """Test that hidden files, which view does not list, are not searchable."""
+        self.handler.execute(command="create", path="/memories/.draft.md", file_text="secret")
+        self.assertIn("No matches", self.search("secret"))
+
+        self.handler.execute(
+            command="rename", old_path="/memories/.draft.md", new_path="/memories/draft.md"
+        )
+        self.assertIn("draft.md:1: secret", self.search("secret"))
+        self.assertIndexConsistent()
+
+    def test_clear_all_memory_empties_index(self):
+        """Test that clearing memory also clears the index."""
+        self.handler.clear_all_memory()
+        self.assertIn("No matches", self.search("race"))
+        self.assertIndexConsistent()
+
+    # Persistence Tests
+
+    def test_index_persisted_outside_memories(self):
+        """Test that the index is stored next to, not inside, /memories."""
+        self.assertTrue((Path(self.test_dir) / INDEX_FILENAME).is_dir())
+        listing = self.handler.execute(command="view", path="/memories")["success"]
+        self.assertNotIn(INDEX_FILENAME, listing)
+
+    def test_startup_reuses_persisted_index_for_unchanged_files(self):
+        """Test that a new handler does not re-read files whose mtime is unchanged."""
+        with mock.patch.object(
+            Path, "read_text", autospec=True, side_effect=Path.read_text
+        ) as read:
+            handler = MemoryToolHandler(base_path=self.test_dir)
+        read_dirs = [call.args[0].parent.name for call in read.call_args_list]
+        self.assertEqual(read_dirs, [INDEX_FILENAME] * 2)  # one entry per indexed file
+        self.assertEqual(handler._postings, self.handler._postings)
+
+    def test_startup_reindexes_files_changed_outside_handler(self):
+        """Test that files edited, added or removed between sessions are reconciled."""
+        memory_root = Path(self.test_dir) / "memories"
+        (memory_root / "notes.txt").write_text("edited elsewhere", encoding="utf-8")
+        (memory_root / "added.md").write_text("added elsewhere", encoding="utf-8")
+        (memory_root / "patterns" / "auth.md").unlink()
+
+        handler = MemoryToolHandler(base_path=self.test_dir)
+
+        output = handler.execute(command="search", query="elsewhere")["success"]
+        self.assertIn("/memories/added.md:1:", output)
+        self.assertIn("/memories/notes.txt:1:", output)
+        self.assertIn("No matches", handler.execute(command="search", query="race")["success"])
+
+    def test_corrupt_index_rebuilt(self):
+        """Test that unreadable index entries are rebuilt from the memory directory."""
+        for entry_path in (Path(self.test_dir) / INDEX_FILENAME).iterdir():
+            entry_path.write_text("{not json", encoding="utf-8")
+        handler = MemoryToolHandler(base_path=self.test_dir)
+        self.assertIn("auth.md:2:", handler.execute(command="search", query="race")["success"])
+        self.assertIndexConsistent()
+
+    def test_malformed_index_entries_rebuilt(self):
+        """Test that entries with a missing or mistyped field are rebuilt, not trusted."""
+        entry_paths = sorted((Path(self.test_dir) / INDEX_FILENAME).iterdir())
+        truncated = json.loads(entry_paths[0].read_text(encoding="utf-8"))
+        del truncated["tokens"]
+        entry_paths[0].write_text(json.dumps(truncated), encoding="utf-8")
+        mistyped = json.loads(entry_paths[1].read_text(encoding="utf-8"))
+        mistyped["size"] = "large"
+        entry_paths[1].write_text(json.dumps(mistyped), encoding="utf-8")
+
+        handler = MemoryToolHandler(base_path=self.test_dir)
+
+        output = handler.execute(command="search", query="race")["success"]
+        self.assertIn("auth.md:2:", output)
+        self.assertIn("notes.txt:1:", output)
+        self.assertEqual(handler._postings, self.handler._postings)
+
+    def test_write_persists_only_changed_entry(self):
+        """Test that editing one file rewrites only that file's index entry."""
+        with mock.patch.object(
+            Path, "write_text", autospec=True, side_effect=Path.write_text
+        ) as write:
+            self.handler.execute(
+                command="str_replace", path="/memories/notes.txt", old_str="race", new_str="bug"
+            )
+        index_writes = [
+            call.args[0]
+            for call in write.call_args_list
+            if call.args[0].parent.name == INDEX_FILENAME
+        ]
+        self.assertEqual(len(index_writes), 1)
+        self.assertIndexConsistent()
+
+    # View Cache Tests
+
+    def test_repeated_view_served_from_cache(self):
+        """Test that viewing an unchanged file does not read it from disk again."""
+        self.handler.execute(command="view", path="/memories/notes.txt")
+        with mock.patch.object(Path, "read_text", side_effect=AssertionError("read from disk")):
+            result = self.handler.execute(command="view", path="/memories/notes.txt")
+        self.assertIn("   1: Remember the race", result["success"])
+
+    def test_view_cache_invalidated_by_mtime(self):
+        """Test that a file changed outside the handler is re-read."""
+        self.handler.execute(command="view", path="/memories/notes.txt")
+        full_path = Path(self.test_dir) / "memories" / "notes.txt"
+        full_path.write_text("changed outside", encoding="utf-8")
+        os.utime(full_path, ns=(1, 1))
+
+        result = self.handler.execute(command="view", path="/memories/notes.txt")
+        self.assertIn("   1: changed outside", result["success"])
+
+
 if __name__ == "__main__":
     unittest.main()